@@ -13,8 +13,21 @@ pyghelpers contains the following classes:
 - Timer - a simple timer
 - CountUpTimer - a timer that counts up from zero
 - CountDownTimer - a timer that counts down from a starting point
+- TimerMgr - checks many Timers and CountDownTimers at once, once per frame
+- TimerArray - a large number of count down timers kept in arrays, all checked with one call
+- FrameClock - the default clock used by timers, reads the time once per frame
+- SimulatedClock - a clock that moves forward a fixed amount each frame (for testing)
+- SimulationProcess - runs the simulation of a scene in a separate process, sharing its state through shared memory
+- FrameProfiler - measures the time of each phase of every frame run by the SceneMgr
+- FrameRateDisplay - a low cost display of the frame rate, with an optional graph of frame times
+- GlyphCache - draws text from pre-rendered characters (for numbers that change often)
+- InputRecorder - records all input to the SceneMgr into a compact file
+- InputPlayer - plays back a recording made by an InputRecorder, frame by frame
 - SceneMgr - allows for a Pygame program with multiple scenes
 - Scene - base class for a scene managed by the SceneMgr
+- ScriptedEventSource - supplies scripted events to the SceneMgr (for testing and benchmarking)
+- TextYesNoDialogScene, CustomYesNoDialogScene, TextAnswerDialogScene, CustomAnswerDialogScene -
+      dialogs that run inside the SceneMgr without stopping the game (see Scene.showDialog)
 
 pyghelpers also contains the following functions:
 
@@ -22,6 +35,11 @@ pyghelpers also contains the following functions:
 - customYesNoDialog - a dialog box with custom graphics (yes/no, or just OK)
 - textAnswerDialog - a text-based dialog box allowing the user to enter a string
 - customAnswerDialog - a dialog box with custom graphics that allows the user to enter a string
+- clearDialogCache - empties the cache of laid out text dialogs
+- getDialogCacheStats - returns the hit and miss counts of the cache of laid out text dialogs
+- setClock, getClock - set or get the clock used by all timers
+- setTimeScale, getTimeScale - make timers (all, or a group of them) run slower or faster
+- setHeadlessMode - sets up pygame to run without a visible window (for testing and benchmarking)
 
 
 While not required, manyhelpers allow the use of a callback (a function or method to be called when an action happens)
@@ -67,6 +85,54 @@ or implied, of Irv Kalb.
 
 History:
 
+10/26
+    SceneMgr: Added optional dirty rect mode (useDirtyRects), only changed areas of the window are updated
+    Scene: draw() can return a list of changed rects, added addDirtyRect()
+    SceneMgr: Added optional fixed rate updates (fixedUpdatesPerSecond), calls update(dt) and draw(alpha)
+    FrameProfiler: New class, times each phase of every SceneMgr frame, per scene (pass in as oFrameProfiler)
+    SceneMgr: run() has optional maxFrames, throttle, and oEventSource for headless testing and benchmarking
+    ScriptedEventSource: New class, supplies scripted events to SceneMgr.run()
+    setHeadlessMode: New function, runs pygame without a visible window or sound output
+    InputRecorder, InputPlayer: New classes, record all input to a SceneMgr and play it back frame by frame
+    Scene: Added eventTypes and coalesceMouseMotion class variables, and getEventsOfType()
+    FrameRateDisplay: New class, low cost frame rate display (can be passed to the SceneMgr)
+    GlyphCache: New class, draws text from pre-rendered characters
+    SceneMgr: A DisplayText frame rate display now shows a rounded value (only re-rendered when it changes)
+    SceneMgr: Scenes can be given as factories (class or function), built when first needed
+       Added maxLoadedScenes, scenes not used recently are removed and rebuilt when needed again
+    Scene: addScene now uses the sceneKey passed in (and accepts a factory)
+    SceneMgr, Scene: Added prefetchScene, builds and prepares a scene on a background thread
+    Scene: Added prefetch(), called on the background thread to load assets
+    Scene: Added pushScene and popScene for overlay scenes (pause menus, etc.), with overlayPushed() and overlayPopped()
+       The covered scene is shown as a saved image, its update and draw are not called
+    Added TextYesNoDialogScene, CustomYesNoDialogScene, TextAnswerDialogScene, and CustomAnswerDialogScene
+       Non-blocking dialogs, shown with Scene.showDialog(), report their result through a callBack
+    Dialog functions: Added waitForEvents, to sleep until there is an event and only redraw when a widget changes
+    Dialog functions: Save the area under the dialog and put it back when the dialog closes
+       Only redraw when a widget changes, and only update the dialog's rect of the window
+    textYesNoDialog, textAnswerDialog: Keep recently used dialogs (widgets and pre-rendered background) in a cache
+       Added clearDialogCache() and getDialogCacheStats()
+    Scene: Added startScript() to run async methods as scripts, which can await wait(), nextFrame(),
+       askYesNo(), and showDialog()
+    Added TimerMgr, keeps running timers in a heap and checks them once per frame (SceneMgr updates it)
+       Timer, CountDownTimer: added oTimerMgr
+       Timer: fixed resume (was using the wrong start time), getTime no longer advances while paused
+       CountDownTimer: fixed resume (now moves the end time)
+       Timer, CountUpTimer, CountDownTimer: a second pause no longer changes the time of the pause
+    Added FrameClock and SimulatedClock, and setClock() and getClock()
+       Timers, TimerMgr, fixed rate updates, and scripts now read the time from the clock (not time.time())
+       The SceneMgr ticks the clock once at the start of every frame
+    Added TimerArray, many count down timers kept in arrays (uses numpy if it is installed)
+    Added setTimeScale() and getTimeScale(), global and per time group speed of timers (slow motion, fast forward)
+       Timer, CountUpTimer, CountDownTimer, TimerArray: added timeGroup
+    CountUpTimer, CountDownTimer: getTimeInHHMMSS only formats the time again when the digits change
+       Added hasDisplayChanged() and getTimeSurface() (draws the time with a GlyphCache)
+    Timer: added repeat and coalesce, for timers that finish every timeInSeconds without drifting
+    Scene: added subscribe(), unsubscribe(), and the receiveIDs class variable, sendAll only sends to subscribers
+       sendAll: added queued, to send at the start of the next frame
+    Scene: added the cacheableRequestIDs class variable and invalidateResponse(), the SceneMgr saves those responses
+    Added SimulationProcess, runs a simulation in another process (uses another core), state is shared in double buffered memory
+    Scene: added addWidget(), removeWidget(), and drawWidgets(), which only draws the widgets that changed
 7/23 Version 1.2    (Major release, changed dot number)
     SceneMgr: Big change to startup:
        The main program should now create a dictionary of sceneKey: sceneObject pairs
@@ -108,13 +174,36 @@ Version 1.0     01/13/20
 __all__ = [
     'CountDownTimer',
     'CountUpTimer',
+    'CustomAnswerDialogScene',
+    'CustomYesNoDialogScene',
     'DIALOG_BACKGROUND_COLOR',
     'DIALOG_BLACK',
+    'DIALOG_SCENE_KEY',
+    'FrameClock',
+    'FrameProfiler',
+    'FrameRateDisplay',
+    'GlyphCache',
+    'InputPlayer',
+    'InputRecorder',
     'Scene',
     'SceneMgr',
+    'ScriptedEventSource',
+    'SimulatedClock',
+    'SimulationProcess',
+    'TextAnswerDialogScene',
+    'TextYesNoDialogScene',
     'Timer',
+    'TimerArray',
+    'TimerMgr',
+    'clearDialogCache',
     'customAnswerDialog',
     'customYesNoDialog',
+    'getClock',
+    'getDialogCacheStats',
+    'getTimeScale',
+    'setClock',
+    'setHeadlessMode',
+    'setTimeScale',
     'textAnswerDialog',
     'textYesNoDialog',
 ]
@@ -125,7 +214,22 @@ import pygwidgets
 import sys
 import time
 import os
+import array
+import collections
+import concurrent.futures
+import copy
+import heapq
+import multiprocessing
+import numbers
+import queue
+import random
+import struct
 from abc import ABC, abstractmethod
+from multiprocessing import shared_memory
+try:
+    import numpy  # optional, used by TimerArray if available
+except ImportError:
+    numpy = None
 
 
 def getVersion():
@@ -134,6 +238,161 @@ def getVersion():
     return version
 
 
+#
+# Clock classes
+#
+class FrameClock():
+    """
+    The default clock used by all pyghelpers timers (see setClock).
+
+    The SceneMgr calls tick() once at the start of every frame.  From then on, getTime() returns the time
+    saved at the start of the frame, so all timers see the same time during a frame, and reading the time is free.
+    Until the first tick, getTime() returns the current time.
+
+    The time comes from time.perf_counter(), so it never jumps when the system clock is changed.
+
+    """
+    def __init__(self):
+        self.frameTime = None  # None means not ticked yet
+
+    def tick(self):
+        """Saves the current time as the time of this frame (called by the SceneMgr)"""
+        self.frameTime = time.perf_counter()
+
+    def getTime(self):
+        """Returns the time of the current frame, in seconds (only useful for finding differences)"""
+        if self.frameTime is None:
+            return time.perf_counter()
+        return self.frameTime
+
+
+class SimulatedClock():
+    """
+    A clock that only moves forward when it is ticked (or advanced), for tests and headless benchmarks.
+
+    Every tick moves the time forward by a fixed step, no matter how long the frame actually took.
+    For example, this runs 60 seconds of timers as fast as the computer can go:
+
+        |    pyghelpers.setClock(pyghelpers.SimulatedClock(1 / 60))
+        |    oSceneMgr.run(maxFrames=60 * 60, throttle=False)
+
+    Optional keyword parameters:
+        | secondsPerTick - the amount of time added by each tick (defaults to 1/60 of a second)
+        | startTime - the starting time (defaults to 0.0)
+
+    """
+    def __init__(self, secondsPerTick=1 / 60, startTime=0.0):
+        self.secondsPerTick = secondsPerTick
+        self.frameTime = startTime
+
+    def tick(self):
+        """Moves the time forward by secondsPerTick (called by the SceneMgr once per frame)"""
+        self.frameTime = self.frameTime + self.secondsPerTick
+
+    def advance(self, seconds):
+        """Moves the time forward by any number of seconds"""
+        self.frameTime = self.frameTime + seconds
+
+    def getTime(self):
+        """Returns the simulated time, in seconds"""
+        return self.frameTime
+
+
+_oClock = FrameClock()
+
+# Time scaling (see setTimeScale).  The global scaled time is:
+#     anchorScaledTime + ((clock time - anchorClockTime) * scale)
+# and the time of a time group with its own scale is found the same way from the global scaled time.
+# Whenever a scale changes, the anchors are moved to "now", so the scaled time never jumps.
+_timeIsScaled = False  # fast path, True once setTimeScale has been called
+_globalTimeAnchorList = [0.0, 0.0, 1.0]  # anchorClockTime, anchorScaledTime, scale
+_timeGroupAnchorsDict = {}  # timeGroup: [anchorGlobalTime, anchorScaledTime, scale]
+
+def _getTime(timeGroup=None):
+    """Internal function, returns the (scaled) time used by timers in a time group"""
+    clockTime = _oClock.getTime()
+    if not _timeIsScaled:
+        return clockTime
+    anchorClockTime, anchorScaledTime, scale = _globalTimeAnchorList
+    globalTime = anchorScaledTime + ((clockTime - anchorClockTime) * scale)
+    if timeGroup is None:
+        return globalTime
+    groupAnchorList = _timeGroupAnchorsDict.get(timeGroup)
+    if groupAnchorList is None:  # group without its own scale
+        return globalTime
+    anchorGlobalTime, anchorScaledTime, scale = groupAnchorList
+    return anchorScaledTime + ((globalTime - anchorGlobalTime) * scale)
+
+def setClock(oClock):
+    """Sets the clock used by all timers, by TimerMgr, by the fixed rate updates of the SceneMgr, and by scripts
+
+    Timers that are running when the clock is changed will not have the correct times.
+
+    Parameter:
+        |    oClock - a FrameClock, a SimulatedClock, or any object with a getTime() and a tick() method
+
+    """
+    global _oClock
+    _oClock = oClock
+    # Start the scaled time over from the new clock's time, keeping the scales
+    newTime = oClock.getTime()
+    _globalTimeAnchorList[0] = newTime
+    _globalTimeAnchorList[1] = newTime
+    for groupAnchorList in _timeGroupAnchorsDict.values():
+        groupAnchorList[0] = newTime
+        groupAnchorList[1] = newTime
+
+def getClock():
+    """Returns the clock used by all timers (see setClock)"""
+    return _oClock
+
+def setTimeScale(scale, timeGroup=None):
+    """Makes timers run slower or faster than real time (for slow motion, or fast forward in tests)
+
+    The scale can be changed at any time, running timers continue smoothly from their current time.
+    The global scale affects all timers, the fixed rate updates of the SceneMgr, and waits in scripts.
+    Timers created with a timeGroup are also affected by that group's scale (the two scales are multiplied).
+
+        |    pyghelpers.setTimeScale(0.25)  # everything at quarter speed
+        |    pyghelpers.setTimeScale(2.0, 'enemies')  # timers with timeGroup='enemies' run at twice that speed
+
+    Parameter:
+        |    scale - the speed of time, 1.0 is normal, 0.5 is half speed, 0.0 stops time
+
+    Optional keyword parameter:
+        |    timeGroup - the time group to set the scale of (defaults to None, meaning the global scale)
+
+    Raises:
+        |    ValueError if the scale is negative
+
+    """
+    global _timeIsScaled
+    if scale < 0:
+        raise ValueError('Time scale must not be negative, got ' + str(scale))
+    _timeIsScaled = True
+    clockTime = _oClock.getTime()
+    globalTime = _getTime()
+    if timeGroup is None:
+        _globalTimeAnchorList[0] = clockTime
+        _globalTimeAnchorList[1] = globalTime
+        _globalTimeAnchorList[2] = scale
+    else:
+        _timeGroupAnchorsDict[timeGroup] = [globalTime, _getTime(timeGroup), scale]
+
+def getTimeScale(timeGroup=None):
+    """Returns the scale of time set by setTimeScale
+
+    Optional keyword parameter:
+        |    timeGroup - the time group (defaults to None, meaning the global scale)
+
+    """
+    if timeGroup is None:
+        return _globalTimeAnchorList[2]
+    groupAnchorList = _timeGroupAnchorsDict.get(timeGroup)
+    if groupAnchorList is None:
+        return 1.0
+    return groupAnchorList[2]
+
 
 #  Timer
 class Timer():
@@ -158,6 +417,15 @@ class Timer():
 
         Normally returns False, but returns True when the timer is finished
 
+    A repeating timer (repeat=True) keeps running, and finishes once every timeInSeconds.
+    Each period is timed from when the previous one should have ended (not from when it was noticed),
+    so the timer does not drift, even when frames are late.  For a repeating timer, update() returns the
+    number of periods that ended since the last call (0 most of the time), and the callback is called
+    once per period, or only once per call if coalesce is True.
+
+    If you have many timers, pass in a TimerMgr (see TimerMgr).  The TimerMgr checks all of its timers
+    once per frame, and calls the callback of each timer that finishes, so you do not need to call update().
+
     Parameters:
         | timeInSeconds - the duration of the timer, in seconds (integer or float)
 
@@ -165,17 +433,31 @@ class Timer():
         | nickname - an internal name to associate with this timer (defaults to None)
         | callback - a function or object.method to be called back when the timer is finished
         |            The nickname of the timer will be passed in if a callback is made (defaults to None)
+        | oTimerMgr - a TimerMgr object that checks this timer (defaults to None)
+        | timeGroup - a name for a group of timers whose speed can be set by setTimeScale (defaults to None)
+        | repeat - restart the timer automatically every time it finishes (defaults to False)
+        | coalesce - for a repeating timer, if several periods ended since the last check,
+        |            call the callback only once instead of once per period (defaults to False)
 
     """
 
-    def __init__(self, timeInSeconds, nickname=None, callBack=None):
+    def __init__(self, timeInSeconds, nickname=None, callBack=None, oTimerMgr=None, timeGroup=None,
+                 repeat=False, coalesce=False):
         self.timeInSeconds = timeInSeconds
         self.nickname = nickname
         self.callBack = callBack
+        self.oTimerMgr = oTimerMgr
+        self.timeGroup = timeGroup
+        self.repeat = repeat
+        self.coalesce = coalesce
+        self.nPeriodsDone = 0  # number of periods of a repeating timer that have ended since start
+        self.nPeriodsToReport = 0  # periods ended (found by the TimerMgr) but not yet returned by update
         self.savedSecondsElapsed = 0.0
         self.running = False
         self.paused = False
         self.pauseCounter = 0  # counts how many calls to pause without a resume
+        self.finished = False  # set by the TimerMgr, reported (once) by update
+        self.heapSequence = None  # identifies this timer's current entry in the TimerMgr's heap
 
     def start(self, newTimeInSeconds=None):
         """Start the timer running (starts at zero).
@@ -184,27 +466,57 @@ class Timer():
         Optional keyword parameter:
         | newTimeInSeconds - a new duration for the timer (integer or float, default None)
 
+        Raises:
+        | ValueError if the timer repeats and the duration is not greater than zero
+
         """
         if newTimeInSeconds is not None:
             self.timeInSeconds = newTimeInSeconds
+        if self.repeat and (self.timeInSeconds <= 0):
+            raise ValueError('A repeating Timer must have a duration greater than zero, got ' +
+                             str(self.timeInSeconds))
         self.running = True
-        self.startTime = time.time()
+        self.startTime = _getTime(self.timeGroup)
         self.paused = False
         self.timePaused = None
         self.pauseCounter = 0
+        self.finished = False
+        self.nPeriodsDone = 0
+        self.nPeriodsToReport = 0
+        if self.oTimerMgr is not None:
+            self.oTimerMgr._schedule(self, self.startTime + self.timeInSeconds)
 
     def update(self):
         """Call this in every frame to update the timer
 
+        (If the timer has a TimerMgr, the TimerMgr does the checking, and calls the callback.
+        Calling update is then optional, it only reports that the timer finished.)
+
         Returns:
            |   False - most of the time
            |   True - when the timer is finished
            |          (you can use this indication, or set up a callback)
+           |   For a repeating timer, the number of periods that ended since the last call
 
         """
-        if not self.running:
+        if self.oTimerMgr is not None:
+            if self.repeat:
+                nPeriods = self.nPeriodsToReport
+                self.nPeriodsToReport = 0  # only report them once
+                return nPeriods
+            if self.finished:
+                self.finished = False  # only report it once
+                return True
+            return False
+
+        if self.repeat:
+            if (not self.running) or self.paused:
+                return 0
+            return self._endPeriods()
+
+        if (not self.running) or self.paused:
             return False
-        self.savedSecondsElapsed = time.time() - self.startTime
+        self.savedSecondsElapsed = _getTime(self.timeGroup) - self.startTime
         if self.savedSecondsElapsed < self.timeInSeconds:
             return False  # running but hasn't reached limit
 
@@ -215,6 +527,46 @@ class Timer():
 
             return True  # True here means that the timer has ended
 
+    def _endPeriods(self, minPeriods=0):
+        """Internal method, counts the periods of a repeating timer that have ended, and makes the callbacks
+
+        Deadlines are always startTime + (n * timeInSeconds), so a late check does not move the next deadline.
+        (The TimerMgr passes minPeriods=1, because it already knows a deadline was reached,
+        even if rounding makes the division come out just short of it.)
+
+        """
+        self.savedSecondsElapsed = _getTime(self.timeGroup) - self.startTime
+        nPeriods = int(self.savedSecondsElapsed // self.timeInSeconds) - self.nPeriodsDone
+        nPeriods = max(nPeriods, minPeriods)
+        if nPeriods <= 0:
+            return 0
+        self.nPeriodsDone = self.nPeriodsDone + nPeriods
+        if self.oTimerMgr is not None:
+            nextTime = self.startTime + ((self.nPeriodsDone + 1) * self.timeInSeconds)
+            self.oTimerMgr._schedule(self, nextTime)
+
+        if self.callBack is not None:
+            if self.coalesce:
+                self.callBack(self.nickname)
+            else:
+                for periodNumber in range(nPeriods):
+                    if not self.running:
+                        break  # the callback stopped the timer
+                    self.callBack(self.nickname)
+        return nPeriods
+
+    def _expire(self):
+        """Internal method, called by the TimerMgr when the timer is finished"""
+        if self.repeat:
+            self.nPeriodsToReport = self.nPeriodsToReport + self._endPeriods(minPeriods=1)
+            return
+
+        self.savedSecondsElapsed = self.timeInSeconds
+        self.running = False
+        self.finished = True
+        if self.callBack is not None:
+            self.callBack(self.nickname)
+
     def getTime(self):
         """ Call this if you want to know how much has elapsed
 
@@ -223,16 +575,22 @@ class Timer():
            |   seconds elapsed since start, as a float
 
         """
-        if self.running or self.paused:
-            self.savedSecondsElapsed = time.time() - self.startTime
+        if self.paused:
+            self.savedSecondsElapsed = self.timePaused - self.startTime
+        elif self.running:
+            self.savedSecondsElapsed = _getTime(self.timeGroup) - self.startTime
 
         return self.savedSecondsElapsed
 
     def pause(self):
         """Pauses the timer"""
         self.pauseCounter = self.pauseCounter + 1
-        self.timePaused = time.time()
+        if self.pauseCounter > 1:
+            return  # already paused
+        self.timePaused = _getTime(self.timeGroup)
         self.paused = True
+        if self.oTimerMgr is not None:
+            self.oTimerMgr._unschedule(self)
 
     def resume(self):
         """Resumes the timer after a pause"""
@@ -244,9 +602,11 @@ class Timer():
             return  # don't resume
 
         # OK to resume
-        pauseTime = time.time() - self.timePaused
-        self.secondsStart = self.secondsStart + pauseTime
+        pauseTime = _getTime(self.timeGroup) - self.timePaused
+        self.startTime = self.startTime + pauseTime
         self.paused = False
+        if (self.oTimerMgr is not None) and self.running:
+            self.oTimerMgr._schedule(self, self.startTime + ((self.nPeriodsDone + 1) * self.timeInSeconds))
 
     def stop(self):
         """Stops the timer"""
@@ -254,6 +614,60 @@ class Timer():
         self.running = False
         self.paused = False
         self.pauseCounter = 0
+        if self.oTimerMgr is not None:
+            self.oTimerMgr._unschedule(self)
+
+
+#
+# Time formatting for CountUpTimer and CountDownTimer
+#
+def _formatHHMMSS(nTicks, nMillisecondsDigits, forceFullHHMMSS):
+    """Internal function, formats a time given as an integer number of ticks (10 ** nMillisecondsDigits per second)"""
+    secs, fraction = divmod(nTicks, 10 ** nMillisecondsDigits)
+    mins, secs = divmod(secs, 60)
+    hours, mins = divmod(mins, 60)
+
+    if nMillisecondsDigits > 0:
+        fractionText = f'.{fraction:0{nMillisecondsDigits}d}'
+    else:
+        fractionText = ''
+
+    if forceFullHHMMSS:
+        output = f'{hours:02d}:{mins:02d}:{secs:02d}{fractionText}'
+    elif hours > 0:
+        output = f'{hours:d}:{mins:02d}:{secs:02d}{fractionText}'
+    elif mins > 0:
+        output = f'{mins:d}:{secs:02d}{fractionText}'
+    else:
+        output = f'{secs:d}{fractionText}'
+    return output
+
+def _getTimerDisplay(displaysDict, nSeconds, nMillisecondsDigits, forceFullHHMMSS):
+    """Internal function, returns a timer's display list for one format, updated to nSeconds
+
+    A display list is [nTicks, text, surface, oGlyphCache] for the last time that was read.
+    The text is only formatted again (and the surface thrown away) when the displayed digits change.
+
+    """
+    nTicks = round(nSeconds * (10 ** nMillisecondsDigits))
+    displayKey = (nMillisecondsDigits, forceFullHHMMSS)
+    displayList = displaysDict.get(displayKey)
+    if displayList is None:
+        displayList = [None, '', None, None]
+        displaysDict[displayKey] = displayList
+    if displayList[0] != nTicks:
+        displayList[0] = nTicks
+        displayList[1] = _formatHHMMSS(nTicks, nMillisecondsDigits, forceFullHHMMSS)
+        displayList[2] = None  # the surface must be drawn again
+    return displayList
+
+def _hasTimerDisplayChanged(displaysDict, nSeconds, nMillisecondsDigits, forceFullHHMMSS):
+    """Internal function, returns True if the displayed digits are different from the last ones read"""
+    displayList = displaysDict.get((nMillisecondsDigits, forceFullHHMMSS))
+    if displayList is None:
+        return True  # never read
+    nTicks = round(nSeconds * (10 ** nMillisecondsDigits))
+    return nTicks != displayList[0]
 
 
 # CountUpTimer class
@@ -285,6 +699,9 @@ class CountUpTimer():
 
         One of the above should be called every time through your main loop.
 
+        To avoid updating a DisplayText when the digits have not changed, check hasDisplayChanged() first,
+        or get a surface drawn with a GlyphCache by calling getTimeSurface(oGlyphCache).
+
     4)  If you want to stop the timer, call:
 
         myTimer.stop()
@@ -293,11 +710,16 @@ class CountUpTimer():
     Parameters:
         | none
 
+    Optional keyword parameter:
+        | timeGroup - a name for a group of timers whose speed can be set by setTimeScale (defaults to None)
+
     """
 
-    def __init__(self):
+    def __init__(self, timeGroup=None):
+        self.timeGroup = timeGroup
         self.running = False
         self.savedSecondsElapsed = 0.0
+        self.displaysDict = {}  # (nMillisecondsDigits, forceFullHHMMSS): display list (see _getTimerDisplay)
         self.secondsStart = 0  # safeguard
         self.paused = False
         self.timePaused = None
@@ -305,7 +727,7 @@ class CountUpTimer():
 
     def start(self):
         """Start the timer running (starts at zero).  Can be called to restart the timer, for example to play a game multiple times"""
-        self.secondsStart = time.time()  # get the current seconds and save the value
+        self.secondsStart = _getTime(self.timeGroup)  # get the current seconds and save the value
         self.running = True
         self.paused = False
         self.savedSecondsElapsed = 0.0
@@ -316,7 +738,7 @@ class CountUpTimer():
         if not self.running or self.paused:
             return self.savedSecondsElapsed  # do nothing
         
-        self.savedSecondsElapsed = time.time() - self.secondsStart
+        self.savedSecondsElapsed = _getTime(self.timeGroup) - self.secondsStart
         return self.savedSecondsElapsed  # returns a float
 
     def getTimeInSeconds(self):
@@ -324,8 +746,7 @@ class CountUpTimer():
         nSeconds = int(self.getTime())
         return nSeconds
 
-    # Updated version using fStrings
-    def getTimeInHHMMSS(self, nMillisecondsDigits=0, forceFullHHMMSS= False):
+    def getTimeInHHMMSS(self, nMillisecondsDigits=0, forceFullHHMMSS=False):
         """Returns the elapsed time as a HH:MM:SS.mmm formatted string
 
         Parameters:
@@ -335,26 +756,45 @@ class CountUpTimer():
             |    If specified, returned string will include nMillisecondsDigits of milliseconds digits
             | forceFullHHMMSS forces the output to be in full HH:MM:SS format (defaults to False)
 
+        The string is only formatted again when the displayed digits change.
+
         """
-        nSeconds = self.getTime()
-        mins, secs = divmod(nSeconds, 60)
-        hours, mins = divmod(int(mins), 60)
+        displayList = _getTimerDisplay(self.displaysDict, self.getTime(), nMillisecondsDigits, forceFullHHMMSS)
+        return displayList[1]
 
-        if nMillisecondsDigits > 0:
-            secondsWidth = nMillisecondsDigits + 3
-        else:
-            secondsWidth = 2
-
-        if forceFullHHMMSS:
-            output = f'{hours:02d}:{mins:02d}:{secs:0{secondsWidth}.{nMillisecondsDigits}f}'
-        elif hours > 0:
-            output = f'{hours:d}:{mins:02d}:{secs:0{secondsWidth}.{nMillisecondsDigits}f}'
-        elif mins > 0:
-            output = f'{mins:d}:{secs:0{secondsWidth}.{nMillisecondsDigits}f}'
-        else:
-            output = f'{secs:.{nMillisecondsDigits}f}'
+    def hasDisplayChanged(self, nMillisecondsDigits=0, forceFullHHMMSS=False):
+        """Returns True if getTimeInHHMMSS (with the same parameters) would now return a different string
+
+        Use this to only update a DisplayText when the digits on the screen change:
+
+            |    if myTimer.hasDisplayChanged():
+            |        oDisplayText.setValue(myTimer.getTimeInHHMMSS())
+
+        Optional keyword parameters:
+            | nMillisecondsDigits - number of milliseconds digits to include (defaults to 0)
+            | forceFullHHMMSS forces the output to be in full HH:MM:SS format (defaults to False)
+
+        """
+        return _hasTimerDisplayChanged(self.displaysDict, self.getTime(), nMillisecondsDigits, forceFullHHMMSS)
+
+    def getTimeSurface(self, oGlyphCache, nMillisecondsDigits=0, forceFullHHMMSS=False):
+        """Returns a surface with the time in HH:MM:SS.mmm format, drawn with the characters of a GlyphCache
 
-        return output
+        The surface is only rendered again when the string changes, so it can be blitted in every frame.
+
+        Parameter:
+            | oGlyphCache - a GlyphCache object used to draw the time
+
+        Optional keyword parameters:
+            | nMillisecondsDigits - number of milliseconds digits to include (defaults to 0)
+            | forceFullHHMMSS forces the output to be in full HH:MM:SS format (defaults to False)
+
+        """
+        displayList = _getTimerDisplay(self.displaysDict, self.getTime(), nMillisecondsDigits, forceFullHHMMSS)
+        if (displayList[2] is None) or (displayList[3] is not oGlyphCache):
+            displayList[2] = oGlyphCache.render(displayList[1])
+            displayList[3] = oGlyphCache
+        return displayList[2]
     
     def stop(self):
         """Stops the timer"""
@@ -366,7 +806,10 @@ class CountUpTimer():
     def pause(self):
         """Pauses the timer"""
         self.pauseCounter = self.pauseCounter + 1
-        self.timePaused = time.time()
+        if self.pauseCounter > 1:
+            return  # already paused
+        self.getTime()  # remembers self.savedSecondsElapsed, returned while paused
+        self.timePaused = _getTime(self.timeGroup)
         self.paused = True
 
     def resume(self):
@@ -379,7 +822,7 @@ class CountUpTimer():
             return  # don't resume
 
         # OK to resume
-        pauseTime = time.time() - self.timePaused
+        pauseTime = _getTime(self.timeGroup) - self.timePaused
         self.secondsStart = self.secondsStart + pauseTime
         self.paused = False
 
@@ -413,10 +856,15 @@ class CountDownTimer():
 
         theTime = myTimer.getTimeInHHMMSS() # gets the time in HH:MM:SS string format
 
+        To avoid updating a DisplayText when the digits have not changed, check hasDisplayChanged() first,
+        or get a surface drawn with a GlyphCache by calling getTimeSurface(oGlyphCache).
+
     4)  If you want to stop the timer, call:
 
         myTimer.stop()
 
+    If you pass in a TimerMgr (see TimerMgr), and stopAtZero is True, the TimerMgr calls the callback
+    when the timer reaches zero, so you do not need to call ended() in every frame.
 
     Parameters:
         | nStartingSeconds - the starting point for the timer, in seconds (integer or float)
@@ -426,23 +874,34 @@ class CountDownTimer():
         | nickname - an internal name used to refer to this timer (defaults to None)
         | callback - a function or object.method to be called back when the timer is finished
         |            The nickname of the timer will be passed in when the callback is made (defaults to None)
+        | oTimerMgr - a TimerMgr object that checks this timer (defaults to None)
+        | timeGroup - a name for a group of timers whose speed can be set by setTimeScale (defaults to None)
 
     """
 
-    def __init__(self, nStartingSeconds, stopAtZero=True, nickname=None, callBack=None):
+    def __init__(self, nStartingSeconds, stopAtZero=True, nickname=None, callBack=None, oTimerMgr=None,
+                 timeGroup=None):
         self.nStartingSeconds = nStartingSeconds
         self.stopAtZero = stopAtZero
         self.nickname = nickname
         self.callBack = callBack
+        self.timeGroup = timeGroup
+        if stopAtZero:
+            self.oTimerMgr = oTimerMgr
+        else:
+            self.oTimerMgr = None  # never finishes, nothing for a TimerMgr to do
 
         self.running = False
+        self.paused = False
         self.secondsSavedRemaining = 0.0
         self.reachedZero = False
         self.pauseCounter = 0  # counts how many calls to pause without a resume
+        self.heapSequence = None  # identifies this timer's current entry in the TimerMgr's heap
+        self.displaysDict = {}  # (nMillisecondsDigits, forceFullHHMMSS): display list (see _getTimerDisplay)
 
     def start(self, newStartingSeconds=None):
         """Start the timer running starting at nStartingSeconds (or optional different setting)"""
-        secondsNow = time.time()
+        secondsNow = _getTime(self.timeGroup)
         if newStartingSeconds is not None:
             self.nStartingSeconds = newStartingSeconds
         self.secondsEnd = secondsNow + self.nStartingSeconds
@@ -451,13 +910,15 @@ class CountDownTimer():
         self.paused = False
         self.timePaused = None
         self.pauseCounter = 0
+        if self.oTimerMgr is not None:
+            self.oTimerMgr._schedule(self, self.secondsEnd)
 
     def getTime(self):
         """Returns the remaining time as a float number of seconds"""
         if not self.running or self.paused:
             return self.secondsSavedRemaining
         
-        self.secondsSavedRemaining = self.secondsEnd - time.time()
+        self.secondsSavedRemaining = self.secondsEnd - _getTime(self.timeGroup)
         if self.stopAtZero and (self.secondsSavedRemaining <= 0):
             self.secondsSavedRemaining = 0.0
             self.running = False
@@ -470,7 +931,6 @@ class CountDownTimer():
         nSeconds = int(self.getTime())
         return nSeconds
 
-    # Updated version using fStrings
     def getTimeInHHMMSS(self, nMillisecondsDigits=0, forceFullHHMMSS=False):
         """Returns the remaining time as a HH:MM:SS.mmm formatted string
 
@@ -481,28 +941,45 @@ class CountDownTimer():
             |    If specified, returned string will include nMillisecondsDigits of milliseconds digits
             | forceFullHHMMSS forces the output to be in full HH:MM:SS format (defaults to False)
 
+        The string is only formatted again when the displayed digits change.
+
         """
-        nSeconds = self.getTime()
-        mins, secs = divmod(nSeconds, 60)
-        hours, mins = divmod(int(mins), 60)
+        displayList = _getTimerDisplay(self.displaysDict, self.getTime(), nMillisecondsDigits, forceFullHHMMSS)
+        return displayList[1]
 
-        if nMillisecondsDigits > 0:
-            secondsWidth = nMillisecondsDigits + 3
-        else:
-            secondsWidth = 2
-
-        if forceFullHHMMSS:
-            output = f'{hours:02d}:{mins:02d}:{secs:0{secondsWidth}.{nMillisecondsDigits}f}'
-        elif hours > 0:
-            output = f'{hours:d}:{mins:02d}:{secs:0{secondsWidth}.{nMillisecondsDigits}f}'
-        elif mins > 0:
-            output = f'{mins:d}:{secs:0{secondsWidth}.{nMillisecondsDigits}f}'
-        else:
-            output = f'{secs:.{nMillisecondsDigits}f}'
+    def hasDisplayChanged(self, nMillisecondsDigits=0, forceFullHHMMSS=False):
+        """Returns True if getTimeInHHMMSS (with the same parameters) would now return a different string
+
+        Use this to only update a DisplayText when the digits on the screen change:
+
+            |    if myTimer.hasDisplayChanged():
+            |        oDisplayText.setValue(myTimer.getTimeInHHMMSS())
 
+        Optional keyword parameters:
+            | nMillisecondsDigits - number of milliseconds digits to include (defaults to 0)
+            | forceFullHHMMSS forces the output to be in full HH:MM:SS format (defaults to False)
+
+        """
+        return _hasTimerDisplayChanged(self.displaysDict, self.getTime(), nMillisecondsDigits, forceFullHHMMSS)
+
+    def getTimeSurface(self, oGlyphCache, nMillisecondsDigits=0, forceFullHHMMSS=False):
+        """Returns a surface with the time in HH:MM:SS.mmm format, drawn with the characters of a GlyphCache
+
+        The surface is only rendered again when the string changes, so it can be blitted in every frame.
+
+        Parameter:
+            | oGlyphCache - a GlyphCache object used to draw the time
+
+        Optional keyword parameters:
+            | nMillisecondsDigits - number of milliseconds digits to include (defaults to 0)
+            | forceFullHHMMSS forces the output to be in full HH:MM:SS format (defaults to False)
 
-        self.savedSecondsElapsed = output
-        return output
+        """
+        displayList = _getTimerDisplay(self.displaysDict, self.getTime(), nMillisecondsDigits, forceFullHHMMSS)
+        if (displayList[2] is None) or (displayList[3] is not oGlyphCache):
+            displayList[2] = oGlyphCache.render(displayList[1])
+            displayList[3] = oGlyphCache
+        return displayList[2]
 
 
     def stop(self):
@@ -511,10 +988,23 @@ class CountDownTimer():
         self.running = False
         self.paused = False
         self.pauseCounter = 0
+        if self.oTimerMgr is not None:
+            self.oTimerMgr._unschedule(self)
         
 
     def ended(self):
-        """Call to see if the timer has reached zero. Should be called every time through the loop"""
+        """Call to see if the timer has reached zero. Should be called every time through the loop
+
+        (If the timer has a TimerMgr, the TimerMgr does the checking, and calls the callback.
+        Calling ended is then optional, it only reports that the timer reached zero.)
+
+        """
+        if self.oTimerMgr is not None:
+            if self.reachedZero:
+                self.reachedZero = False  # only report it once
+                return True
+            return False
+
         dontCare = self.getTime()   #  called to  set self.reachedZero
         if self.reachedZero:
             self.reachedZero = False  # reset
@@ -524,11 +1014,24 @@ class CountDownTimer():
         else:
             return False
 
+    def _expire(self):
+        """Internal method, called by the TimerMgr when the timer reaches zero"""
+        self.secondsSavedRemaining = 0.0
+        self.running = False
+        self.reachedZero = True
+        if self.callBack is not None:
+            self.callBack(self.nickname)
+
     def pause(self):
         """Pauses the timer"""
         self.pauseCounter = self.pauseCounter + 1
-        self.timePaused = time.time()
+        if self.pauseCounter > 1:
+            return  # already paused
+        self.getTime()  # remembers self.secondsSavedRemaining, returned while paused
+        self.timePaused = _getTime(self.timeGroup)
         self.paused = True
+        if self.oTimerMgr is not None:
+            self.oTimerMgr._unschedule(self)
 
     def resume(self):
         """Resumes the timer after a pause"""
@@ -540,197 +1043,2322 @@ class CountDownTimer():
             return  # don't resume
 
         # OK to resume
-        pauseTime = time.time() - self.timePaused
-        self.secondsStart = self.secondsStart + pauseTime
+        pauseTime = _getTime(self.timeGroup) - self.timePaused
+        self.secondsEnd = self.secondsEnd + pauseTime
         self.paused = False
+        if (self.oTimerMgr is not None) and self.running:
+            self.oTimerMgr._schedule(self, self.secondsEnd)
 
 
 #
-# Scene Manager
+# TimerMgr class
 #
-class SceneMgr():
-    """SceneMgr (Scene Manager)  allows you to build a program with multiple scenes.
+class TimerMgr():
+    """
+    This class checks many Timer and CountDownTimer objects at once, instead of checking each one in every frame.
 
-    The SceneMgr manages any number of scenes built as subclasses of the "Scene" class.
-    For more details, see the "Scene" class.
+    The timers that are running are kept in a heap, ordered by the time when they will finish.
+    In each frame, the TimerMgr gets the time once, and only looks at the timers that have finished,
+    so the cost does not depend on the number of timers that are still running.
+    When a timer finishes, its callback is called.
 
     Typical use:
 
-    1) Instantiate as many Scenes as you want:
-        |  oScene1 = StartingScene(window)
-        |  oScene2 = MainScene(window)
-        |  oScene3 = SomeOtherScene(window)
-
-    2) Build a dictionary of these scenes:
-        |  myScenesDict = {'sceneKey1': oScene1, 'sceneKey2': oScene2, 'sceneKey3': oScene3}
-
-        The keys are any unique strings that you want to use.
-
-            OLDER APPROACH:  Before pyghelpers 1.1, but still works for backwards compatibility
-            Build a list of the scenes:
-            | myScenesList = [oScene1, oScene2, oScene3]
-
-    3) Instantiate *one* SceneMgr (a singleton):
-        |  oSceneMgr = SceneMgr(myScenesDict, 30) # First scene in the dict is the starting scene
-
-            OLDER APPROACH:  Before pyghelpers 1.1, but still works for backwards compatibility
-                oSceneMgr = SceneMgr(myScenesList, 30) # First scene in the list is the starting scene
+    1)  Create a TimerMgr object, and pass it in when you create the SceneMgr:
 
-        You can optionally pass a DisplayText object for showing the frame rate, e.g.
-        |  oDebugFrameRate = pygwidgets.DisplayText(window, (0, 0), '', fontSize=24)
-        |  oSceneMgr = SceneMgr(scenesDictOrList, FRAMES_PER_SECOND, oDebugFrameRate)
+        oTimerMgr = pyghelpers.TimerMgr()
+        oSceneMgr = pyghelpers.SceneMgr(scenesDict, FRAMES_PER_SECOND, oTimerMgr=oTimerMgr)
 
-    4) Call the run method to start the SceneMgr running:
-        |  oSceneMgr.run()  # First scene in the list is the starting scene
+        (If you do not pass one in, the SceneMgr creates one.  A scene can get it by calling getTimerMgr().)
 
+    2)  Pass the TimerMgr in when you create your timers:
 
-    Parameters:
-        | scenesDictOrList - is a dictionary or list that consists of:
-        |    {<sceneKey>: <sceneObject>, <sceneKey>: <sceneObject>, ...}
-        |    OR older (before pyghelpers 1.1):  [<sceneObject>, <sceneObject>, ...]
-        |      where each sceneObject is an object instantiated from a scene class
-        |      (For details on Scenes, see the Scene class)
-        | fps - is the frames per second at which the program should run
+        myTimer = pyghelpers.Timer(2.5, callBack=self.cooldownOver, oTimerMgr=oTimerMgr)
 
-    Based on the concept of a "Scene Manager" by Blake O'Hare of Nerd Paradise (nerdparadise.com)
+    The SceneMgr calls the TimerMgr's update method once per frame.
+    If you are not using the SceneMgr, call update() in every frame yourself.
 
     """
-    def __init__(self, scenesDictOrList, fps, oFrameRateDisplay=None):
 
-        # Newer approach (pyghelpers 1.1), pass in a dictionary of {scene keys: scene objects}
-        # (No need to have each scene implement a getSceneKey method.)
-        if isinstance(scenesDictOrList, dict):
-            self.scenesDict = scenesDictOrList
-            keysList = list(self.scenesDict)  # get all the keys
-            startingKey = keysList[0]  # first key is the starting scene ley
-            self.oCurrentScene = self.scenesDict[startingKey]
+    def __init__(self):
+        # Each time group has its own heap, because finish times are in the (scaled) time of the group
+        self.heapsDict = {}  # timeGroup: list of (finish time, sequence number, timer)
+        self.sequenceNumber = 0
+        self.nEntries = 0
+        self.nStaleEntries = 0  # entries of timers that were stopped, paused, or restarted
+
+    def _schedule(self, oTimer, finishTime):
+        """Internal method, called by a timer when it is started or resumed"""
+        if oTimer.heapSequence is not None:
+            self.nStaleEntries = self.nStaleEntries + 1  # the timer's old entry is left in the heap
+        self.sequenceNumber = self.sequenceNumber + 1
+        oTimer.heapSequence = self.sequenceNumber
+        heapList = self.heapsDict.get(oTimer.timeGroup)
+        if heapList is None:
+            heapList = []
+            self.heapsDict[oTimer.timeGroup] = heapList
+        heapq.heappush(heapList, (finishTime, self.sequenceNumber, oTimer))
+        self.nEntries = self.nEntries + 1
+
+    def _unschedule(self, oTimer):
+        """Internal method, called by a timer when it is stopped or paused
+
+        The timer's entry is not removed from the heap (that would be slow), it is skipped when it comes up.
 
-        else:  # Older style, we start with a list of scenes
-            # Build a dictionary, each entry of which is a scene key : scene object
-            # Then we call getSceneKey so each scene can identify itself
-            self.scenesDict = {}
-            for oScene in scenesDictOrList:
-                key = oScene.getSceneKey()  # Each scene must return a unique key to identify itself
-                self.scenesDict[key] = oScene
-            # The first element in the list is the used as the starting scene
-            self.oCurrentScene = scenesDictOrList[0]
+        """
+        if oTimer.heapSequence is not None:
+            oTimer.heapSequence = None
+            self.nStaleEntries = self.nStaleEntries + 1
+            # If most of the entries are stale, rebuild the heaps.  Each heap is rebuilt in place (not
+            # replaced by a new list), because a callBack run from update() can stop a timer, and update()
+            # is still popping from its own reference to the heap list.
+            if self.nStaleEntries > (self.nEntries // 2):
+                self.nEntries = 0
+                for heapList in self.heapsDict.values():
+                    heapList[:] = [entry for entry in heapList if entry[1] == entry[2].heapSequence]
+                    heapq.heapify(heapList)
+                    self.nEntries = self.nEntries + len(heapList)
+                self.nStaleEntries = 0
 
-        self.framesPerSecond = fps
-        self.oFrameRateDisplay = oFrameRateDisplay
-        self.showFrameRate = oFrameRateDisplay is not None  # for fast checking in main loop
-        self.scenesToRemoveList = []
+    def update(self):
+        """Checks for timers that have finished, and calls their callbacks
 
-        # Give each scene a reference back to the SceneMgr.
-        # This allows any scene to do a goToScene, request, send,
-        # or sendAll, which gets forwarded to the scene manager.
-        for key, oScene in self.scenesDict.items():
-            oScene._setRefToSceneMgr(self)
+        This is called once per frame by the SceneMgr.
+
+        Returns:
+            |    the number of timers that finished
 
-    def run(self):
         """
-        This method implements the main pygame loop.
+        if self.nEntries == 0:
+            return 0
+        nFinished = 0
+        for timeGroup, heapList in list(self.heapsDict.items()):  # copy, a callBack can add a time group
+            now = _getTime(timeGroup)
+            while (heapList != []) and (heapList[0][0] <= now):
+                finishTime, sequenceNumber, oTimer = heapq.heappop(heapList)
+                self.nEntries = self.nEntries - 1
+                if sequenceNumber != oTimer.heapSequence:
+                    self.nStaleEntries = self.nStaleEntries - 1
+                    continue  # the timer was stopped, paused, or restarted
+                oTimer.heapSequence = None
+                oTimer._expire()  # may call a callBack that starts this or other timers
+                nFinished = nFinished + 1
+        return nFinished
+
+    def getNTimers(self):
+        """Returns the number of timers that are running"""
+        return self.nEntries - self.nStaleEntries
 
-        It should typically be called as the last line of your main program.
 
-        It is designed to call a standardized set of methods in the current scene.
+#
+# TimerArray class
+#
+_TIMER_STOPPED = 0
+_TIMER_RUNNING = 1
+_TIMER_PAUSED = 2
 
-        All scenes must implement the following methods (polymorphism):
-            |   handleInputs()  # called in every frame
-            |   draw()          # called in every frame
+class TimerArray():
+    """
+    This class is used to create a large number of count down timers that are all handled together.
 
-        The following methods can be implemented in a scene:
-            |   enter()  # called once whenever the scene is entered
-            |   update()  # called in every frame
-            |   leave()  # called once whenever the scene is left
+    It works like a list of CountDownTimers (that stop at zero), but instead of one object per timer,
+    the end times, durations, and states of all timers are kept in arrays.  Checking all the timers
+    in a frame is one operation, rather than a method call for each timer.  This is useful for things
+    like a cool down time for each of hundreds of enemies or bullets.
 
-        If any is not implemented, then the version in the Scene base class,
-        which only performs a pass statement, will be used.
+    If numpy is installed, the arrays are numpy arrays, and all operations are vectorized.
+    Otherwise, arrays from the standard array module are used.
 
-        """
-        clock = pygame.time.Clock()
+    Typical use:
 
-        # 6 - Loop forever
-        while True:
-            # If there are any scenes to be removed (keys added by removeScene method)
-            if not(self.scenesToRemoveList is []):
-                for key in self.scenesToRemoveList:
-                    del self.scenesDict[key]
-                self.scenesToRemoveList = []  # reset
+    1)  Create a TimerArray with the number of timers, and their duration in seconds:
 
-            keysDownList = pygame.key.get_pressed()
+        oCooldowns = pyghelpers.TimerArray(500, 0.75)
 
-            # 7 - Check for and handle events
-            eventsList = []
-            for event in pygame.event.get():
-                if (event.type == pygame.QUIT) or \
-                        ((event.type == pygame.KEYDOWN) and
-                        (event.key == pygame.K_ESCAPE)):
-                    # Tell current scene we're leaving
-                    self.oCurrentScene.leave()  
-                    pygame.quit()
-                    sys.exit()
+    2)  Start, stop, pause, or resume any group of timers.  All these methods take an optional "which" argument:
+        None (all timers), an index, a list of indices, or a list of True/False values (a mask) with one
+        entry for each timer:
 
-                eventsList.append(event)
+        oCooldowns.start(bulletIndex)
+        oCooldowns.pause()  # pauses all of them
 
-            # Here, we let the current scene process all events by calling its handleInputs() method
-            # do any "per frame" actions in its update() method,
-            # and call its draw() method so it can draw everything that needs to be drawn.
-            self.oCurrentScene.handleInputs(eventsList, keysDownList)
-            self.oCurrentScene.update()
-            self.oCurrentScene.draw()
-            if self.showFrameRate:
-                fps = str(clock.get_fps())
-                self.oFrameRateDisplay.setText('FPS: ' + fps)
-                self.oFrameRateDisplay.draw()
+    3)  Once per frame, get the indices of the timers that reached zero (they are stopped):
 
-            # 11 - Update the window
-            pygame.display.update()
+        expiredList = oCooldowns.updateAll()
 
-            # 12 - Slow things down a bit
-            clock.tick(self.framesPerSecond)
-            
+    Parameters:
+        | nTimers - the number of timers
 
-    def _goToScene(self, nextSceneKey, dataForNextScene):
-        """Called by a Scene, tells the SceneMgr to go to another scene
+    Optional keyword parameters:
+        | durationSeconds - the duration of every timer in seconds, or a list with a duration for each (defaults to 0.0)
+        | useNumpy - use numpy arrays if numpy is installed (defaults to True)
+        | timeGroup - a name for a group of timers whose speed can be set by setTimeScale (defaults to None)
 
-        (From the Scene's point of view, it just needs to call its own goToScene method)
-        This method:
-        - Tells the current scene that it is leaving, calls leave method
-        - Gets any data the leaving scene wants to send to the new scene
-        - Tells the new scene that it is entering, calls enter method
+    """
+    def __init__(self, nTimers, durationSeconds=0.0, useNumpy=True, timeGroup=None):
+        self.nTimers = nTimers
+        self.timeGroup = timeGroup
+        self.usingNumpy = useNumpy and (numpy is not None)
+        if isinstance(durationSeconds, numbers.Real):
+            durationSeconds = [durationSeconds] * nTimers
+        if len(durationSeconds) != nTimers:
+            raise ValueError('TimerArray was given ' + str(len(durationSeconds)) +
+                             ' durations for ' + str(nTimers) + ' timers')
+
+        if self.usingNumpy:
+            self.durations = numpy.array(durationSeconds, dtype=numpy.float64)
+            self.endTimes = numpy.zeros(nTimers, dtype=numpy.float64)
+            self.remainingTimes = numpy.zeros(nTimers, dtype=numpy.float64)  # saved when stopped or paused
+            self.states = numpy.zeros(nTimers, dtype=numpy.int8)
+        else:
+            self.durations = array.array('d', durationSeconds)
+            self.endTimes = array.array('d', bytes(8 * nTimers))
+            self.remainingTimes = array.array('d', bytes(8 * nTimers))  # saved when stopped or paused
+            self.states = array.array('b', bytes(nTimers))
+
+    def _getIndices(self, which):
+        """Internal method, turns the "which" argument into something that can index the arrays"""
+        if which is None:
+            if self.usingNumpy:
+                return slice(None)
+            return range(self.nTimers)
+        if isinstance(which, numbers.Integral):  # includes numpy integers
+            return [which]
+        if self.usingNumpy:
+            indices = numpy.asarray(which)  # a numpy array of bools is used as a mask
+            if indices.size == 0:  # an empty list would become an array of floats, which cannot index
+                return indices.astype(numpy.intp)
+            return indices
+        if hasattr(which, 'tolist'):  # a numpy array, tolist gives Python ints and bools
+            which = which.tolist()
+        which = list(which)
+        if (len(which) == self.nTimers) and all(isinstance(item, bool) for item in which):
+            return [index for index, selected in enumerate(which) if selected]
+        return which
+
+    def start(self, which=None, newDurationSeconds=None):
+        """Starts (or restarts) timers, counting down from their durations
 
-        Raises:
-        - KeyError if the nextSceneKey is not valid
+        Optional keyword parameters:
+            |    which - the timers to start: None for all, an index, a list of indices, or a mask (defaults to None)
+            |    newDurationSeconds - a new duration for the timers being started (defaults to None)
 
         """
-        if nextSceneKey is None:  # meaning, exit
-            pygame.quit()
-            sys.exit()
+        now = _getTime(self.timeGroup)
+        indices = self._getIndices(which)
+        if self.usingNumpy:
+            if newDurationSeconds is not None:
+                self.durations[indices] = newDurationSeconds
+            self.endTimes[indices] = now + self.durations[indices]
+            self.states[indices] = _TIMER_RUNNING
+        else:
+            durations = self.durations
+            endTimes = self.endTimes
+            states = self.states
+            for index in indices:
+                if newDurationSeconds is not None:
+                    durations[index] = newDurationSeconds
+                endTimes[index] = now + durations[index]
+                states[index] = _TIMER_RUNNING
+
+    def stop(self, which=None):
+        """Stops timers (the time remaining is saved)
 
-        # Call the leave method of the old scene to allow it to clean up.
-        # Set the new scene (based on the key) and
-        # call the enter method of the new scene.
-        self.oCurrentScene.leave()
-        pygame.key.set_repeat(0) # turn off repeating characters
-        try:
-            self.oCurrentScene = self.scenesDict[nextSceneKey]
-        except KeyError:
-            raise KeyError("Trying to go to scene '" + nextSceneKey +
-                "' but that key is not in the dictionary of scenes.")
-        self.oCurrentScene.enter(dataForNextScene)
+        Optional keyword parameter:
+            |    which - the timers to stop: None for all, an index, a list of indices, or a mask (defaults to None)
 
+        """
+        self._saveRemaining(which, _TIMER_STOPPED)
 
-    def _request_respond(self, targetSceneKey, requestID):
-        """Internal method, called by a Scene tells SceneMgr to query another scene for information.
+    def pause(self, which=None):
+        """Pauses timers that are running
 
-        (From the Scene's point of view, it just needs to call its own request method)
-        The target scene must implement a method named "respond"
+        Optional keyword parameter:
+            |    which - the timers to pause: None for all, an index, a list of indices, or a mask (defaults to None)
 
         """
-        oTargetScene = self.scenesDict[targetSceneKey]
+        self._saveRemaining(which, _TIMER_PAUSED)
+
+    def _saveRemaining(self, which, newState):
+        """Internal method, saves the remaining time of running timers, and gives them a new state"""
+        now = _getTime(self.timeGroup)
+        indices = self._getIndices(which)
+        if self.usingNumpy:
+            selectedStates = self.states[indices]
+            running = selectedStates == _TIMER_RUNNING
+            remaining = numpy.maximum(self.endTimes[indices] - now, 0.0)
+            self.remainingTimes[indices] = numpy.where(running, remaining, self.remainingTimes[indices])
+            if newState == _TIMER_PAUSED:
+                self.states[indices] = numpy.where(running, _TIMER_PAUSED, selectedStates)
+            else:
+                self.states[indices] = _TIMER_STOPPED
+        else:
+            endTimes = self.endTimes
+            states = self.states
+            for index in indices:
+                if states[index] == _TIMER_RUNNING:
+                    self.remainingTimes[index] = max(endTimes[index] - now, 0.0)
+                    states[index] = newState
+                elif newState == _TIMER_STOPPED:
+                    states[index] = _TIMER_STOPPED
+
+    def resume(self, which=None):
+        """Resumes timers that are paused
+
+        Optional keyword parameter:
+            |    which - the timers to resume: None for all, an index, a list of indices, or a mask (defaults to None)
+
+        """
+        now = _getTime(self.timeGroup)
+        indices = self._getIndices(which)
+        if self.usingNumpy:
+            selectedStates = self.states[indices]
+            paused = selectedStates == _TIMER_PAUSED
+            self.endTimes[indices] = numpy.where(paused, now + self.remainingTimes[indices], self.endTimes[indices])
+            self.states[indices] = numpy.where(paused, _TIMER_RUNNING, selectedStates)
+        else:
+            states = self.states
+            for index in indices:
+                if states[index] == _TIMER_PAUSED:
+                    self.endTimes[index] = now + self.remainingTimes[index]
+                    states[index] = _TIMER_RUNNING
+
+    def updateAll(self):
+        """Call this once per frame, finds the timers that have reached zero, and stops them
+
+        Returns:
+            |    a list of the indices of the timers that reached zero since the last call
+
+        """
+        now = _getTime(self.timeGroup)
+        if self.usingNumpy:
+            expired = numpy.flatnonzero((self.states == _TIMER_RUNNING) & (self.endTimes <= now))
+            if len(expired) == 0:
+                return []
+            self.states[expired] = _TIMER_STOPPED
+            self.remainingTimes[expired] = 0.0
+            return expired.tolist()
+
+        states = self.states
+        expiredList = [index for index, (state, endTime) in enumerate(zip(states, self.endTimes))
+                       if (state == _TIMER_RUNNING) and (endTime <= now)]
+        for index in expiredList:
+            states[index] = _TIMER_STOPPED
+            self.remainingTimes[index] = 0.0
+        return expiredList
+
+    def getTime(self, index):
+        """Returns the remaining time of one timer, as a float number of seconds"""
+        if self.states[index] == _TIMER_RUNNING:
+            return max(self.endTimes[index] - _getTime(self.timeGroup), 0.0)
+        return float(self.remainingTimes[index])
+
+    def isRunning(self, index):
+        """Returns True if the timer is running (not stopped, paused, or finished)"""
+        return bool(self.states[index] == _TIMER_RUNNING)
+
+    def isPaused(self, index):
+        """Returns True if the timer is paused"""
+        return bool(self.states[index] == _TIMER_PAUSED)
+
+    def getNTimers(self):
+        """Returns the number of timers in the array"""
+        return self.nTimers
+
+
+def setHeadlessMode():
+    """Sets up pygame to run without a visible window and without sound output
+
+    This is intended for automated testing and benchmarking (for example, with SceneMgr.run(maxFrames=...)).
+    It must be called before pygame.init() and pygame.display.set_mode().
+    The window is still created as a normal surface, so all drawing code works unchanged.
+
+    """
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+
+class _KeysDown():
+    """Internal class that acts like the value returned by pygame.key.get_pressed() for a set of keys"""
+    def __init__(self, keysSet):
+        self.keysSet = keysSet
+
+    def __getitem__(self, key):
+        return key in self.keysSet
+
+
+#
+# ScriptedEventSource class
+#
+class ScriptedEventSource():
+    """
+    This class supplies a scripted set of events to SceneMgr.run(), instead of the real events from pygame.
+
+    It allows a program to be run without a user, for automated testing, soak tests, and benchmarks.
+
+    Typical use:
+
+    1)  Build a dictionary of the events you want to happen in different frames (frames are numbered from 0):
+
+        eventsDict = {10: [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(300, 520), button=1)],
+                      12: [pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(300, 520), button=1)]}
+
+    2)  Create a ScriptedEventSource object, and pass it to the run method of the SceneMgr:
+
+        oEventSource = pyghelpers.ScriptedEventSource(eventsDict)
+
+        nFrames = oSceneMgr.run(maxFrames=10000, throttle=False, oEventSource=oEventSource)
+
+    The "keys down" list given to each scene's handleInputs() method is built from the KEYDOWN and KEYUP
+    events in the script, so it can be indexed by key (for example, keysDownList[pygame.K_LEFT]).
+
+    Parameters:
+        | eventsDict - a dictionary of {frameNumber: list of pygame.event.Event objects}
+
+    """
+    def __init__(self, eventsDict):
+        self.eventsDict = eventsDict
+        self.oKeysDown = _KeysDown(frozenset())
+
+    def getInputs(self, frameNumber):
+        """Called by the SceneMgr in every frame.
+
+        Parameter:
+            |    frameNumber - the number of the current frame (starting at 0)
+
+        Returns:
+            |    a tuple of (eventsList, keysDownList) for this frame
+
+        """
+        eventsList = self.eventsDict.get(frameNumber, [])
+        for event in eventsList:
+            if event.type == pygame.KEYDOWN:
+                self.oKeysDown = _KeysDown(self.oKeysDown.keysSet | {event.key})
+            elif event.type == pygame.KEYUP:
+                self.oKeysDown = _KeysDown(self.oKeysDown.keysSet - {event.key})
+        return eventsList, self.oKeysDown
+
+
+#
+# Input recording and replay
+#
+_RECORDING_MAGIC = b'PYGHREC1'
+_FRAME_MOUSE_MOVED = 0x01
+_FRAME_KEYS_CHANGED = 0x02
+_FRAME_HAS_EVENTS = 0x04
+_FRAME_KEY_CODES_CHANGED = 0x08  # keys down from a ScriptedEventSource, stored as key codes
+_FRAME_END_OF_RECORDING = 0x80
+_VALUE_NONE = 0
+_VALUE_FALSE = 1
+_VALUE_TRUE = 2
+_VALUE_INT = 3
+_VALUE_FLOAT = 4
+_VALUE_STRING = 5
+_VALUE_TUPLE = 6
+_VALUE_MOUSE_OFFSET = 7  # a position, stored as an offset from the mouse position in that frame
+
+
+def _writeVarint(outBytes, value):
+    """Internal function, appends a non-negative integer to a bytearray using 7 bits per byte"""
+    while value > 0x7F:
+        outBytes.append((value & 0x7F) | 0x80)
+        value = value >> 7
+    outBytes.append(value)
+
+
+def _readVarint(data, offset):
+    """Internal function, reads an integer written by _writeVarint, returns the value and the new offset"""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset = offset + 1
+        value = value | ((byte & 0x7F) << shift)
+        if byte < 0x80:
+            return value, offset
+        shift = shift + 7
+
+
+def _zigzagEncode(value):
+    """Internal function, maps signed integers to non-negative ones (0, -1, 1, -2 ... -> 0, 1, 2, 3 ...)"""
+    if value >= 0:
+        return value << 1
+    return ((-value) << 1) - 1
+
+
+def _zigzagDecode(value):
+    """Internal function, reverses _zigzagEncode"""
+    if value & 1:
+        return -((value + 1) >> 1)
+    return value >> 1
+
+
+class InputRecorder():
+    """
+    This class records all input to a SceneMgr (events, keys down, and mouse position) into a compact binary file.
+
+    The file can later be played back with an InputPlayer, which reproduces the session frame by frame.
+    This allows a problem seen while playing (for example, a slow frame a few minutes into a game)
+    to be reproduced exactly, profiled, and used as a benchmark.
+
+    Only the frames where something changed are written.  Mouse positions are stored as offsets from
+    the previous position, and keys are stored as the list of keys that went up or down.
+    Data is written as the program runs, so a recording can be as long as you want.
+
+    Typical use:
+
+    1)  Create an InputRecorder object before creating your scenes (it seeds the random number generator):
+
+        oInputRecorder = pyghelpers.InputRecorder('session.rec')
+
+    2)  Pass it to the run method of the SceneMgr:
+
+        oSceneMgr.run(oInputRecorder=oInputRecorder)
+
+    The recording is closed automatically when the SceneMgr quits.
+
+    For a recording to replay exactly, your scenes should only get random numbers from the
+    random module (which is seeded here), and should not depend on the real time.
+
+    Parameters:
+        | filePath - path of the file to write
+
+    Optional keyword parameter:
+        | seed - an integer seed for the random module (defaults to None, meaning pick a seed and save it in the recording)
+
+    Raises:
+        | ValueError if the seed is not an integer (only integer seeds can be saved in the recording)
+
+    """
+    def __init__(self, filePath, seed=None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), 'little')
+        elif not isinstance(seed, numbers.Integral):
+            raise ValueError('InputRecorder seed must be an integer, but got ' + repr(seed))
+        seed = int(seed)  # for example, a numpy integer
+        self.seed = seed
+        random.seed(seed)
+
+        self.oFile = open(filePath, 'wb')
+        headerBytes = bytearray(_RECORDING_MAGIC)
+        _writeVarint(headerBytes, _zigzagEncode(seed))
+        self.oFile.write(headerBytes)
+
+        self.lastRecordedFrame = -1
+        self.nFrames = 0
+        self.lastMousePos = (0, 0)
+        self.lastKeysDownTuple = None
+        self.lastKeysSet = frozenset()  # keys down, when they come from a ScriptedEventSource
+        self.attributeNamesDict = {}  # name: index, each name is written in full only once
+
+    def recordFrame(self, frameNumber, eventsList, keysDownList, mousePos):
+        """Called by the SceneMgr in every frame, to record the input for that frame
+
+        Parameters:
+            |    frameNumber - the number of the current frame (starting at 0)
+            |    eventsList - the list of events for this frame
+            |    keysDownList - the value returned by pygame.key.get_pressed() (or by a ScriptedEventSource)
+            |    mousePos - the mouse position, as returned by pygame.mouse.get_pos()
+
+        Raises:
+            |    ValueError if keysDownList is not from pygame.key.get_pressed() or a ScriptedEventSource
+
+        """
+        self.nFrames = frameNumber + 1
+        flags = 0
+        frameBytes = bytearray()
+
+        if mousePos != self.lastMousePos:
+            flags = flags | _FRAME_MOUSE_MOVED
+            _writeVarint(frameBytes, _zigzagEncode(mousePos[0] - self.lastMousePos[0]))
+            _writeVarint(frameBytes, _zigzagEncode(mousePos[1] - self.lastMousePos[1]))
+            self.lastMousePos = mousePos
+
+        # Comparing the whole tuple is fast, only look for the keys that changed when it differs
+        if isinstance(keysDownList, tuple) and (keysDownList != self.lastKeysDownTuple):
+            # pygame's ScancodeWrapper does not allow iterating, so get a plain tuple of its values
+            keysDownTuple = tuple(tuple.__iter__(keysDownList))
+            if self.lastKeysDownTuple is None:
+                self.lastKeysDownTuple = (False,) * len(keysDownTuple)
+            changedKeysList = [index for index, (isDown, wasDown) in
+                               enumerate(zip(keysDownTuple, self.lastKeysDownTuple)) if isDown != wasDown]
+            flags = flags | _FRAME_KEYS_CHANGED
+            _writeVarint(frameBytes, len(keysDownTuple))
+            _writeVarint(frameBytes, len(changedKeysList))
+            for index in changedKeysList:
+                _writeVarint(frameBytes, index)
+            self.lastKeysDownTuple = keysDownTuple
+        elif isinstance(keysDownList, _KeysDown):
+            if keysDownList.keysSet != self.lastKeysSet:
+                changedKeysList = sorted(keysDownList.keysSet ^ self.lastKeysSet)
+                flags = flags | _FRAME_KEY_CODES_CHANGED
+                _writeVarint(frameBytes, len(changedKeysList))
+                for key in changedKeysList:
+                    _writeVarint(frameBytes, key)
+                self.lastKeysSet = keysDownList.keysSet
+        elif not isinstance(keysDownList, tuple):
+            raise ValueError('InputRecorder cannot record keys down given as ' + str(type(keysDownList)) +
+                             ', use the value from pygame.key.get_pressed() or a ScriptedEventSource')
+
+        if eventsList != []:
+            flags = flags | _FRAME_HAS_EVENTS
+            _writeVarint(frameBytes, len(eventsList))
+            for event in eventsList:
+                self._writeEvent(frameBytes, event, mousePos)
+
+        if flags == 0:
+            return  # nothing changed in this frame, nothing to write
+
+        recordBytes = bytearray()
+        _writeVarint(recordBytes, frameNumber - self.lastRecordedFrame)
+        recordBytes.append(flags)
+        self.oFile.write(recordBytes + frameBytes)
+        self.lastRecordedFrame = frameNumber
+
+    def _writeEvent(self, outBytes, event, mousePos):
+        """Internal method, writes one event"""
+        attributesList = []
+        for name, value in event.dict.items():
+            valueBytes = bytearray()
+            if self._writeValue(valueBytes, value, name == 'pos', mousePos):
+                attributesList.append((name, valueBytes))
+
+        _writeVarint(outBytes, event.type)
+        _writeVarint(outBytes, len(attributesList))
+        for name, valueBytes in attributesList:
+            if name in self.attributeNamesDict:
+                _writeVarint(outBytes, (self.attributeNamesDict[name] << 1) | 1)
+            else:
+                self.attributeNamesDict[name] = len(self.attributeNamesDict)
+                nameBytes = name.encode('utf-8')
+                _writeVarint(outBytes, len(nameBytes) << 1)
+                outBytes.extend(nameBytes)
+            outBytes.extend(valueBytes)
+
+    def _writeValue(self, outBytes, value, isPosition, mousePos):
+        """Internal method, writes one event attribute value.  Returns False if the type cannot be recorded"""
+        if value is None:
+            outBytes.append(_VALUE_NONE)
+        elif value is False:
+            outBytes.append(_VALUE_FALSE)
+        elif value is True:
+            outBytes.append(_VALUE_TRUE)
+        elif isinstance(value, int):
+            outBytes.append(_VALUE_INT)
+            _writeVarint(outBytes, _zigzagEncode(value))
+        elif isinstance(value, float):
+            outBytes.append(_VALUE_FLOAT)
+            outBytes.extend(struct.pack('<d', value))
+        elif isinstance(value, str):
+            outBytes.append(_VALUE_STRING)
+            valueBytes = value.encode('utf-8')
+            _writeVarint(outBytes, len(valueBytes))
+            outBytes.extend(valueBytes)
+        elif isPosition and isinstance(value, tuple) and (len(value) == 2) and \
+                isinstance(value[0], int) and isinstance(value[1], int):
+            outBytes.append(_VALUE_MOUSE_OFFSET)
+            _writeVarint(outBytes, _zigzagEncode(value[0] - mousePos[0]))
+            _writeVarint(outBytes, _zigzagEncode(value[1] - mousePos[1]))
+        elif isinstance(value, (tuple, list)):
+            outBytes.append(_VALUE_TUPLE)
+            _writeVarint(outBytes, len(value))
+            for item in value:
+                if not self._writeValue(outBytes, item, False, mousePos):
+                    return False
+        else:
+            return False  # for example, a Window object, which cannot be recreated
+        return True
+
+    def close(self):
+        """Writes the end of the recording and closes the file (called automatically when the SceneMgr quits)"""
+        if self.oFile.closed:
+            return
+        endBytes = bytearray()
+        _writeVarint(endBytes, 0)
+        endBytes.append(_FRAME_END_OF_RECORDING)
+        _writeVarint(endBytes, self.nFrames)
+        self.oFile.write(endBytes)
+        self.oFile.close()
+
+
+class InputPlayer():
+    """
+    This class plays back a recording made by an InputRecorder, as an event source for SceneMgr.run()
+
+    Typical use:
+
+    1)  Create an InputPlayer object before creating your scenes (it seeds the random number generator
+        with the same seed that was used when recording):
+
+        oInputPlayer = pyghelpers.InputPlayer('session.rec')
+
+    2)  Pass it to the run method of the SceneMgr:
+
+        oSceneMgr.run(maxFrames=oInputPlayer.getNFrames(), throttle=False, oEventSource=oInputPlayer)
+
+    In every frame, the recorded events and keys down are given to the current scene,
+    and the mouse is moved to the recorded position (so pygame.mouse.get_pos() returns the recorded value).
+    While playing back, real events from the user are ignored.
+
+    Parameters:
+        | filePath - path of a file written by an InputRecorder
+
+    Raises:
+        | ValueError if the file is not a recording
+
+    """
+    def __init__(self, filePath):
+        with open(filePath, 'rb') as oFile:
+            self.data = oFile.read()
+        if not self.data.startswith(_RECORDING_MAGIC):
+            raise ValueError('File ' + str(filePath) + ' is not an InputRecorder recording')
+        seed, self.offset = _readVarint(self.data, len(_RECORDING_MAGIC))
+        self.seed = _zigzagDecode(seed)
+        random.seed(self.seed)
+
+        self.mousePos = (0, 0)
+        self.keysDownList = None
+        self.attributeNamesList = []
+        self.nFrames = None  # set when the end of the recording (or where it was cut off) is read
+        self.nCompleteFrames = 0  # frames up to the end of the last record that was read
+        self.nextFrame = -1
+        self._readNextFrameNumber()
+
+    def _readNextFrameNumber(self):
+        """Internal method, reads the frame number of the next record (or the end of the recording)"""
+        if self.offset >= len(self.data):  # recording was not closed properly, play what is there
+            self._endTruncatedRecording()
+            return
+        try:
+            frameDelta, offset = _readVarint(self.data, self.offset)
+            flags = self.data[offset]
+            if flags == _FRAME_END_OF_RECORDING:
+                self.nFrames, self.offset = _readVarint(self.data, offset + 1)
+                self.nextFrame = None
+                return
+        except IndexError:  # recording ends part way through a record
+            self._endTruncatedRecording()
+            return
+        self.offset = offset
+        self.nextFrame = self.nextFrame + frameDelta
+
+    def _endTruncatedRecording(self):
+        """Internal method, ends playback at the last complete frame of a recording that was cut off"""
+        self.offset = len(self.data)
+        self.nextFrame = None
+        self.nFrames = self.nCompleteFrames
+
+    def getNFrames(self):
+        """Returns the number of frames in the recording
+
+        If the recording was not closed properly (for example, the program crashed while recording),
+        returns the number of frames up to the last complete record, which is where playback ends.
+
+        """
+        if self.nFrames is not None:
+            return self.nFrames
+        # Not known yet, scan a copy of the remaining records to find the end
+        oScanner = copy.copy(self)
+        oScanner.attributeNamesList = list(self.attributeNamesList)
+        while oScanner.nextFrame is not None:
+            oScanner._readFrame()
+        return oScanner.nFrames
+
+    def isFinished(self):
+        """Returns True if all recorded frames have been played"""
+        return self.nextFrame is None
+
+    def getInputs(self, frameNumber):
+        """Called by the SceneMgr in every frame.
+
+        Parameter:
+            |    frameNumber - the number of the current frame (starting at 0)
+
+        Returns:
+            |    a tuple of (eventsList, keysDownList) for this frame
+
+        """
+        eventsList = []
+        if frameNumber == self.nextFrame:
+            mouseMoved, eventsList = self._readFrame()
+            if mouseMoved:
+                pygame.mouse.set_pos(self.mousePos)
+        if self.keysDownList is None:
+            return eventsList, _KeysDown(frozenset())
+        return eventsList, self.keysDownList
+
+    def _readFrame(self):
+        """Internal method, reads the record of the next frame.  Returns a tuple of (mouseMoved, eventsList)
+
+        If the recording was cut off part way through this record (for example, the program crashed
+        while recording), nothing from the record is used, and playback ends.
+
+        """
+        savedMousePos = self.mousePos
+        savedKeysDownList = self.keysDownList
+        try:
+            mouseMoved, eventsList, offset = self._readFrameRecord()
+        except (IndexError, struct.error, UnicodeDecodeError):
+            offset = len(self.data) + 1
+        if offset > len(self.data):  # a slice past the end does not raise an error, so check here too
+            self.mousePos = savedMousePos
+            self.keysDownList = savedKeysDownList
+            self._endTruncatedRecording()
+            return False, []
+
+        self.offset = offset
+        self.nCompleteFrames = self.nextFrame + 1
+        self._readNextFrameNumber()
+        return mouseMoved, eventsList
+
+    def _readFrameRecord(self):
+        """Internal method, parses the record of the next frame.  Returns a tuple of (mouseMoved, eventsList, new offset)"""
+        data = self.data
+        flags = data[self.offset]
+        offset = self.offset + 1
+
+        mouseMoved = (flags & _FRAME_MOUSE_MOVED) != 0
+        if mouseMoved:
+            dx, offset = _readVarint(data, offset)
+            dy, offset = _readVarint(data, offset)
+            self.mousePos = (self.mousePos[0] + _zigzagDecode(dx), self.mousePos[1] + _zigzagDecode(dy))
+
+        if flags & _FRAME_KEYS_CHANGED:
+            nKeys, offset = _readVarint(data, offset)
+            if self.keysDownList is None:
+                keysList = [False] * nKeys
+            else:
+                keysList = list(tuple.__iter__(self.keysDownList))
+            nChanged, offset = _readVarint(data, offset)
+            for count in range(nChanged):
+                index, offset = _readVarint(data, offset)
+                keysList[index] = not keysList[index]
+            self.keysDownList = pygame.key.ScancodeWrapper(keysList)
+
+        if flags & _FRAME_KEY_CODES_CHANGED:
+            if isinstance(self.keysDownList, _KeysDown):
+                keysSet = set(self.keysDownList.keysSet)
+            else:
+                keysSet = set()
+            nChanged, offset = _readVarint(data, offset)
+            for count in range(nChanged):
+                key, offset = _readVarint(data, offset)
+                keysSet.symmetric_difference_update({key})
+            self.keysDownList = _KeysDown(frozenset(keysSet))
+
+        eventsList = []
+        if flags & _FRAME_HAS_EVENTS:
+            nEvents, offset = _readVarint(data, offset)
+            for count in range(nEvents):
+                eventType, offset = _readVarint(data, offset)
+                nAttributes, offset = _readVarint(data, offset)
+                attributesDict = {}
+                for attributeCount in range(nAttributes):
+                    nameCode, offset = _readVarint(data, offset)
+                    if nameCode & 1:
+                        name = self.attributeNamesList[nameCode >> 1]
+                    else:
+                        nameLength = nameCode >> 1
+                        name = data[offset:offset + nameLength].decode('utf-8')
+                        offset = offset + nameLength
+                        self.attributeNamesList.append(name)
+                    attributesDict[name], offset = self._readValue(data, offset)
+                eventsList.append(pygame.event.Event(eventType, attributesDict))
+
+        return mouseMoved, eventsList, offset
+
+    def _readValue(self, data, offset):
+        """Internal method, reads one event attribute value.  Returns the value and the new offset"""
+        valueType = data[offset]
+        offset = offset + 1
+        if valueType == _VALUE_NONE:
+            return None, offset
+        if valueType == _VALUE_FALSE:
+            return False, offset
+        if valueType == _VALUE_TRUE:
+            return True, offset
+        if valueType == _VALUE_INT:
+            value, offset = _readVarint(data, offset)
+            return _zigzagDecode(value), offset
+        if valueType == _VALUE_FLOAT:
+            return struct.unpack_from('<d', data, offset)[0], offset + 8
+        if valueType == _VALUE_STRING:
+            length, offset = _readVarint(data, offset)
+            return data[offset:offset + length].decode('utf-8'), offset + length
+        if valueType == _VALUE_MOUSE_OFFSET:
+            dx, offset = _readVarint(data, offset)
+            dy, offset = _readVarint(data, offset)
+            return (self.mousePos[0] + _zigzagDecode(dx), self.mousePos[1] + _zigzagDecode(dy)), offset
+        # _VALUE_TUPLE
+        nItems, offset = _readVarint(data, offset)
+        itemsList = []
+        for count in range(nItems):
+            item, offset = self._readValue(data, offset)
+            itemsList.append(item)
+        return tuple(itemsList), offset
+
+
+#
+# GlyphCache class
+#
+class GlyphCache():
+    """
+    This class pre-renders the characters of a font, so text can be drawn by copying (blitting)
+    already rendered characters, instead of rendering the text with the font every time it changes.
+
+    It is intended for text that changes often but uses only a few characters, like numbers, times, and scores.
+    (Characters are drawn one at a time, so there is no kerning between them.)
+
+    Typical use:
+
+    1)  Create a GlyphCache object:
+
+        oGlyphCache = pyghelpers.GlyphCache(fontSize=36, textColor=(255, 255, 255))
+
+    2)  Whenever you want to draw some text:
+
+        oGlyphCache.draw(window, (10, 10), '12:34')
+
+        or get a surface with the text on it:
+
+        textSurface = oGlyphCache.render('12:34')
+
+    Optional keyword parameters:
+        | fontName - font file to use, or None for the pygame default font (defaults to None)
+        | fontSize - size of font to use (defaults to 24)
+        | textColor - rgb color of the text (defaults to white)
+        | characters - the characters to pre-render (defaults to digits and a few punctuation characters)
+        |              Any other character is rendered (and saved) the first time it is used
+
+    """
+    def __init__(self, fontName=None, fontSize=24, textColor=(255, 255, 255), characters='0123456789.:- '):
+        self.oFont = pygame.font.Font(fontName, fontSize)
+        self.textColor = textColor
+        self.height = self.oFont.get_height()
+        self.glyphsDict = {}
+        for character in characters:
+            self._addGlyph(character)
+
+    def _addGlyph(self, character):
+        """Internal method, renders one character and saves it"""
+        glyphSurface = self.oFont.render(character, True, self.textColor)
+        self.glyphsDict[character] = glyphSurface
+        return glyphSurface
+
+    def getSize(self, text):
+        """Returns the size (width, height) of the given text"""
+        width = 0
+        for character in text:
+            glyphSurface = self.glyphsDict.get(character)
+            if glyphSurface is None:
+                glyphSurface = self._addGlyph(character)
+            width = width + glyphSurface.get_width()
+        return width, self.height
+
+    def draw(self, window, loc, text):
+        """Draws the text in the window at the given location.  Returns the rect of the drawn text"""
+        x, y = loc
+        for character in text:
+            glyphSurface = self.glyphsDict.get(character)
+            if glyphSurface is None:
+                glyphSurface = self._addGlyph(character)
+            window.blit(glyphSurface, (x, y))
+            x = x + glyphSurface.get_width()
+        return pygame.Rect(loc[0], loc[1], x - loc[0], self.height)
+
+    def render(self, text):
+        """Returns a new surface (with a transparent background) containing the text"""
+        textSurface = pygame.Surface(self.getSize(text), flags=SRCALPHA)
+        self.draw(textSurface, (0, 0), text)
+        return textSurface
+
+
+#
+# FrameRateDisplay class
+#
+_MAX_DISPLAYED_FPS = 99999  # higher values (for example, in an unthrottled run) are shown as this
+_MAX_DISPLAYED_MS = 9999.9  # longer frame times are shown as this
+
+class FrameRateDisplay():
+    """
+    This class shows the frame rate (and time per frame), and optionally a graph of recent frame times.
+
+    It is designed to be cheap enough to leave on all the time:  the text only changes a few times
+    per second (refreshRate), it is drawn from pre-rendered characters (using a GlyphCache), and the
+    graph is kept in its own surface where only one new column is drawn per frame.
+
+    Typical use:
+
+    1)  Create a FrameRateDisplay object, and pass it in when creating the SceneMgr:
+
+        oFrameRateDisplay = pyghelpers.FrameRateDisplay(window, (0, 0), showGraph=True)
+
+        oSceneMgr = pyghelpers.SceneMgr(scenesDict, FRAMES_PER_SECOND, oFrameRateDisplay)
+
+        The SceneMgr will call its update() and draw() methods in every frame.
+
+    (If you use it in your own main loop, call update() and draw() once in every frame.)
+
+    Parameters:
+        | window - the window to draw in
+        | loc - location of the upper left corner of the display
+
+    Optional keyword parameters:
+        | refreshRate - number of times per second the numbers change (defaults to 4)
+        | fontSize - size of font to use (defaults to 20)
+        | textColor - rgb color of the text and graph (defaults to white)
+        | backgroundColor - rgb color drawn behind the display (defaults to black)
+        | showGraph - show a graph of recent frame times below the text (defaults to False)
+        | graphSize - tuple of (width, height) of the graph, one pixel wide column per frame (defaults to (120, 40))
+        | graphMaxMs - frame time in milliseconds shown as the full height of the graph (defaults to 50)
+
+    """
+    def __init__(self, window, loc=(0, 0), refreshRate=4, fontSize=20,
+                 textColor=(255, 255, 255), backgroundColor=(0, 0, 0),
+                 showGraph=False, graphSize=(120, 40), graphMaxMs=50):
+        self.window = window
+        self.loc = loc
+        self.secondsPerRefresh = 1.0 / refreshRate
+        self.backgroundColor = backgroundColor
+        self.textColor = textColor
+        self.oGlyphCache = GlyphCache(fontSize=fontSize, textColor=textColor,
+                                      characters='0123456789.:- FPSms')
+
+        # Leave room for the widest text (the values are limited to the number of digits of the maximums,
+        # and each digit can be the widest one), so old text is always covered
+        widestDigit = max('0123456789', key=lambda digit: self.oGlyphCache.getSize(digit)[0])
+        widestText = self._formatText(_MAX_DISPLAYED_FPS, _MAX_DISPLAYED_MS)
+        for digit in '0123456789':
+            widestText = widestText.replace(digit, widestDigit)
+        textWidth, textHeight = self.oGlyphCache.getSize(widestText)
+        self.textRect = pygame.Rect(loc[0], loc[1], textWidth, textHeight)
+        self.text = ''
+
+        self.showGraph = showGraph
+        if showGraph:
+            self.graphRect = pygame.Rect(loc[0], loc[1] + textHeight, graphSize[0], graphSize[1])
+            self.graphSurface = pygame.Surface(graphSize)
+            self.graphSurface.fill(backgroundColor)
+            self.graphMaxMs = graphMaxMs
+            self.rect = self.textRect.union(self.graphRect)
+        else:
+            self.rect = self.textRect
+
+        self.lastFrameTime = None
+        self.refreshStartTime = None
+        self.nFramesSinceRefresh = 0
+
+    def update(self):
+        """Call this once in every frame (the SceneMgr does this for you)"""
+        now = time.perf_counter()
+        if self.lastFrameTime is None:  # first frame
+            self.lastFrameTime = now
+            self.refreshStartTime = now
+            return
+
+        if self.showGraph:
+            frameMs = (now - self.lastFrameTime) * 1000.0
+            graphWidth, graphHeight = self.graphSurface.get_size()
+            barHeight = min(graphHeight, int(frameMs * graphHeight / self.graphMaxMs))
+            # Move the graph one pixel to the left, and draw the new frame in the rightmost column
+            self.graphSurface.scroll(-1, 0)
+            self.graphSurface.fill(self.backgroundColor, (graphWidth - 1, 0, 1, graphHeight))
+            self.graphSurface.fill(self.textColor, (graphWidth - 1, graphHeight - barHeight, 1, barHeight))
+        self.lastFrameTime = now
+
+        self.nFramesSinceRefresh = self.nFramesSinceRefresh + 1
+        secondsSinceRefresh = now - self.refreshStartTime
+        if secondsSinceRefresh >= self.secondsPerRefresh:
+            fps = min(self.nFramesSinceRefresh / secondsSinceRefresh, _MAX_DISPLAYED_FPS)
+            msPerFrame = min((secondsSinceRefresh * 1000.0) / self.nFramesSinceRefresh, _MAX_DISPLAYED_MS)
+            self.text = self._formatText(fps, msPerFrame)
+            self.refreshStartTime = now
+            self.nFramesSinceRefresh = 0
+
+    def _formatText(self, fps, msPerFrame):
+        """Internal method, returns the text shown for a frame rate and time per frame"""
+        return f'FPS: {fps:.0f}  {msPerFrame:.1f} ms'
+
+    def draw(self):
+        """Draws the display in the window"""
+        self.window.fill(self.backgroundColor, self.textRect)
+        self.oGlyphCache.draw(self.window, self.loc, self.text)
+        if self.showGraph:
+            self.window.blit(self.graphSurface, self.graphRect)
+
+    def getRect(self):
+        """Returns the rect of the area of the window used by the display"""
+        return self.rect
+
+
+#
+# FrameProfiler class
+#
+class FrameProfiler():
+    """
+    This class is used to measure how long each phase of a SceneMgr frame takes, separately for each scene.
+
+    It keeps the timings of the most recent frames in a fixed size ring buffer (per scene),
+    so it uses a constant amount of memory no matter how long the program runs.
+
+    Typical use:
+
+    1)  Create a FrameProfiler object, and pass it in when creating the SceneMgr:
+
+        oFrameProfiler = pyghelpers.FrameProfiler()
+
+        oSceneMgr = pyghelpers.SceneMgr(scenesDict, FRAMES_PER_SECOND, oFrameProfiler=oFrameProfiler)
+
+    2)  At any time (for example, when the program ends or when a key is pressed), ask for the stats:
+
+        statsDict = oFrameProfiler.getStats(sceneKey)
+
+        or print a summary of all scenes:
+
+        print(oFrameProfiler.getReport())
+
+    The phases that are timed are:
+
+        | 'events' - getting the events and the keys that are down
+        | 'handleInputs' - the scene's handleInputs() method
+        | 'update' - the scene's update() method
+        | 'draw' - the scene's draw() method
+        | 'display' - updating the window (pygame.display.update)
+        | 'sleep' - time spent waiting in clock.tick to maintain the frame rate
+
+    A frame is counted as "over budget" if the time of all phases other than 'sleep'
+    is more than the time allowed for one frame (1 / frames per second).
+
+    Optional keyword parameter:
+        | nFrames - number of recent frames kept per scene (defaults to 600)
+
+    """
+    PHASES = ('events', 'handleInputs', 'update', 'draw', 'display', 'sleep')
+
+    def __init__(self, nFrames=600):
+        self.nFrames = nFrames
+        self.scenesDict = {}  # sceneKey: list of [phaseArraysList, nextIndex, nFramesRecorded, nOverBudget]
+
+    def _recordFrame(self, sceneKey, timesList, budgetSeconds):
+        """Internal method, called by the SceneMgr once per frame
+
+        Parameters:
+            |    sceneKey - key of the scene that was current at the start of the frame
+            |    timesList - list of seven time.perf_counter() values, taken at the start of the frame
+            |                and at the end of each of the phases
+            |    budgetSeconds - seconds allowed for one frame (None means no budget)
+
+        """
+        sceneTimings = self.scenesDict.get(sceneKey)
+        if sceneTimings is None:
+            phaseArraysList = [array.array('d', bytes(8 * self.nFrames)) for phase in FrameProfiler.PHASES]
+            sceneTimings = [phaseArraysList, 0, 0, 0]
+            self.scenesDict[sceneKey] = sceneTimings
+
+        phaseArraysList, index, nFramesRecorded, nOverBudget = sceneTimings
+        for phaseIndex, phaseArray in enumerate(phaseArraysList):
+            phaseArray[index] = timesList[phaseIndex + 1] - timesList[phaseIndex]
+        if (budgetSeconds is not None) and ((timesList[5] - timesList[0]) > budgetSeconds):
+            sceneTimings[3] = nOverBudget + 1
+        sceneTimings[1] = (index + 1) % self.nFrames
+        sceneTimings[2] = nFramesRecorded + 1
+
+    def getSceneKeys(self):
+        """Returns a list of the keys of all scenes that have recorded timings"""
+        return list(self.scenesDict)
+
+    def getStats(self, sceneKey):
+        """Returns the timing statistics for one scene
+
+        Parameter:
+            |    sceneKey - the scene key of the scene
+
+        Returns:
+            |    a dictionary that looks like this (all times are in milliseconds):
+            |       {'nFrames': <frames recorded>, 'nOverBudget': <frames over budget>,
+            |        'events': {'p50': <ms>, 'p95': <ms>, 'p99': <ms>, 'max': <ms>},
+            |        'handleInputs': {...}, 'update': {...}, 'draw': {...}, 'display': {...}, 'sleep': {...}}
+            |    The percentiles and max are based on the most recent nFrames frames.
+
+        Raises:
+            |    KeyError if no timings have been recorded for the scene key
+
+        """
+        if sceneKey not in self.scenesDict:
+            raise KeyError('No frame timings have been recorded for scene ' + str(sceneKey))
+        phaseArraysList, index, nFramesRecorded, nOverBudget = self.scenesDict[sceneKey]
+        nSamples = min(nFramesRecorded, self.nFrames)
+
+        statsDict = {'nFrames': nFramesRecorded, 'nOverBudget': nOverBudget}
+        for phase, phaseArray in zip(FrameProfiler.PHASES, phaseArraysList):
+            samplesList = sorted(phaseArray[:nSamples])
+            phaseStatsDict = {}
+            for name, percent in (('p50', 50), ('p95', 95), ('p99', 99)):
+                sampleIndex = min(nSamples - 1, (nSamples * percent) // 100)
+                phaseStatsDict[name] = samplesList[sampleIndex] * 1000.0
+            phaseStatsDict['max'] = samplesList[-1] * 1000.0
+            statsDict[phase] = phaseStatsDict
+        return statsDict
+
+    def getReport(self):
+        """Returns a multi-line string summarizing the timings of all scenes"""
+        linesList = []
+        for sceneKey in self.scenesDict:
+            statsDict = self.getStats(sceneKey)
+            linesList.append(f"Scene {sceneKey}: {statsDict['nFrames']} frames, "
+                             f"{statsDict['nOverBudget']} over budget  (ms: p50 / p95 / p99 / max)")
+            for phase in FrameProfiler.PHASES:
+                phaseStatsDict = statsDict[phase]
+                linesList.append(f"    {phase:>12}: {phaseStatsDict['p50']:7.3f} / {phaseStatsDict['p95']:7.3f} / "
+                                 f"{phaseStatsDict['p99']:7.3f} / {phaseStatsDict['max']:7.3f}")
+        return '\n'.join(linesList)
+
+    def reset(self):
+        """Removes all recorded timings"""
+        self.scenesDict = {}
+
+
+#
+# SimulationProcess class
+#
+_SIMULATION_HEADER_SIZE = 16  # bytes before the two state buffers: number published, number being written
+_SIMULATION_READ_TRIES = 4  # times getState tries to copy the state before keeping the previous copy
+
+def _simulationWorker(simulateFunction, sharedMemoryName, nValues, updatesPerSecond, oInputQueue, oStopEvent):
+    """Internal function, the main loop of the process started by SimulationProcess.start
+
+    The state is kept in a local array, which is passed to simulateFunction in every update.
+    After each update, it is copied to one of the two shared buffers (update number n goes to buffer n % 2),
+    and the number of the update is published.  The number being written is saved first, so the reader can
+    tell if the buffer it copied was being overwritten.
+
+    """
+    oSharedMemory = shared_memory.SharedMemory(name=sharedMemoryName)
+    headerView = oSharedMemory.buf[:_SIMULATION_HEADER_SIZE].cast('q')
+    bufferSize = nValues * 8
+    buffersList = [oSharedMemory.buf[_SIMULATION_HEADER_SIZE:_SIMULATION_HEADER_SIZE + bufferSize].cast('d'),
+                   oSharedMemory.buf[_SIMULATION_HEADER_SIZE + bufferSize:].cast('d')]
+    stateArray = array.array('d', bytes(buffersList[0]))  # starting values
+    dt = 1.0 / updatesPerSecond
+    nextUpdateTime = time.perf_counter()
+    updateNumber = 0
+    try:
+        while not oStopEvent.is_set():
+            inputsList = []
+            while True:
+                try:
+                    inputsList.append(oInputQueue.get_nowait())
+                except queue.Empty:
+                    break
+
+            simulateFunction(stateArray, inputsList, dt)
+
+            updateNumber = updateNumber + 1
+            headerView[1] = updateNumber  # writing
+            buffersList[updateNumber % 2][:] = stateArray
+            headerView[0] = updateNumber  # published
+
+            nextUpdateTime = nextUpdateTime + dt
+            waitTime = nextUpdateTime - time.perf_counter()
+            if waitTime > 0:
+                time.sleep(waitTime)
+            else:
+                nextUpdateTime = time.perf_counter()  # fell behind, don't try to catch up
+    finally:
+        headerView.release()
+        for bufferView in buffersList:
+            bufferView.release()
+        oSharedMemory.close()
+
+class SimulationProcess():
+    """
+    This class runs the simulation (update) of a scene in a separate process, so it can use another core.
+    The main process handles the input and the drawing, while the simulation runs at its own fixed rate.
+
+    The state of the simulation is an array of floats (for example, x, y, speedX, speedY for each entity).
+    It is kept in shared memory, in two buffers:  the worker process writes each new state into one buffer,
+    while the main process copies the last complete state from the other.  Neither side waits for the other.
+
+    Inputs are sent to the worker process through a multiprocessing Queue.
+
+    On platforms where new processes are started with "spawn" (Windows and macOS), the worker process
+    imports your main program.  So the code that creates the window and runs the SceneMgr must be inside:
+
+        if __name__ == '__main__':
+
+    otherwise, each worker process would start another copy of the game.
+
+    Typical use:
+
+    1)  Write a simulation function at the top level of a module (so it can be used in another process):
+
+        def simulate(stateArray, inputsList, dt):
+            # Change stateArray (array of floats) in place, inputsList is what was sent since the last update
+
+    2)  Create a SimulationProcess object (typically in the enter method of a scene), and start it:
+
+        self.oSimulation = pyghelpers.SimulationProcess(simulate, N_ENTITIES * 4, updatesPerSecond=60)
+        self.oSimulation.start(startingValuesList)
+
+    3)  In handleInputs, send any input the simulation needs:
+
+        self.oSimulation.sendInput(('jump', playerNumber))
+
+    4)  In draw, get the latest state and draw it:
+
+        stateArray = self.oSimulation.getState()
+
+    5)  When the scene is left, stop the process:
+
+        self.oSimulation.stop()
+
+    Parameters:
+        | simulateFunction - a function called as simulateFunction(stateArray, inputsList, dt) in the worker process
+        | nValues - the number of floats in the state
+
+    Optional keyword parameters:
+        | updatesPerSecond - the number of times per second the simulation function is called (defaults to 60)
+
+    """
+    def __init__(self, simulateFunction, nValues, updatesPerSecond=60):
+        self.simulateFunction = simulateFunction
+        self.nValues = nValues
+        self.updatesPerSecond = updatesPerSecond
+        self.stateArray = array.array('d', bytes(nValues * 8))
+        self.copyArray = array.array('d', bytes(nValues * 8))  # getState copies here, then swaps
+        self.nUpdates = 0
+        self.oSharedMemory = None
+        self.oProcess = None
+
+    def start(self, startingValuesList=None):
+        """Creates the shared memory, and starts the worker process
+
+        Optional keyword parameter:
+            | startingValuesList - a list (or array) of nValues floats, the starting state (defaults to None, all zeros)
+            |     (to continue from where a stopped simulation left off, pass in the array from getState)
+
+        Raises:
+            | ValueError if the simulation is already running, or startingValuesList does not have nValues values
+
+        """
+        if self.oProcess is not None:
+            raise ValueError('Attempting to start a SimulationProcess that is already running')
+        if startingValuesList is not None:
+            if len(startingValuesList) != self.nValues:
+                raise ValueError('SimulationProcess has ' + str(self.nValues) + ' values, but startingValuesList has ' +
+                                 str(len(startingValuesList)))
+            self.stateArray = array.array('d', startingValuesList)
+        else:  # also when restarting after stop, the simulation does not continue from the last state
+            self.stateArray = array.array('d', bytes(self.nValues * 8))
+
+        bufferSize = self.nValues * 8
+        self.oSharedMemory = shared_memory.SharedMemory(create=True, size=_SIMULATION_HEADER_SIZE + (2 * bufferSize))
+        self.headerView = self.oSharedMemory.buf[:_SIMULATION_HEADER_SIZE].cast('q')
+        secondBufferStart = _SIMULATION_HEADER_SIZE + bufferSize
+        self.buffersList = [self.oSharedMemory.buf[_SIMULATION_HEADER_SIZE:secondBufferStart].cast('d'),
+                            self.oSharedMemory.buf[secondBufferStart:].cast('d')]
+        self.buffersList[0][:] = self.stateArray  # update 0 is the starting state
+        self.headerView[0] = 0
+        self.headerView[1] = 0
+        self.nUpdates = 0
+
+        self.oInputQueue = multiprocessing.Queue()
+        self.oStopEvent = multiprocessing.Event()
+        self.oProcess = multiprocessing.Process(target=_simulationWorker,
+                                                args=(self.simulateFunction, self.oSharedMemory.name, self.nValues,
+                                                      self.updatesPerSecond, self.oInputQueue, self.oStopEvent),
+                                                daemon=True)  # ends if the main program ends
+        self.oProcess.start()
+
+    def sendInput(self, inputData):
+        """Sends input to the simulation, passed in the inputsList of its next update
+
+        Parameter:
+            | inputData - any data that can be pickled (for example, a tuple)
+
+        """
+        self.oInputQueue.put(inputData)
+
+    def getState(self):
+        """Returns an array of the nValues floats of the latest complete state of the simulation
+
+        The array is a copy, owned by the main process.  It is only valid until the next call to getState.
+        (If the simulation is not running, returns the last state that was copied.)
+
+        """
+        if self.oProcess is None:
+            return self.stateArray
+        headerView = self.headerView
+        for tryNumber in range(_SIMULATION_READ_TRIES):
+            nPublished = headerView[0]
+            self.copyArray[:] = array.array('d', self.buffersList[nPublished % 2])
+            if headerView[1] < (nPublished + 2):  # the worker did not start overwriting this buffer while copying
+                self.stateArray, self.copyArray = self.copyArray, self.stateArray
+                self.nUpdates = nPublished
+                break
+        return self.stateArray
+
+    def getNUpdates(self):
+        """Returns the number of updates done by the simulation (as of the last call to getState)"""
+        return self.nUpdates
+
+    def isRunning(self):
+        """Returns True if the worker process is running"""
+        return (self.oProcess is not None) and self.oProcess.is_alive()
+
+    def stop(self):
+        """Stops the worker process, and frees the shared memory.  The last state is still available from getState"""
+        if self.oProcess is None:
+            return
+        self.getState()  # keep the last state
+        self.oStopEvent.set()
+        self.oProcess.join()
+        self.oProcess = None
+        self.oInputQueue.close()
+        self.headerView.release()
+        for bufferView in self.buffersList:
+            bufferView.release()
+        self.buffersList = []
+        self.oSharedMemory.close()
+        self.oSharedMemory.unlink()
+        self.oSharedMemory = None
+
+
+#
+# Awaitables used by scene scripts
+#
+class _WaitSeconds():
+    """Internal class, awaited in a scene script to wait for some number of seconds"""
+    def __init__(self, seconds):
+        self.endTime = _getTime() + seconds
+
+    def _isReady(self):
+        return _getTime() >= self.endTime
+
+    def __await__(self):
+        yield self
+
+
+class _NextFrame():
+    """Internal class, awaited in a scene script to wait until the next frame"""
+    def _isReady(self):
+        return True
+
+    def __await__(self):
+        yield self
+
+
+def _mergeRects(rectsList):
+    """Internal function, returns a list of rects where any overlapping rects have been combined"""
+    mergedRectsList = []
+    for rect in rectsList:
+        rect = pygame.Rect(rect)
+        index = 0
+        while index < len(mergedRectsList):
+            if rect.colliderect(mergedRectsList[index]):
+                # Absorb the overlapping rect, then start over since the new rect is bigger
+                rect.union_ip(mergedRectsList.pop(index))
+                index = 0
+            else:
+                index = index + 1
+        mergedRectsList.append(rect)
+    return mergedRectsList
+
+def _getDrawnRect(oWidget):
+    """Internal function, returns a copy of the rect of a widget, or None if it is not visible"""
+    rect = oWidget.getRect()
+    if (rect is None) or (not oWidget.visible):
+        return None
+    return pygame.Rect(rect)
+
+def _getWidgetDrawSignature(oWidget):
+    """Internal function, returns a tuple of everything about a widget that changes where or how it is drawn"""
+    rect = oWidget.getRect()
+    if rect is not None:
+        rect = tuple(rect)
+    return (_getWidgetSignature(oWidget), rect, getattr(oWidget, 'value', None),
+            getattr(oWidget, 'buttonDown', None), id(getattr(oWidget, 'image', None)))
+
+class _WidgetRegistry():
+    """Internal class, the widgets added to a scene with addWidget, and where each one was last drawn"""
+    def __init__(self):
+        # [zOrder, sequence number, oWidget, alwaysRedraw, signature, drawn rect] in drawing order
+        self.entriesList = []
+        self.sequenceNumber = 0
+        self.removedRectsList = []  # areas of removed widgets, drawn over in the next frame
+        self.sceneChangeNumber = None  # SceneMgr's sceneChangeNumber when all widgets were last drawn
+
+    def add(self, oWidget, zOrder, alwaysRedraw):
+        self.sequenceNumber = self.sequenceNumber + 1
+        self.entriesList.append([zOrder, self.sequenceNumber, oWidget, alwaysRedraw, None, None])
+        self.entriesList.sort(key=lambda entry: (entry[0], entry[1]))  # same zOrder, drawn in the order added
+
+    def remove(self, oWidget):
+        for entry in self.entriesList:
+            if entry[2] is oWidget:
+                self.entriesList.remove(entry)
+                if entry[5] is not None:
+                    self.removedRectsList.append(entry[5])
+                return
+        raise ValueError('Attempting to remove a widget that was not added with addWidget')
+
+
+#
+# Scene Manager
+#
+class SceneMgr():
+    """SceneMgr (Scene Manager)  allows you to build a program with multiple scenes.
+
+    The SceneMgr manages any number of scenes built as subclasses of the "Scene" class.
+    For more details, see the "Scene" class.
+
+    Typical use:
+
+    1) Instantiate as many Scenes as you want:
+        |  oScene1 = StartingScene(window)
+        |  oScene2 = MainScene(window)
+        |  oScene3 = SomeOtherScene(window)
+
+    2) Build a dictionary of these scenes:
+        |  myScenesDict = {'sceneKey1': oScene1, 'sceneKey2': oScene2, 'sceneKey3': oScene3}
+
+        The keys are any unique strings that you want to use.
+
+        Instead of a scene object, the value of any entry can be a scene class or a function that builds the scene
+        (a "factory").  That scene is only built the first time it is needed (by goToScene, request, or send):
+            |  myScenesDict = {'sceneKey1': oScene1, 'level1': Level1Scene, 'level2': lambda: LevelScene(window, 2)}
+        A scene class is instantiated with the window as its only argument; a function is called with no arguments.
+        If you pass maxLoadedScenes, scenes built from factories that have not been used recently
+        are removed to save memory, and rebuilt if they are needed again.
+        To avoid a pause when going to a scene, a scene can ask for another scene to be built
+        ahead of time on a background thread, by calling prefetchScene().
+
+            OLDER APPROACH:  Before pyghelpers 1.1, but still works for backwards compatibility
+            Build a list of the scenes:
+            | myScenesList = [oScene1, oScene2, oScene3]
+
+    3) Instantiate *one* SceneMgr (a singleton):
+        |  oSceneMgr = SceneMgr(myScenesDict, 30) # First scene in the dict is the starting scene
+
+            OLDER APPROACH:  Before pyghelpers 1.1, but still works for backwards compatibility
+                oSceneMgr = SceneMgr(myScenesList, 30) # First scene in the list is the starting scene
+
+        You can optionally pass a FrameRateDisplay object for showing the frame rate, e.g.
+        |  oFrameRateDisplay = FrameRateDisplay(window, (0, 0), showGraph=True)
+        |  oSceneMgr = SceneMgr(scenesDictOrList, FRAMES_PER_SECOND, oFrameRateDisplay)
+        (For backwards compatibility, you can also pass a DisplayText object.)
+
+        You can optionally turn on "dirty rect" mode, where only the changed areas of the window are updated:
+        |  oSceneMgr = SceneMgr(scenesDictOrList, FRAMES_PER_SECOND, useDirtyRects=True)
+        In this mode, each scene's draw() method should return a list of the rects that it changed
+        (or register them by calling addDirtyRect()).  See the Scene class for details.
+
+        You can optionally run the simulation at a fixed rate, independent of the frame rate:
+        |  oSceneMgr = SceneMgr(scenesDictOrList, FRAMES_PER_SECOND, fixedUpdatesPerSecond=60)
+        In this mode, each scene's update() method is called with the fixed time step (in seconds),
+        zero or more times per frame, and draw() is called once per frame with an "alpha" value
+        (0.0 up to 1.0) telling how far the time is between the last update and the next one.
+        You can use alpha to interpolate positions for smooth drawing.
+
+    4) Call the run method to start the SceneMgr running:
+        |  oSceneMgr.run()  # First scene in the list is the starting scene
+
+
+    Parameters:
+        | scenesDictOrList - is a dictionary or list that consists of:
+        |    {<sceneKey>: <sceneObject>, <sceneKey>: <sceneObject>, ...}
+        |    OR older (before pyghelpers 1.1):  [<sceneObject>, <sceneObject>, ...]
+        |      where each sceneObject is an object instantiated from a scene class
+        |      (For details on Scenes, see the Scene class)
+        | fps - is the frames per second at which the program should run
+
+    Optional keyword parameters:
+        | oFrameRateDisplay - a FrameRateDisplay (or DisplayText) object used to show the frame rate (defaults to None)
+        | useDirtyRects - only update the areas of the window that scenes report as changed (defaults to False)
+        | dirtyRectThreshold - fraction of the window area above which the whole window is updated
+        |                      instead of the individual rects (defaults to 0.5)
+        | fixedUpdatesPerSecond - if specified, the number of times per second that update(dt) is called,
+        |                      independent of the frame rate (defaults to None, update() called once per frame)
+        | maxUpdatesPerFrame - in fixed update mode, the maximum number of updates done in a single frame
+        |                      (if the program falls further behind, the extra time is dropped) (defaults to 5)
+        | oFrameProfiler - a FrameProfiler object used to time each phase of every frame (defaults to None)
+        | maxLoadedScenes - the maximum number of scenes built from factories to keep at one time
+        |                      The least recently used ones are removed when there are more (defaults to None, no limit)
+        | nPrefetchThreads - number of background threads used by prefetchScene (defaults to 2)
+        | oTimerMgr - a TimerMgr object, updated once per frame (defaults to None, the SceneMgr creates one)
+
+    Based on the concept of a "Scene Manager" by Blake O'Hare of Nerd Paradise (nerdparadise.com)
+
+    """
+    def __init__(self, scenesDictOrList, fps, oFrameRateDisplay=None,
+                 useDirtyRects=False, dirtyRectThreshold=0.5,
+                 fixedUpdatesPerSecond=None, maxUpdatesPerFrame=5,
+                 oFrameProfiler=None, maxLoadedScenes=None, nPrefetchThreads=2, oTimerMgr=None):
+
+        self.sceneFactoriesDict = {}  # sceneKey: class or function that builds the scene
+        self.recentlyUsedDict = collections.OrderedDict()  # keys of scenes built from factories, oldest use first
+        self.scenesToEvictList = []
+        self.maxLoadedScenes = maxLoadedScenes
+        self.pendingScenesDict = {}  # sceneKey: Future of a scene being prefetched
+        self.sceneStackList = []  # (sceneKey, oScene, oSnapshot) of each scene covered by an overlay scene
+        self.oCoveredSceneSnapshot = None  # image of the window when the current overlay scene was pushed
+        self.window = None  # set in run
+        self.oPrefetchExecutor = None
+        self.nPrefetchThreads = nPrefetchThreads
+        if oTimerMgr is None:
+            oTimerMgr = TimerMgr()
+        self.oTimerMgr = oTimerMgr
+        # Index used by sendAll, so a message only goes to the scenes that want it (see Scene.subscribe).
+        # Set up before the starting scene is built, because building a scene adds it to the index.
+        self.receiveAllScenesDict = {}  # oScene: None for each scene that receives every message
+        self.receiversDict = {}  # sendID: {oScene: None} for each scene that subscribed to that sendID
+        self.sceneSendIDsDict = {}  # oScene: set of the sendIDs it subscribed to
+        self.queuedMessagesList = []  # (oSenderScene, sendID, info) sent with sendAll(queued=True)
+        self.cachedResponsesDict = {}  # oScene: {requestID: info} of responses in the scene's cacheableRequestIDs
+
+        # Newer approach (pyghelpers 1.1), pass in a dictionary of {scene keys: scene objects}
+        # (No need to have each scene implement a getSceneKey method.)
+        if isinstance(scenesDictOrList, dict):
+            self.scenesDict = {}
+            for key, sceneOrFactory in scenesDictOrList.items():
+                if isinstance(sceneOrFactory, Scene):
+                    self.scenesDict[key] = sceneOrFactory
+                else:
+                    self.sceneFactoriesDict[key] = sceneOrFactory  # built when first needed
+            keysList = list(scenesDictOrList)  # get all the keys
+            startingKey = keysList[0]  # first key is the starting scene ley
+            self.currentSceneKey = startingKey
+            self.oCurrentScene = self._getScene(startingKey)
+
+        else:  # Older style, we start with a list of scenes
+            # Build a dictionary, each entry of which is a scene key : scene object
+            # Then we call getSceneKey so each scene can identify itself
+            self.scenesDict = {}
+            for oScene in scenesDictOrList:
+                key = oScene.getSceneKey()  # Each scene must return a unique key to identify itself
+                self.scenesDict[key] = oScene
+            # The first element in the list is the used as the starting scene
+            self.oCurrentScene = scenesDictOrList[0]
+            self.currentSceneKey = self.oCurrentScene.getSceneKey()
+
+        self.framesPerSecond = fps
+        self.oFrameRateDisplay = oFrameRateDisplay
+        self.showFrameRate = oFrameRateDisplay is not None  # for fast checking in main loop
+        self.frameRateDisplayIsText = not isinstance(oFrameRateDisplay, FrameRateDisplay)
+        self.scenesToRemoveList = []
+        self.scriptsList = []  # [oScene, coroutine, awaitable it is waiting for] of each running script
+        self.runningScript = None  # the script being resumed now (it cannot be closed until it awaits again)
+        self.useDirtyRects = useDirtyRects
+        self.dirtyRectThreshold = dirtyRectThreshold
+        self.dirtyRectsList = []  # rects registered by the current scene in this frame
+        self.forceFullUpdate = True  # first frame of a scene always updates the whole window
+        self.sceneChangeNumber = 0  # counts scene changes, so scenes know when all their widgets must be drawn
+        self.fixedUpdatesPerSecond = fixedUpdatesPerSecond
+        self.maxUpdatesPerFrame = maxUpdatesPerFrame
+        self.oFrameProfiler = oFrameProfiler
+        self.exitOnQuit = True  # set in run, False when running for a limited number of frames
+        self.quitRequested = False
+        self.oInputRecorder = None
+        self.eventTypesSet = None  # event types wanted by the current scene, None means all
+        self.routeEvents = False
+        self.currentEventsList = []
+        self.eventsByTypeDict = None
+
+        # Give each scene a reference back to the SceneMgr.
+        # This allows any scene to do a goToScene, request, send,
+        # or sendAll, which gets forwarded to the scene manager.
+        for key, oScene in self.scenesDict.items():
+            oScene._setRefToSceneMgr(self)
+            self._indexScene(oScene)
+
+    def run(self, maxFrames=None, throttle=True, oEventSource=None, oInputRecorder=None):
+        """
+        This method implements the main pygame loop.
+
+        It should typically be called as the last line of your main program.
+
+        It is designed to call a standardized set of methods in the current scene.
+
+        All scenes must implement the following methods (polymorphism):
+            |   handleInputs()  # called in every frame
+            |   draw()          # called in every frame
+
+        The following methods can be implemented in a scene:
+            |   enter()  # called once whenever the scene is entered
+            |   update()  # called in every frame
+            |   leave()  # called once whenever the scene is left
+
+        If any is not implemented, then the version in the Scene base class,
+        which only performs a pass statement, will be used.
+
+        If the SceneMgr was created with fixedUpdatesPerSecond, update(dt) is called at
+        that fixed rate instead, and draw(alpha) is called once per frame.
+
+        The optional parameters are intended for testing and benchmarking, typically together
+        with setHeadlessMode() so that no window is shown.  For example:
+            |   nFrames = oSceneMgr.run(maxFrames=100000, throttle=False, oEventSource=oScriptedEventSource)
+
+        Optional keyword parameters:
+            |   maxFrames - the number of frames to run (defaults to None, meaning run until the user quits)
+            |       If specified, this method returns (rather than exiting the program) when that number of frames
+            |       have run or when a scene quits, and pygame is left initialized.
+            |   throttle - if False, do not wait in each frame to maintain the frame rate (defaults to True)
+            |   oEventSource - an object (like a ScriptedEventSource) whose getInputs(frameNumber) method
+            |       returns a tuple of (eventsList, keysDownList) used instead of the real events and keys
+            |       (defaults to None, meaning use pygame.event.get() and pygame.key.get_pressed())
+            |   oInputRecorder - an InputRecorder object, used to record all input in every frame (defaults to None)
+            |       To play back a recording, pass an InputPlayer object as the oEventSource
+
+        Returns:
+            |   the number of frames that were run (only when maxFrames is specified)
+
+        """
+        clock = pygame.time.Clock()
+        self.window = pygame.display.get_surface()
+        self.exitOnQuit = maxFrames is None
+        self.quitRequested = False
+        self.oInputRecorder = oInputRecorder
+        if throttle:
+            tickFramesPerSecond = self.framesPerSecond
+        else:
+            tickFramesPerSecond = 0  # clock.tick(0) never waits
+        frameNumber = 0
+        useFixedUpdates = self.fixedUpdatesPerSecond is not None
+        if useFixedUpdates:
+            secondsPerUpdate = 1.0 / self.fixedUpdatesPerSecond
+            maxAccumulatedTime = secondsPerUpdate * self.maxUpdatesPerFrame
+            accumulatedTime = 0.0
+            lastTime = _getTime()
+
+        # When profiling, save the time at the start of the frame and at the end of each phase
+        oFrameProfiler = self.oFrameProfiler
+        profiling = oFrameProfiler is not None
+        if profiling:
+            perfCounter = time.perf_counter
+            phaseTimesList = [0.0] * 7
+            if self.framesPerSecond > 0:
+                budgetSeconds = 1.0 / self.framesPerSecond
+            else:
+                budgetSeconds = None
+
+        self._setAllowedEvents()
+
+        # 6 - Loop forever (or for maxFrames frames)
+        while frameNumber != maxFrames:
+            if profiling:
+                profiledSceneKey = self.currentSceneKey
+                phaseTimesList[0] = perfCounter()
+            _oClock.tick()  # timers all see the same time during a frame
+
+            # If there are any scenes to be removed (keys added by removeScene method)
+            if self.scenesToRemoveList != []:
+                for key in self.scenesToRemoveList:
+                    oFuture = self.pendingScenesDict.pop(key, None)
+                    if oFuture is not None:
+                        oFuture.cancel()
+                    self._unindexScene(self.scenesDict.pop(key, None))
+                    self.sceneFactoriesDict.pop(key, None)
+                    self.recentlyUsedDict.pop(key, None)
+                self.scenesToRemoveList = []  # reset
+
+            # Add any scenes that have finished being prefetched
+            if self.pendingScenesDict != {}:
+                for key, oFuture in list(self.pendingScenesDict.items()):
+                    if oFuture.done():
+                        self._collectPrefetchedScene(key)
+
+            # Remove scenes that have not been used recently (they are rebuilt if needed again)
+            if self.scenesToEvictList != []:
+                for key in self.scenesToEvictList:
+                    if (key not in self.recentlyUsedDict) and self._canEvictScene(key):
+                        self._unindexScene(self.scenesDict.pop(key, None))
+                self.scenesToEvictList = []  # reset
+
+            # Deliver messages sent with sendAll(queued=True) in the previous frame
+            if self.queuedMessagesList != []:
+                self._deliverQueuedMessages()
+
+            if oEventSource is None:
+                keysDownList = pygame.key.get_pressed()
+                newEventsList = pygame.event.get()
+            else:
+                pygame.event.clear()  # let pygame do its internal processing, ignore real events
+                newEventsList, keysDownList = oEventSource.getInputs(frameNumber)
+            if oInputRecorder is not None:
+                oInputRecorder.recordFrame(frameNumber, newEventsList, keysDownList, pygame.mouse.get_pos())
+
+            # 7 - Check for and handle events
+            eventsList = []
+            for event in newEventsList:
+                if (event.type == pygame.QUIT) or \
+                        ((event.type == pygame.KEYDOWN) and
+                        (event.key == pygame.K_ESCAPE)):
+                    # Tell current scene we're leaving
+                    self.oCurrentScene.leave()
+                    self._stopRecording()
+                    if not self.exitOnQuit:
+                        return frameNumber
+                    pygame.quit()
+                    sys.exit()
+
+                eventsList.append(event)
+            if self.routeEvents:  # the current scene only wants some types of events
+                eventsList = self._routeEvents(eventsList)
+            self.currentEventsList = eventsList
+            self.eventsByTypeDict = None  # built only if a scene asks for events by type
+            if profiling:
+                phaseTimesList[1] = perfCounter()
+
+            # Here, we let the current scene process all events by calling its handleInputs() method
+            # do any "per frame" actions in its update() method,
+            # and call its draw() method so it can draw everything that needs to be drawn.
+            self.oTimerMgr.update()  # calls the callbacks of managed timers that have finished
+            self.oCurrentScene.handleInputs(eventsList, keysDownList)
+            if self.scriptsList != []:
+                self._runScripts()
+            if profiling:
+                phaseTimesList[2] = perfCounter()
+
+            if useFixedUpdates:
+                now = _getTime()  # scaled by setTimeScale, so the simulation can run in slow motion
+                accumulatedTime = accumulatedTime + (now - lastTime)
+                lastTime = now
+                # Cap the catch up, so one slow frame cannot lead to ever more updates per frame
+                if accumulatedTime > maxAccumulatedTime:
+                    accumulatedTime = maxAccumulatedTime
+                while accumulatedTime >= secondsPerUpdate:
+                    self.oCurrentScene.update(secondsPerUpdate)
+                    accumulatedTime = accumulatedTime - secondsPerUpdate
+            else:
+                self.oCurrentScene.update()
+            if profiling:
+                phaseTimesList[3] = perfCounter()
+
+            if self.oCoveredSceneSnapshot is not None:  # current scene is an overlay, show the scene(s) under it
+                self.window.blit(self.oCoveredSceneSnapshot, (0, 0))
+            if useFixedUpdates:
+                changedRectsList = self.oCurrentScene.draw(accumulatedTime / secondsPerUpdate)
+            else:
+                changedRectsList = self.oCurrentScene.draw()
+            if self.showFrameRate:
+                if self.frameRateDisplayIsText:
+                    # Rounded, so the text (and its image) only changes when the whole number changes
+                    self.oFrameRateDisplay.setValue('FPS: ' + str(round(clock.get_fps())))
+                else:
+                    self.oFrameRateDisplay.update()
+                self.oFrameRateDisplay.draw()
+            if profiling:
+                phaseTimesList[4] = perfCounter()
+
+            # 11 - Update the window
+            if self.useDirtyRects:
+                self._updateChangedRects(changedRectsList)
+            else:
+                pygame.display.update()
+            self.dirtyRectsList = []
+            if profiling:
+                phaseTimesList[5] = perfCounter()
+
+            # 12 - Slow things down a bit
+            clock.tick(tickFramesPerSecond)
+            if profiling:
+                phaseTimesList[6] = perfCounter()
+                oFrameProfiler._recordFrame(profiledSceneKey, phaseTimesList, budgetSeconds)
+
+            frameNumber = frameNumber + 1
+            if self.quitRequested:  # a scene called quit, and we are not exiting the program
+                break
+
+        self._stopRecording()
+        return frameNumber
+
+    def _stopRecording(self):
+        """Internal method, closes the input recording (if any) when the SceneMgr stops running"""
+        if self.oInputRecorder is not None:
+            self.oInputRecorder.close()
+            self.oInputRecorder = None
+
+    def _setAllowedEvents(self):
+        """Internal method, tells pygame which types of events the current scene wants
+
+        If the scene set its eventTypes class variable, all other event types are blocked,
+        so pygame never adds them to the event queue.  QUIT and KEYDOWN (for the escape key)
+        are always allowed.
+
+        """
+        eventTypes = self.oCurrentScene.eventTypes
+        if eventTypes is None:
+            self.eventTypesSet = None
+            pygame.event.set_allowed(None)
+        else:
+            self.eventTypesSet = frozenset(eventTypes)
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(self.eventTypesSet | {pygame.QUIT, pygame.KEYDOWN}))
+        self.routeEvents = (self.eventTypesSet is not None) or self.oCurrentScene.coalesceMouseMotion
+
+    def _routeEvents(self, eventsList):
+        """Internal method, returns only the events the current scene wants
+
+        Removes any event types the scene did not ask for (events from an event source are not blocked by pygame).
+        If the scene set coalesceMouseMotion, each run of back to back MOUSEMOTION events is
+        replaced by the last one (with the relative motion of all of them).
+
+        """
+        eventTypesSet = self.eventTypesSet
+        coalesceMouseMotion = self.oCurrentScene.coalesceMouseMotion
+        routedEventsList = []
+        for event in eventsList:
+            eventType = event.type
+            if (eventTypesSet is not None) and (eventType not in eventTypesSet):
+                continue
+            if coalesceMouseMotion and (eventType == pygame.MOUSEMOTION) and \
+                    (routedEventsList != []) and (routedEventsList[-1].type == pygame.MOUSEMOTION):
+                previousRel = routedEventsList[-1].dict.get('rel', (0, 0))
+                rel = event.dict.get('rel', (0, 0))
+                attributesDict = dict(event.dict, rel=(previousRel[0] + rel[0], previousRel[1] + rel[1]))
+                routedEventsList[-1] = pygame.event.Event(pygame.MOUSEMOTION, attributesDict)
+                continue
+            routedEventsList.append(event)
+        return routedEventsList
+
+    def _getEventsOfType(self, eventType):
+        """Internal method, called by a Scene to get the events of one type in the current frame
+
+        (From the Scene's point of view, it just needs to call its own getEventsOfType method)
+        The events are sorted into lists by type the first time this is called in a frame.
+
+        """
+        if self.eventsByTypeDict is None:
+            self.eventsByTypeDict = {}
+            for event in self.currentEventsList:
+                self.eventsByTypeDict.setdefault(event.type, []).append(event)
+        return self.eventsByTypeDict.get(eventType, [])
+
+    def _updateChangedRects(self, changedRectsList):
+        """Internal method, updates only the changed areas of the window (when useDirtyRects is True)
+
+        Rects returned from the scene's draw() method are combined with any registered
+        through addDirtyRect().  Overlapping rects are merged.  If the scene did not report
+        any rects (draw returned None), or the changed area is larger than dirtyRectThreshold
+        of the window, the whole window is updated.
+
+        """
+        windowRect = pygame.display.get_surface().get_rect()
+        if changedRectsList is not None:
+            self.dirtyRectsList.extend(changedRectsList)
+        elif self.dirtyRectsList == []:
+            self.forceFullUpdate = True  # scene did not report anything
+        if self.showFrameRate:
+            self.dirtyRectsList.append(self.oFrameRateDisplay.getRect())
+
+        if self.forceFullUpdate:
+            self.forceFullUpdate = False
+            pygame.display.update()
+            return
+
+        rectsToUpdateList = []
+        totalArea = 0
+        for rect in _mergeRects(self.dirtyRectsList):
+            rect = rect.clip(windowRect)
+            if (rect.width > 0) and (rect.height > 0):
+                rectsToUpdateList.append(rect)
+                totalArea = totalArea + (rect.width * rect.height)
+
+        if totalArea > (windowRect.width * windowRect.height * self.dirtyRectThreshold):
+            pygame.display.update()
+        elif rectsToUpdateList != []:
+            pygame.display.update(rectsToUpdateList)
+
+    def _addDirtyRect(self, rect):
+        """Internal method, called by a Scene to register a changed area of the window
+
+        (From the Scene's point of view, it just needs to call its own addDirtyRect method)
+
+        """
+        self.dirtyRectsList.append(rect)
+
+    def _drawWidgets(self, oScene, backgroundColor):
+        """Internal method, called by a Scene, draws the widgets of the scene that changed since the last frame
+
+        (From the Scene's point of view, it just needs to call its own drawWidgets method)
+        Each changed area (where a changed widget was, and where it is now) is drawn again:  it is filled
+        with the backgroundColor (if any), then every widget that overlaps it is drawn, clipped to the area.
+        All widgets are drawn when the scene is entered, or when an overlay scene on top of it is popped.
+
+        """
+        window = pygame.display.get_surface()
+        oRegistry = oScene.oWidgetRegistry
+        if oRegistry is None:
+            return []
+        entriesList = oRegistry.entriesList
+
+        # An overlay scene is drawn on top of a snapshot in every frame, so its widgets must all be drawn
+        if (oRegistry.sceneChangeNumber != self.sceneChangeNumber) or (self.oCoveredSceneSnapshot is not None):
+            oRegistry.sceneChangeNumber = self.sceneChangeNumber
+            oRegistry.removedRectsList = []
+            if backgroundColor is not None:
+                window.fill(backgroundColor)
+            for entry in entriesList:
+                oWidget = entry[2]
+                entry[4] = _getWidgetDrawSignature(oWidget)
+                entry[5] = _getDrawnRect(oWidget)
+                oWidget.draw()
+            return None  # the whole window
+
+        changedRectsList = oRegistry.removedRectsList
+        oRegistry.removedRectsList = []
+        for entry in entriesList:
+            oWidget = entry[2]
+            signature = _getWidgetDrawSignature(oWidget)
+            if entry[3] or (signature != entry[4]):
+                entry[4] = signature
+                if entry[5] is not None:
+                    changedRectsList.append(entry[5])  # where it was
+                entry[5] = _getDrawnRect(oWidget)
+                if entry[5] is not None:
+                    changedRectsList.append(entry[5])  # where it is now
+        if changedRectsList == []:
+            return []
+
+        changedRectsList = _mergeRects(changedRectsList)
+        savedClipRect = window.get_clip()
+        for rect in changedRectsList:
+            window.set_clip(rect)
+            if backgroundColor is not None:
+                window.fill(backgroundColor, rect)
+            for entry in entriesList:
+                if (entry[5] is not None) and rect.colliderect(entry[5]):
+                    entry[2].draw()
+        window.set_clip(savedClipRect)
+        return changedRectsList
+
+    def _goToScene(self, nextSceneKey, dataForNextScene):
+        """Called by a Scene, tells the SceneMgr to go to another scene
+
+        (From the Scene's point of view, it just needs to call its own goToScene method)
+        This method:
+        - Tells the current scene that it is leaving, calls leave method
+        - Gets any data the leaving scene wants to send to the new scene
+        - Tells the new scene that it is entering, calls enter method
+
+        Raises:
+        - KeyError if the nextSceneKey is not valid
+
+        """
+        if nextSceneKey is None:  # meaning, exit
+            if not self.exitOnQuit:  # run was given maxFrames, so run returns at the end of this frame
+                self.oCurrentScene.leave()
+                self._stopScripts(self.oCurrentScene)
+                self.quitRequested = True
+                return
+            self._stopRecording()
+            pygame.quit()
+            sys.exit()
+
+        # Call the leave method of the old scene to allow it to clean up.
+        # Set the new scene (based on the key) and
+        # call the enter method of the new scene.
+        self.oCurrentScene.leave()
+        self._stopScripts(self.oCurrentScene)
+        # If the old scene was an overlay, the scenes under it are left too
+        while self.sceneStackList != []:
+            coveredSceneKey, oCoveredScene, oSnapshot = self.sceneStackList.pop()
+            oCoveredScene.leave()
+            self._stopScripts(oCoveredScene)
+        self.oCoveredSceneSnapshot = None
+        pygame.key.set_repeat(0) # turn off repeating characters
+        try:
+            oNextScene = self._getScene(nextSceneKey)
+        except KeyError:
+            raise KeyError("Trying to go to scene '" + nextSceneKey +
+                "' but that key is not in the dictionary of scenes.")
+        self.oCurrentScene = oNextScene
+        self.currentSceneKey = nextSceneKey
+        self._setAllowedEvents()
+        self.sceneChangeNumber = self.sceneChangeNumber + 1  # widgets are all drawn, even if drawn in enter
+        self.oCurrentScene.enter(dataForNextScene)
+        self.forceFullUpdate = True  # new scene, so the whole window must be shown
+
+
+    def prefetchScene(self, sceneKey):
+        """Prepares a scene on a background thread, so that a later goToScene to it does not cause a pause
+
+        If the scene was given as a factory and has not been built, it is built on the background thread.
+        Then the scene's prefetch() method is called (also on the background thread), where the scene can
+        load any images and sounds that its enter() method needs.
+        A later goToScene (or request or send) to this scene uses the prepared scene, and only waits
+        if the work has not finished yet.
+
+        If the scene has already been built, other scenes may be using it, so its prefetch() method
+        is called right away, on the main thread.
+
+        Note: Loading images and sounds and rendering fonts works on a background thread, but
+        a scene's __init__() and prefetch() methods should not draw to the window.
+
+        Parameter:
+            | sceneKey - the scene key of the scene to prepare
+
+        Raises:
+            | KeyError if there is no scene with the given key
+
+        """
+        if sceneKey in self.pendingScenesDict:
+            return  # already being prepared
+        oScene = self.scenesDict.get(sceneKey)
+        if oScene is not None:
+            oScene.prefetch()  # a live scene is only used on the main thread
+            return
+        if sceneKey not in self.sceneFactoriesDict:
+            raise KeyError('Attempting to prefetch scene with key ' + str(sceneKey) +
+                           ' but no scene with that key currently exists (either never defined or removed).')
+        if self.oPrefetchExecutor is None:  # created the first time it is needed
+            self.oPrefetchExecutor = concurrent.futures.ThreadPoolExecutor(
+                                        max_workers=self.nPrefetchThreads, thread_name_prefix='prefetchScene')
+        self.pendingScenesDict[sceneKey] = self.oPrefetchExecutor.submit(self._prefetchWorker, sceneKey)
+
+    def _prefetchWorker(self, sceneKey):
+        """Internal method, runs on a background thread to build and prepare a scene (not yet seen by other scenes)"""
+        oScene = self._makeScene(sceneKey)
+        oScene.prefetch()
+        return oScene
+
+    def _collectPrefetchedScene(self, sceneKey):
+        """Internal method, adds a prefetched scene to the dictionary of scenes (waits if it is not ready)"""
+        oFuture = self.pendingScenesDict.pop(sceneKey)
+        oScene = oFuture.result()  # waits for the background thread if needed, re-raises any exception
+        if self.scenesDict.get(sceneKey) is not oScene:
+            oScene._setRefToSceneMgr(self)
+            self._unindexScene(self.scenesDict.get(sceneKey))
+            self.scenesDict[sceneKey] = oScene
+            self._indexScene(oScene)
+        # Counts as a use, so maxLoadedScenes includes prefetched scenes
+        self.recentlyUsedDict[sceneKey] = None
+        self.recentlyUsedDict.move_to_end(sceneKey)
+        if (self.maxLoadedScenes is not None) and (len(self.recentlyUsedDict) > self.maxLoadedScenes):
+            self._evictScenes(sceneKey)
+        return oScene
+
+    def _pushScene(self, sceneKey, dataForNextScene):
+        """Called by a Scene, tells the SceneMgr to show another scene as an overlay on top of the current one
+
+        (From the Scene's point of view, it just needs to call its own pushScene method)
+
+        Raises:
+        - KeyError if the sceneKey is not valid
+
+        """
+        try:
+            oOverlayScene = self._getScene(sceneKey)
+        except KeyError:
+            raise KeyError("Trying to push scene '" + str(sceneKey) +
+                "' but that key is not in the dictionary of scenes.")
+        self._pushSceneObject(sceneKey, oOverlayScene, dataForNextScene)
+
+    def _pushSceneObject(self, sceneKey, oOverlayScene, dataForNextScene):
+        """Internal method, makes a scene object the current scene, as an overlay on top of the current scene
+
+        Saves an image of the window (the last frame drawn by the current scene).  Until the overlay
+        is popped, that image is drawn in every frame instead of calling the covered scene's update and draw.
+
+        """
+        oOverlayScene._setRefToSceneMgr(self)  # needed for dialog scenes, which are not in the dict of scenes
+        oSnapshot = pygame.display.get_surface().copy()
+        self.sceneStackList.append((self.currentSceneKey, self.oCurrentScene, oSnapshot))
+        self.oCoveredSceneSnapshot = oSnapshot
+        self.oCurrentScene.overlayPushed(sceneKey)
+
+        pygame.key.set_repeat(0) # turn off repeating characters
+        self.oCurrentScene = oOverlayScene
+        self.currentSceneKey = sceneKey
+        self._setAllowedEvents()
+        self.oCurrentScene.enter(dataForNextScene)
+        self.forceFullUpdate = True
+
+    def _popScene(self, dataForCoveredScene):
+        """Called by a Scene, tells the SceneMgr to remove the current overlay scene, and go back to the scene under it
+
+        (From the Scene's point of view, it just needs to call its own popScene method)
+
+        Raises:
+        - ValueError if the current scene is not an overlay
+
+        """
+        if self.sceneStackList == []:
+            raise ValueError('Trying to pop scene ' + str(self.currentSceneKey) +
+                             ' but it was not pushed on top of another scene.')
+        self.oCurrentScene.leave()
+        self._stopScripts(self.oCurrentScene)
+        pygame.key.set_repeat(0) # turn off repeating characters
+        self.currentSceneKey, self.oCurrentScene, oSnapshot = self.sceneStackList.pop()
+        if self.sceneStackList == []:
+            self.oCoveredSceneSnapshot = None
+        else:
+            self.oCoveredSceneSnapshot = self.sceneStackList[-1][2]
+        self._setAllowedEvents()
+        self.sceneChangeNumber = self.sceneChangeNumber + 1
+        self.oCurrentScene.overlayPopped(dataForCoveredScene)
+        self.forceFullUpdate = True
+
+    def getTimerMgr(self):
+        """Returns the TimerMgr that the SceneMgr updates in every frame (see TimerMgr)"""
+        return self.oTimerMgr
+
+    def _startScript(self, oScene, coroutine):
+        """Called by a Scene, adds a coroutine to the list of scripts, it first runs in the current frame"""
+        self.scriptsList.append([oScene, coroutine, None])
+
+    def _runScripts(self):
+        """Internal method, called once per frame, resumes each script whose awaitable is ready
+
+        Scripts only run while their scene is the current scene, or is covered by an overlay scene.
+
+        Raises:
+        - ValueError if a script awaits something other than a wait, nextFrame, or dialog
+
+        """
+        activeScenesList = [oCoveredScene for coveredSceneKey, oCoveredScene, oSnapshot in self.sceneStackList]
+        activeScenesList.append(self.oCurrentScene)
+        for script in list(self.scriptsList):  # copy, scripts can start or stop scripts
+            oScene, coroutine, oAwaitable = script
+            if oScene not in activeScenesList:
+                continue
+            if (oAwaitable is not None) and (not oAwaitable._isReady()):
+                continue
+            if script not in self.scriptsList:  # stopped by an earlier script in this frame
+                continue
+            self.runningScript = script
+            try:
+                oAwaitable = coroutine.send(None)
+            except StopIteration:
+                if script in self.scriptsList:
+                    self.scriptsList.remove(script)
+                continue
+            finally:
+                self.runningScript = None
+            if script not in self.scriptsList:  # the script left its scene (for example, called goToScene)
+                coroutine.close()
+                continue
+            if not hasattr(oAwaitable, '_isReady'):
+                self.scriptsList.remove(script)
+                coroutine.close()
+                raise ValueError('A scene script can only await wait(), nextFrame(), or a dialog, not ' +
+                                 str(oAwaitable))
+            script[2] = oAwaitable
+
+    def _stopScripts(self, oScene):
+        """Internal method, closes all scripts started by a scene (called when the scene is left)
+
+        A script that is running now (it called goToScene or popScene itself) is only removed from
+        the list here, and is closed by _runScripts when it next awaits.
+
+        """
+        for script in list(self.scriptsList):
+            if script[0] is oScene:
+                self.scriptsList.remove(script)
+                if script is not self.runningScript:
+                    script[1].close()
+
+    def _getScene(self, sceneKey):
+        """Internal method, returns the scene object for a scene key
+
+        If the scene was given as a factory (a class or function) and has not been built yet
+        (or was removed because it was not used recently), it is built now.
+        If the scene is being prefetched, this waits for that to finish.
+
+        Raises:
+            | KeyError if there is no scene with the given key
+
+        """
+        if sceneKey in self.pendingScenesDict:
+            self._collectPrefetchedScene(sceneKey)
+        oScene = self.scenesDict.get(sceneKey)
+        if oScene is None:
+            if sceneKey not in self.sceneFactoriesDict:
+                raise KeyError('There is no scene with key ' + str(sceneKey))
+            oScene = self._buildScene(sceneKey)
+
+        if sceneKey in self.sceneFactoriesDict:
+            self.recentlyUsedDict[sceneKey] = None
+            self.recentlyUsedDict.move_to_end(sceneKey)
+            if (self.maxLoadedScenes is not None) and (len(self.recentlyUsedDict) > self.maxLoadedScenes):
+                self._evictScenes(sceneKey)
+        return oScene
+
+    def _makeScene(self, sceneKey):
+        """Internal method, calls the factory of a scene and returns the new scene object"""
+        sceneFactory = self.sceneFactoriesDict[sceneKey]
+        if isinstance(sceneFactory, type) and issubclass(sceneFactory, Scene):
+            return sceneFactory(pygame.display.get_surface())  # scene classes are passed the window
+        return sceneFactory()
+
+    def _buildScene(self, sceneKey):
+        """Internal method, builds a scene from its factory and adds it to the dictionary of scenes"""
+        oScene = self._makeScene(sceneKey)
+        oScene._setRefToSceneMgr(self)
+        self.scenesDict[sceneKey] = oScene
+        self._indexScene(oScene)
+        return oScene
+
+    def _evictScenes(self, sceneKeyInUse):
+        """Internal method, marks the least recently used scenes to be removed, down to maxLoadedScenes
+
+        Like removeScene, the scenes are removed at the start of the next frame.
+        The current scene and the scene being used now are never removed.
+
+        """
+        for sceneKey in list(self.recentlyUsedDict):  # least recently used first
+            if len(self.recentlyUsedDict) <= self.maxLoadedScenes:
+                break
+            if self._canEvictScene(sceneKey) and (sceneKey != sceneKeyInUse):
+                del self.recentlyUsedDict[sceneKey]
+                self.scenesToEvictList.append(sceneKey)
+
+    def _canEvictScene(self, sceneKey):
+        """Internal method, returns True if a scene built from a factory can be removed now"""
+        if (sceneKey == self.currentSceneKey) or (sceneKey in self.pendingScenesDict):
+            return False
+        for coveredSceneKey, oCoveredScene, oSnapshot in self.sceneStackList:
+            if sceneKey == coveredSceneKey:
+                return False
+        return True
+
+    def _request_respond(self, targetSceneKey, requestID):
+        """Internal method, called by a Scene tells SceneMgr to query another scene for information.
+
+        (From the Scene's point of view, it just needs to call its own request method)
+        The target scene must implement a method named "respond"
+
+        """
+        oTargetScene = self._getScene(targetSceneKey)
+        if requestID not in oTargetScene.cacheableRequestIDs:
+            info = oTargetScene.respond(requestID)
+            return info
+
+        # Cacheable, only ask the scene if there is no saved response (see invalidateResponse)
+        responsesDict = self.cachedResponsesDict.get(oTargetScene)
+        if responsesDict is None:
+            responsesDict = {}
+            self.cachedResponsesDict[oTargetScene] = responsesDict
+        elif requestID in responsesDict:
+            return responsesDict[requestID]
         info = oTargetScene.respond(requestID)
+        responsesDict[requestID] = info
         return info
 
+    def _invalidateResponse(self, oScene, requestID):
+        """Internal method, called by a Scene, throws away its saved response to a request (or all of them)
+
+        (From the Scene's point of view, it just needs to call its own invalidateResponse method)
+
+        """
+        responsesDict = self.cachedResponsesDict.get(oScene)
+        if responsesDict is None:
+            return
+        if requestID is None:
+            del self.cachedResponsesDict[oScene]
+        else:
+            responsesDict.pop(requestID, None)
+
     def _send_receive(self, targetSceneKey, sendID, info):
         """Internal method, called by a Scene, tells the Scene Manager to send information to another scene
 
@@ -738,42 +3366,118 @@ class SceneMgr():
         The target scene must implement a method named "receive"
 
         """
-        oTargetScene = self.scenesDict[targetSceneKey]
+        oTargetScene = self._getScene(targetSceneKey)
         oTargetScene.receive(sendID, info)
 
-    def _sendAll_receive(self, oSenderScene, sendID, info):
+    def _sendAll_receive(self, oSenderScene, sendID, info, queued=False):
         """Internal method, called by a Scene tells the Scene Manager to send information to all scenes (other than itself)
 
         (From the sending scene's point of view, it just needs to call its own sendAll method)
-        All scenes must implement a method named "receive"
+        The information goes to scenes that subscribed to the sendID, and to scenes that never subscribed to anything.
+        Those scenes must implement a method named "receive"
+        Scenes given as factories that have not been built (or were removed) are not sent the information.
+        If queued is True, the information is sent at the start of the next frame.
 
         """
-        for sceneKey in self.scenesDict:
-            oTargetScene = self.scenesDict[sceneKey]
-            if oTargetScene != oSenderScene:
+        if queued:
+            self.queuedMessagesList.append((oSenderScene, sendID, info))
+            return
+        targetScenesList = list(self.receiveAllScenesDict)
+        subscribersDict = self.receiversDict.get(sendID)
+        if subscribersDict is not None:
+            targetScenesList.extend(subscribersDict)
+        for oTargetScene in targetScenesList:
+            if oTargetScene is not oSenderScene:
                 oTargetScene.receive(sendID, info)
 
+    def _deliverQueuedMessages(self):
+        """Internal method, sends the messages queued by sendAll(queued=True), in the order they were sent"""
+        queuedMessagesList = self.queuedMessagesList
+        self.queuedMessagesList = []  # messages queued while delivering these are sent in the next frame
+        for oSenderScene, sendID, info in queuedMessagesList:
+            self._sendAll_receive(oSenderScene, sendID, info)
+
+    def _indexScene(self, oScene):
+        """Internal method, adds a scene to the index used by sendAll (called when a scene is added or built)"""
+        if oScene.receiveIDs is None:
+            self.receiveAllScenesDict[oScene] = None
+            return
+        self.sceneSendIDsDict[oScene] = set()
+        for sendID in oScene.receiveIDs:
+            self._subscribe(oScene, sendID)
+
+    def _unindexScene(self, oScene):
+        """Internal method, removes a scene from the index used by sendAll, and its saved responses
+        (called when a scene is removed)
+
+        """
+        if oScene is None:
+            return
+        self.cachedResponsesDict.pop(oScene, None)
+        self.receiveAllScenesDict.pop(oScene, None)
+        sendIDsSet = self.sceneSendIDsDict.pop(oScene, ())
+        for sendID in sendIDsSet:
+            subscribersDict = self.receiversDict[sendID]
+            del subscribersDict[oScene]
+            if subscribersDict == {}:
+                del self.receiversDict[sendID]
+
+    def _subscribe(self, oScene, sendID):
+        """Internal method, called by a Scene, so that sendAll sends it messages with the given sendID
+
+        (From the Scene's point of view, it just needs to call its own subscribe method)
+        After its first subscribe, a scene no longer receives messages with other sendIDs.
+
+        """
+        if oScene in self.receiveAllScenesDict:
+            del self.receiveAllScenesDict[oScene]
+            self.sceneSendIDsDict[oScene] = set()
+        sendIDsSet = self.sceneSendIDsDict.get(oScene)
+        if sendIDsSet is None:
+            raise ValueError('Attempting to subscribe a scene that has not been added to the SceneMgr')
+        sendIDsSet.add(sendID)
+        self.receiversDict.setdefault(sendID, {})[oScene] = None
+
+    def _unsubscribe(self, oScene, sendID):
+        """Internal method, called by a Scene, so that sendAll no longer sends it messages with the given sendID
+
+        (From the Scene's point of view, it just needs to call its own unsubscribe method)
+
+        """
+        sendIDsSet = self.sceneSendIDsDict.get(oScene)
+        if (sendIDsSet is None) or (sendID not in sendIDsSet):
+            print('Warning - called unsubscribe with sendID', sendID, 'but the scene is not subscribed to it ... ignored')
+            return
+        sendIDsSet.remove(sendID)
+        subscribersDict = self.receiversDict[sendID]
+        del subscribersDict[oScene]
+        if subscribersDict == {}:
+            del self.receiversDict[sendID]
+
     def _addScene(self, sceneKey, oNewScene):
         """Called in a Scene, tells the SceneMgr to add a new scene dynamically
         (From the Scene's point of view, it just needs to call its own addScene method)
 
         The scene must first instantiate a new Scene object, then call this method
+        (or pass a class or function that builds the scene when it is first needed)
 
         Parameters:
             | sceneKey - an key that uniquely identifies this scene (typically a string)
-            | oNewScene - an object of an instance of the new scene
+            | oNewScene - an object of an instance of the new scene, or a scene factory
 
         Raises:
         |    KeyError - if a scene with the same key already exists (must be unique)
 
         """
-        # Ask the new scene for its scene key, and add it to the scenes dictionary
-        newSceneKey = oNewScene.getSceneKey()
-        if newSceneKey in self.scenesDict:
-            raise KeyError('Trying to add a scene with key' + newSceneKey + 'but that scene key already exists')
-        self.scenesDict[newSceneKey] = oNewScene
+        if (sceneKey in self.scenesDict) or (sceneKey in self.sceneFactoriesDict):
+            raise KeyError('Trying to add a scene with key ' + str(sceneKey) + ' but that scene key already exists')
+        if not isinstance(oNewScene, Scene):
+            self.sceneFactoriesDict[sceneKey] = oNewScene  # built when first needed
+            return
+        self.scenesDict[sceneKey] = oNewScene
         # Send the new scene a reference to the SceneMgr
         oNewScene._setRefToSceneMgr(self)
+        self._indexScene(oNewScene)
 
     def _removeScene(self, sceneKeyToRemove):
         """Called by a Scene, tells the SceneMgr to remove an existing scene (to free up memory)
@@ -786,7 +3490,7 @@ class SceneMgr():
             | KeyError if the nextSceneKey is not valid
 
         """
-        if not(sceneKeyToRemove in self.scenesDict):
+        if not(sceneKeyToRemove in self.scenesDict) and not(sceneKeyToRemove in self.sceneFactoriesDict):
             raise KeyError('Attempting to remove scene with key ' + sceneKeyToRemove +
                            ' but no scene with that key currently exists (either never defined or removed).')
         # Add the key to a list of keys to be removed
@@ -847,7 +3551,7 @@ class Scene(ABC):
     Therefore, all scenes must implement these methods (polymorphism):
 
         |    handleInputs()  # called in every frame
-        |    draw()          # called in every frame
+        |    draw()          # called in every frame (draw(alpha) with fixedUpdatesPerSecond)
 
     The following methods can optionally be implemented in a scene.  If they are not
     implemented, then the null version in the Scene subclass will be used.
@@ -856,17 +3560,42 @@ class Scene(ABC):
         |    enter()          # called once whenever the scene is entered
         |    update()       # called in every frame
         |    leave()          # called once whenever the scene is left
+        |    prefetch()       # called on a background thread if another scene calls prefetchScene() for this scene
+        |    overlayPushed()  # called when another scene is pushed on top of this one (see pushScene)
+        |    overlayPopped()  # called when the scene on top of this one is popped (see popScene)
 
     When you want to go to a new scene, call:
 
         |    self.goToScene() and pass in the sceneKey of the scene you want to go to,
         |    and optionally, pass any data you want the next scene to receive in its enter() method.
 
-    If you want to quit the program from your scene, call:
+    If you want to quit the program from your scene, call:
+
+        |    self.quit()
+
+    A scene can say which types of events it wants by setting the eventTypes class variable.
+    The SceneMgr then tells pygame to block all other event types while this scene is active,
+    so handleInputs() is only given the events it cares about (QUIT and KEYDOWN are always allowed):
+
+        |    class MyScene(pyghelpers.Scene):
+        |        eventTypes = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+        |        coalesceMouseMotion = True
+
+    If coalesceMouseMotion is True, each group of back to back MOUSEMOTION events in a frame
+    is replaced by the last one (whose rel attribute is the total motion).
+    Note: blocked events are not available to the dialog functions either, while the scene is active.
 
-        |    self.quit()
+    Sequences of steps that take many frames (instead of a state machine in update()) can be written as
+    scripts (async methods), started by calling startScript().  Scripts can await wait(), nextFrame(),
+    askYesNo(), and showDialog().
 
     """
+    eventTypes = None  # None means all events, or a tuple or list of the event types the scene wants
+    coalesceMouseMotion = False
+    receiveIDs = None  # None means all messages sent with sendAll, or a tuple or list of the sendIDs the scene wants
+    cacheableRequestIDs = ()  # requestIDs whose responses the SceneMgr can save (see invalidateResponse)
+    oWidgetRegistry = None  # widgets added with addWidget, created by the first call
+
     def __del__(self):
         """Internal method, called when the scene is about to die."""
         self.oSceneMgr = None  # eliminate the reference to the SceneMgr
@@ -914,23 +3643,73 @@ class Scene(ABC):
         """
         raise NotImplementedError
 
-    def update(self):
+    def update(self, dt=None):
         """This method is called in every frame of the scene do any processing you need to do here
 
         Your code will typically override this method.
 
+        If the SceneMgr was created with fixedUpdatesPerSecond, this method is called at that fixed rate
+        (zero or more times per frame), and is passed the fixed time step in seconds.
+        In that case, your version must accept a dt parameter, and your draw method must accept an alpha parameter
+        (write them as update(self, dt=None) and draw(self, alpha=None) so they work in either mode).
+
         """
         pass
 
     @abstractmethod
-    def draw(self):
+    def draw(self, alpha=None):
         """This method is called in every frame of the scene to draw anything that needs to be drawn
 
         Your code MUST override this method.
 
+        If the SceneMgr was created with useDirtyRects=True, this method can return a list of
+        the rects that it changed in this frame (an empty list if nothing changed).  Only those
+        areas of the window will be updated.  If it returns None (and no rects were registered
+        via addDirtyRect), the whole window is updated.
+
+        If the SceneMgr was created with fixedUpdatesPerSecond, this method is passed an alpha value:
+        the fraction (0.0 up to 1.0) of a time step between the last update and the next one.
+        Otherwise, it is called with no arguments.  So if your scene may be used with fixedUpdatesPerSecond,
+        write your version as:
+            |    def draw(self, alpha=None):
+
         """
         raise NotImplementedError
 
+    def overlayPushed(self, overlaySceneKey):
+        """This method is called when another scene is pushed on top of this scene (see pushScene)
+
+        While covered, this scene's handleInputs, update and draw methods are not called.
+        Override this method if your scene needs to do something, for example, pause its timers.
+
+        Parameter:
+            |    overlaySceneKey - the scene key of the overlay scene (DIALOG_SCENE_KEY for a dialog, see showDialog)
+
+        """
+        pass
+
+    def overlayPopped(self, data):
+        """This method is called when the overlay scene on top of this scene is popped (see popScene)
+
+        Override this method if you expect data back from the overlay scene, or need to resume anything.
+
+        Parameter:
+            |    data - any data passed to popScene by the overlay scene
+
+        """
+        pass
+
+    def prefetch(self):
+        """This method is called on a background thread when another scene calls prefetchScene() for this scene
+
+        (If this scene has already been built, it is called on the main thread instead.)
+
+        Override this method to load any images, sounds, etc. that your enter() method would otherwise
+        load, so that going to this scene does not cause a pause.  This method should not draw anything.
+
+        """
+        pass
+
     def leave(self):
         """This method is called whenever the user leaves a scene
 
@@ -958,12 +3737,136 @@ class Scene(ABC):
         self.oSceneMgr._goToScene(nextSceneKey, data)
 
 
+    def pushScene(self, sceneKey, data=None):
+        """Call this method to show another scene as an overlay on top of this one (for example, a pause menu)
+
+        The overlay scene becomes the current scene, and its enter() method is called.
+        An image of this scene's last frame is saved, and drawn in every frame underneath the overlay.
+        This scene's handleInputs, update, and draw methods are not called until the overlay calls popScene.
+        This scene's overlayPushed() method is called.
+
+        Parameters:
+            |    sceneKey - the scene key (string) of the overlay scene
+
+        Optional keyword parameter:
+            |    data - any data you want sent to the overlay scene's enter() method (defaults to None)
+
+        """
+        self.oSceneMgr._pushScene(sceneKey, data)
+
+    def popScene(self, data=None):
+        """Call this method from an overlay scene to remove it, and go back to the scene underneath
+
+        The overlay scene's leave() method is called, then the overlayPopped() method of the scene underneath.
+
+        Optional keyword parameter:
+            |    data - any data you want sent to the scene underneath (defaults to None)
+
+        """
+        self.oSceneMgr._popScene(data)
+
+    def getTimerMgr(self):
+        """Returns the TimerMgr that the SceneMgr updates in every frame
+
+        Pass it in when you create Timer or CountDownTimer objects (see TimerMgr).
+        (This cannot be called in your scene's __init__ method, because the SceneMgr is created after the scenes.
+        If you need it there, create the TimerMgr in your main program, and pass it to the scenes and the SceneMgr.)
+
+        """
+        return self.oSceneMgr.oTimerMgr
+
+    def startScript(self, coroutine):
+        """Call this method to run a script, a sequence of steps that can take many frames
+
+        A script is written as an async method of your scene, and can await a number of
+        seconds, the next frame, or the answer from a dialog.  For example:
+
+            |    async def introScript(self):
+            |        self.titleText.show()
+            |        await self.wait(2.0)
+            |        self.titleText.hide()
+            |        if await self.askYesNo((100, 100, 400, 200), 'Skip the tutorial?'):
+            |            self.goToScene(SCENE_PLAY)
+            |
+            |    def enter(self, data):
+            |        self.startScript(self.introScript())
+
+        The SceneMgr resumes each script at most once per frame, after calling handleInputs().
+        A script only runs while its scene is the current scene (or is covered by an overlay scene),
+        and is closed when its scene is left.
+
+        Parameter:
+            |    coroutine - the coroutine object to run, made by calling an async method (or function)
+
+        """
+        self.oSceneMgr._startScript(self, coroutine)
+
+    def wait(self, seconds):
+        """Use in a script (see startScript) as: await self.wait(seconds) to wait for some number of seconds
+
+        Parameter:
+            |    seconds - the number of seconds to wait (float)
+
+        """
+        return _WaitSeconds(seconds)
+
+    def nextFrame(self):
+        """Use in a script (see startScript) as: await self.nextFrame() to wait until the next frame"""
+        return _NextFrame()
+
+    def askYesNo(self, theRect, prompt, yesButtonText='Yes', noButtonText='No'):
+        """Use in a script (see startScript) as: answer = await self.askYesNo(theRect, prompt)
+
+        Shows a TextYesNoDialogScene on top of this scene.
+        The script continues when the user closes the dialog, and the answer is True or False.
+        (For other colors or a custom dialog, use:  answer = await self.showDialog(oDialog))
+
+        Parameters:
+            |    theRect - the rectangle (or tuple) of the dialog box in the application window
+            |    prompt - prompt (title) string to be displayed in the dialog box
+
+        Optional keyword parameters:
+            |    yesButtonText - text on the Yes button (defaults to 'Yes')
+            |    noButtonText - text on the No button (defaults to 'No'), None for only one button
+
+        """
+        oDialog = TextYesNoDialogScene(pygame.display.get_surface(), theRect, prompt,
+                                       yesButtonText, noButtonText)
+        return self.showDialog(oDialog)
+
+    def showDialog(self, oDialog, callBack=None):
+        """Call this method to show a dialog scene on top of this scene, without stopping the game
+
+        The dialog is shown as an overlay scene (see pushScene).  It runs in the SceneMgr's loop,
+        so timers and music keep running.  When the user closes the dialog, the dialog is popped,
+        this scene's overlayPopped() method is called, then the callBack (if any) is called with the result.
+
+        Parameters:
+            |    oDialog - a TextYesNoDialogScene, CustomYesNoDialogScene, TextAnswerDialogScene, or CustomAnswerDialogScene
+
+        Optional keyword parameter:
+            |    callBack - a function or method to be called with the result of the dialog (defaults to None)
+            |        You can also check oDialog.isDone() and oDialog.getResult() instead
+
+        Returns:
+            |    oDialog - in a script (see startScript), you can write:  result = await self.showDialog(oDialog)
+
+        """
+        oDialog._start(callBack)
+        # One key for all dialogs, so a FrameProfiler does not keep timings for each dialog object
+        self.oSceneMgr._pushSceneObject(DIALOG_SCENE_KEY, oDialog, None)
+        return oDialog
+
     def request(self, targetSceneKey, requestID):
         """Call this method to get information from another scene
 
         The target scene must implement a method named: respond,
         it can return any info in any way the two scenes agree upon
 
+        If the requestID is in the target scene's cacheableRequestIDs, the response is saved,
+        and later requests get the saved response (without calling respond) until the target
+        scene calls invalidateResponse.  Do not modify a saved response.
+
         Parameters:
             |    targetSceneKey - the scene key (string) of the scene to ask for data
             |    requestID - the data you want from the target scene (typically a string)
@@ -983,89 +3886,483 @@ class Scene(ABC):
             |    sendID - the type of data you are sending the target scene (typically a string)
             |    info - the actual data to send (can be any type)
 
-        """
-        self.oSceneMgr._send_receive(targetSceneKey, sendID, info)
+        """
+        self.oSceneMgr._send_receive(targetSceneKey, sendID, info)
+
+    def sendAll(self, sendID, info, queued=False):
+        """Call this method to send information to all other scenes
+
+        The other scenes must implement a method named:  receive().
+        You can pass any info that the sender and all other scenes agree upon
+
+        Only scenes that subscribed to the sendID (see subscribe), and scenes that never subscribed
+        to anything, are sent the information.
+
+        Parameters:
+            |    sendID - the type of data you are sending the target scene (typically a string)
+            |    info - the actual data to send (can be any type)
+
+        Optional keyword parameter:
+            |    queued - if True, the information is sent at the start of the next frame,
+            |        together with all other queued information (defaults to False, sent now)
+
+        """
+        self.oSceneMgr._sendAll_receive(self, sendID, info, queued)  # pass in self to identify sender
+
+    def subscribe(self, sendID):
+        """Call this method so that your scene is sent information with the given sendID by sendAll
+
+        A scene that never subscribes receives everything sent with sendAll.
+        Once a scene subscribes, it only receives information with the sendIDs it subscribed to.
+        A scene can also subscribe by setting the class variable receiveIDs to a tuple or list of sendIDs.
+
+        Parameter:
+            |    sendID - the type of data your scene wants to receive (typically a string)
+
+        """
+        self.oSceneMgr._subscribe(self, sendID)
+
+    def unsubscribe(self, sendID):
+        """Call this method so that your scene is no longer sent information with the given sendID by sendAll
+
+        Parameter:
+            |    sendID - a sendID that your scene subscribed to
+
+        """
+        self.oSceneMgr._unsubscribe(self, sendID)
+
+    def respond(self, requestID):
+        """Respond to a request for information from some other scene
+
+        You must override this method if your scene expects to handle
+        requests for information from other scenes via calls to:  request()
+
+        If a response only changes when your scene's data changes, add its requestID to the
+        class variable cacheableRequestIDs, and call invalidateResponse whenever that data changes.
+
+        Parameters:
+            |    requestID - identifier of what data to be sent back to the caller
+
+        """
+        raise NotImplementedError
+
+    def invalidateResponse(self, requestID=None):
+        """Call this method when the response to a cacheable request has changed (see cacheableRequestIDs)
+
+        The next request with that requestID will call respond again.
+
+        Optional keyword parameter:
+            |    requestID - the requestID whose saved response is no longer correct
+            |        (defaults to None, meaning all saved responses of this scene)
+
+        """
+        self.oSceneMgr._invalidateResponse(self, requestID)
+
+    def receive(self, receiveID, info):
+        """Receives information from another scene.
+
+        You must override this method if your scene expects to receive information from
+        other scenes sending information via calls to:  send
+
+        Parameters:
+            |    receiveID - an identifier for what type of information is being received
+            |    info - the information sent from another scene
+
+        """
+        raise NotImplementedError
+
+    def addScene(self, sceneKey, oScene):
+        """Call this method whenever you want to add a new scene dynamically.
+        For example, you could have a game with many levels (each implemented as a scene),
+        but only have the current level loaded.  As the player completes a level, you
+        could do a removeScene on the current level and do an addScene on the
+        next level, then do a goToScene on the new level.
+
+        Parameters:
+            |    sceneKey - a key to uniquely identify this scene (typically a string)
+            |    oScene - an instance of the new scene to be added
+            |         (typically, you would instantiate the new scene, and pass in that reference to this call)
+            |         or a scene class or function that builds the scene, which is called when the scene is first needed
+
+        """
+        self.oSceneMgr._addScene(sceneKey, oScene)
+
+    def prefetchScene(self, sceneKey):
+        """Call this method to prepare another scene on a background thread, before going to it
+
+        For example, a level scene could prefetch the next level while the current level is being played.
+        A later goToScene to that scene will not need to wait for it to be built.
+        See SceneMgr.prefetchScene() for details.
+
+        Parameters:
+            |    sceneKey - the scene key (string) of the scene to prepare
+
+        """
+        self.oSceneMgr.prefetchScene(sceneKey)
+
+    def getEventsOfType(self, eventType):
+        """Call this method (typically in handleInputs) to get the events of a given type in this frame
+
+        Parameters:
+            |    eventType - the type of event, for example, pygame.MOUSEBUTTONDOWN
+
+        Returns:
+            |    a list of the events of that type (an empty list if there are none)
+
+        """
+        return self.oSceneMgr._getEventsOfType(eventType)
+
+    def addDirtyRect(self, rect):
+        """Call this method to register an area of the window that has changed in this frame
+
+        Only used when the SceneMgr was created with useDirtyRects=True.  This is an alternative to
+        returning a list of rects from draw(), and can be called from handleInputs(), update() or draw().
+
+        Parameters:
+            |    rect - a pygame.Rect (or tuple) of the changed area of the window
+
+        """
+        self.oSceneMgr._addDirtyRect(rect)
+
+    def addWidget(self, oWidget, zOrder=0, alwaysRedraw=False):
+        """Call this method (typically in __init__) to have a pygwidgets widget drawn by drawWidgets
+
+        Parameters:
+            |    oWidget - any pygwidgets widget (DisplayText, CustomButton, Image, etc.)
+
+        Optional keyword parameters:
+            |    zOrder - widgets with a higher zOrder are drawn on top of widgets with a lower zOrder (defaults to 0)
+            |        Widgets with the same zOrder are drawn in the order they were added
+            |    alwaysRedraw - draw this widget in every frame, for widgets that change in ways that cannot be
+            |        detected, for example, an Animation (defaults to False)
+            |        An InputText is always drawn in every frame, so its blinking cursor is shown
+
+        """
+        if isinstance(oWidget, pygwidgets.InputText):  # the cursor blinks without changing the widget's signature
+            alwaysRedraw = True
+        if self.oWidgetRegistry is None:
+            self.oWidgetRegistry = _WidgetRegistry()
+        self.oWidgetRegistry.add(oWidget, zOrder, alwaysRedraw)
+
+    def removeWidget(self, oWidget):
+        """Call this method to stop drawing a widget added with addWidget.  Its area is drawn over in the next frame
+
+        Parameters:
+            |    oWidget - a widget that was added with addWidget
+
+        Raises:
+            |    ValueError if the widget was not added with addWidget
+
+        """
+        if self.oWidgetRegistry is None:
+            raise ValueError('Attempting to remove a widget that was not added with addWidget')
+        self.oWidgetRegistry.remove(oWidget)
+
+    def drawWidgets(self, backgroundColor=None):
+        """Call this method in your draw method to draw only the widgets (added with addWidget) that have changed
+
+        A widget has changed if its location, size, value, text, state (for example, the mouse is over a button),
+        visibility, or enabled setting is different from the last frame.  The areas of the changed widgets are
+        drawn again, including the parts of other widgets that overlap them (for example, a background Image).
+        All widgets are drawn when the scene is entered.
+
+        With useDirtyRects=True, your draw method can return the result, so only those areas of the window are updated:
+            |    def draw(self, alpha=None):
+            |        return self.drawWidgets()
+
+        Optional keyword parameter:
+            |    backgroundColor - color to fill the changed areas with before drawing (defaults to None, no fill)
+            |        Use None if a background widget (added with the lowest zOrder) covers the whole area
+
+        Returns:
+            |    a list of the changed rects (an empty list if nothing changed), or None if all widgets were drawn
+
+        """
+        return self.oSceneMgr._drawWidgets(self, backgroundColor)
+
+    def removeScene(self, sceneKey):
+        """Call this method whenever you want to remove an existing scene
+        You can remove a scene to save memory - the scene object will be deleted.
+        The SceneMgr delays removing the scene until the next time thru the main loop.
+        Therefore, it is safe to call to removeScene from its own scene, if you immediately
+        go to another scene.
+
+        Parameters:
+            |    sceneKey - the scene key (string) of the scene to remove
+
+        """
+        self.oSceneMgr._removeScene(sceneKey)
+
+
+#
+#  Dialog functions
+#
+DIALOG_BACKGROUND_COLOR = (0, 200, 200)
+DIALOG_BLACK = (0, 0, 0)
+DIALOG_INSET = 30 # inset buttons from the edges of the dialog box
+DIALOG_WAIT_MS = 500 # longest time to sleep waiting for an event, with waitForEvents
+DIALOG_FRAMES_PER_SECOND = 30 # most times per second a dialog checks for events, without waitForEvents
+DIALOG_SCENE_KEY = 'pyghelpers dialog' # scene key of every dialog shown with showDialog
+
+def _makeTextDialogBackground(theRect, prompt, backgroundColor, textColor, frameInset):
+    """Internal function, renders the parts of a text-based dialog that never change into an image
+
+    Returns:
+        |    oBackground - a surface the size of the dialog, with the background color, frame and prompt
+
+    """
+    dialogWidth = theRect[2]
+    dialogHeight = theRect[3]
+    oBackground = pygame.Surface((dialogWidth, dialogHeight))
+    oBackground.fill(backgroundColor)
+    frameRect = pygame.Rect(frameInset, frameInset, dialogWidth - (2 * frameInset), dialogHeight - (2 * frameInset))
+    pygame.draw.rect(oBackground, DIALOG_BLACK, frameRect, 1)
+
+    promptText = pygwidgets.DisplayText(oBackground, (0, 30), prompt,
+                                        fontSize=24, width=dialogWidth, justified='center', textColor=textColor)
+    promptText.draw()
+    return oBackground
+
+def _layoutTextYesNoDialog(theWindow, theRect, prompt, yesButtonText, noButtonText,
+                           backgroundColor, textColor):
+    """Internal function, builds the background and widgets of a text-based yes/no dialog
+
+    Returns:
+        |    oBackground - image of the background, frame and prompt
+        |    yesButton - TextButton
+        |    noButton - TextButton, or None if noButtonText is None
+
+    """
+    dialogLeft = theRect[0]
+    dialogTop = theRect[1]
+    dialogWidth = theRect[2]
+    dialogHeight = theRect[3]
+
+    # The frame is drawn just inside the edge of the dialog box
+    oBackground = _makeTextDialogBackground(theRect, prompt, backgroundColor, textColor, 1)
+
+    # Create buttons, fix locations after finding out the size of the button(s)
+    if noButtonText is None:
+        noButton = None
+    else:
+        noButton = pygwidgets.TextButton(theWindow, (0, 0), noButtonText)
+    yesButton = pygwidgets.TextButton(theWindow, (0, 0), yesButtonText)
+
+    yesButtonRect = yesButton.getRect()
+    yesButtonHeight = yesButtonRect[3]
+    yesButtonWidth = yesButtonRect[2]  # get width
+    xPos = dialogLeft + dialogWidth - yesButtonWidth - DIALOG_INSET
+    buttonsY = dialogTop + dialogHeight - yesButtonHeight - 20
+    if noButton is not None:
+        noButton.setLoc((dialogLeft + DIALOG_INSET, buttonsY))
+    yesButton.setLoc((xPos, buttonsY))
+
+    return oBackground, yesButton, noButton
+
+def _layoutTextAnswerDialog(theWindow, theRect, prompt, okButtonText, cancelButtonText,
+                            backgroundColor, promptTextColor, inputTextColor):
+    """Internal function, builds the background and widgets of a text-based answer dialog
+
+    Returns:
+        |    oBackground - image of the background, frame and prompt
+        |    inputText - InputText where the user types an answer
+        |    okButton - TextButton
+        |    cancelButton - TextButton
+
+    """
+    dialogLeft = theRect[0]
+    dialogTop = theRect[1]
+    dialogWidth = theRect[2]
+    dialogHeight = theRect[3]
+
+    # The frame is drawn on the edge of the dialog box
+    oBackground = _makeTextDialogBackground(theRect, prompt, backgroundColor, promptTextColor, 0)
+
+    inputWidth = dialogWidth - (2 * DIALOG_INSET)
+    inputText = pygwidgets.InputText(theWindow, (dialogLeft + DIALOG_INSET, dialogTop + 80),
+                                     width=inputWidth, initialFocus=True, textColor=inputTextColor)
 
-    def sendAll(self, sendID, info):
-        """Call this method to send information to all other scenes
+    cancelButton = pygwidgets.TextButton(theWindow, (0, 0), cancelButtonText)
+    okButton = pygwidgets.TextButton(theWindow, (0, 0), okButtonText)
 
-        The other scenes must implement a method named:  receive().
-        You can pass any info that the sender and all other scenes agree upon
+    okButtonRect = okButton.getRect()
+    okButtonHeight = okButtonRect[3]
+    okButtonWidth = okButtonRect[2]  # get width
+    xPos = dialogLeft + dialogWidth - okButtonWidth - DIALOG_INSET
+    buttonsY = dialogTop + dialogHeight - okButtonHeight - 20
+    cancelButton.setLoc((dialogLeft + DIALOG_INSET, buttonsY))
+    okButton.setLoc((xPos, buttonsY))
 
-        Parameters:
-            |    sendID - the type of data you are sending the target scene (typically a string)
-            |    info - the actual data to send (can be any type)
+    return oBackground, inputText, okButton, cancelButton
 
-        """
-        self.oSceneMgr._sendAll_receive(self, sendID, info)  # pass in self to identify sender
+#
+#  Cache of laid out text dialogs
+#
+DIALOG_CACHE_SIZE = 16  # most text dialogs kept in the cache
+_dialogCacheDict = collections.OrderedDict()  # key: tuple of the dialog's parameters, value: tuple from a layout function
+_dialogCacheStatsDict = {'hits': 0, 'misses': 0}
 
-    def respond(self, requestID):
-        """Respond to a request for information from some other scene
+def _getCachedDialogLayout(cacheKey, layoutFunction, *layoutArgs):
+    """Internal function, returns the laid out background and widgets of a text-based dialog
 
-        You must override this method if your scene expects to handle
-        requests for information from other scenes via calls to:  request()
+    If a dialog with the same parameters was shown recently, its background and widgets are reused.
+    Otherwise, layoutFunction is called with layoutArgs, and the result is saved.  When the cache is full,
+    the least recently used dialog is removed.
 
-        Parameters:
-            |    requestID - identifier of what data to be sent back to the caller
+    """
+    if cacheKey in _dialogCacheDict:
+        _dialogCacheStatsDict['hits'] = _dialogCacheStatsDict['hits'] + 1
+        _dialogCacheDict.move_to_end(cacheKey)
+        return _dialogCacheDict[cacheKey]
+
+    _dialogCacheStatsDict['misses'] = _dialogCacheStatsDict['misses'] + 1
+    layoutTuple = layoutFunction(*layoutArgs)
+    _dialogCacheDict[cacheKey] = layoutTuple
+    if len(_dialogCacheDict) > DIALOG_CACHE_SIZE:
+        _dialogCacheDict.popitem(last=False)  # remove the least recently used
+    return layoutTuple
+
+def _resetDialogWidgets(widgetsList):
+    """Internal function, puts the widgets of a reused dialog back into their starting state"""
+    mouseLoc = pygame.mouse.get_pos()
+    for oWidget in widgetsList:
+        if isinstance(oWidget, pygwidgets.InputText):
+            if oWidget.getValue() != '':
+                oWidget.setValue('')
+            oWidget.focus = True  # dialogs are built with initialFocus=True
+            oWidget.cursorVisible = False
+        elif oWidget.rect.collidepoint(mouseLoc):  # same as a new button
+            oWidget.state = pygwidgets.PygWidgetsButton.STATE_OVER
+        else:
+            oWidget.state = pygwidgets.PygWidgetsButton.STATE_IDLE
 
-        """
-        raise NotImplementedError
+def clearDialogCache():
+    """Removes all the laid out dialogs from the cache used by textYesNoDialog and textAnswerDialog
 
-    def receive(self, receiveID, info):
-        """Receives information from another scene.
+    Call this to free up memory, or if you have changed the window.
+    The hit and miss counts are also set back to zero.
 
-        You must override this method if your scene expects to receive information from
-        other scenes sending information via calls to:  send
+    """
+    _dialogCacheDict.clear()
+    _dialogCacheStatsDict['hits'] = 0
+    _dialogCacheStatsDict['misses'] = 0
 
-        Parameters:
-            |    receiveID - an identifier for what type of information is being received
-            |    info - the information sent from another scene
+def getDialogCacheStats():
+    """Returns information about the cache used by textYesNoDialog and textAnswerDialog
 
-        """
-        raise NotImplementedError
+    Each time one of these dialogs is shown with the same window, rect, prompt, button texts,
+    and colors as a recent dialog, the background and widgets of that dialog are reused (a hit),
+    instead of rendering and laying out new ones (a miss).
 
-    def addScene(self, sceneKey, oScene):
-        """Call this method whenever you want to add a new scene dynamically.
-        For example, you could have a game with many levels (each implemented as a scene),
-        but only have the current level loaded.  As the player completes a level, you
-        could do a removeScene on the current level and do an addScene on the
-        next level, then do a goToScene on the new level.
+    Returns:
+        |    a dictionary with these keys:
+        |        'hits' - number of dialogs shown using the cache
+        |        'misses' - number of dialogs that had to be built
+        |        'size' - number of dialogs currently in the cache
+        |        'maxSize' - most dialogs kept in the cache (DIALOG_CACHE_SIZE)
 
-        Parameters:
-            |    sceneKey - a key to uniquely identify this scene (typically a string)
-            |    oScene - an instance of the new scene to be added
-            |         (typically, you would instantiate the new scene, and pass in that reference to this call)
+    """
+    return {'hits': _dialogCacheStatsDict['hits'], 'misses': _dialogCacheStatsDict['misses'],
+            'size': len(_dialogCacheDict), 'maxSize': DIALOG_CACHE_SIZE}
+
+def _getDialogRect(widgetsList):
+    """Internal function, returns the rect that covers all the widgets of a custom dialog"""
+    dialogRect = pygame.Rect(widgetsList[0].getRect())
+    return dialogRect.unionall([oWidget.getRect() for oWidget in widgetsList[1:]])
+
+def _getWidgetSignature(oWidget):
+    """Internal function, returns a tuple of everything about a widget that changes the way it is drawn"""
+    return (oWidget.visible, oWidget.isEnabled, getattr(oWidget, 'state', None),
+            getattr(oWidget, 'text', None), getattr(oWidget, 'focus', None),
+            getattr(oWidget, 'cursorPosition', None), getattr(oWidget, 'cursorVisible', None))
+
+def _getCursorBlinkMs(widgetsList):
+    """Internal function, returns the blink time of the cursor of a visible InputText with focus, or None"""
+    for oWidget in widgetsList:
+        if isinstance(oWidget, pygwidgets.InputText) and oWidget.focus and oWidget.visible:
+            return oWidget.cursorSwitchMs
+    return None
+
+def _runDialogLoop(theWindow, dialogRect, handleDialogEvent, drawDialog, widgetsList, waitForEvents):
+    """Internal function, runs the loop of a modal dialog until the user closes it
+
+    The area of the window under the dialog is saved first, and put back when the dialog is closed.
+    The dialog is only redrawn (over the saved area) when one of its widgets changes, or when the
+    cursor of an InputText with focus needs to blink, and only the dialog's rect of the window is updated.
 
-        """
-        self.oSceneMgr._addScene(sceneKey, oScene)
+    Parameters:
+        |    theWindow - the window to draw in
+        |    dialogRect - the rect of the window covered by the dialog
+        |    handleDialogEvent - function that is passed each event, returns a tuple of (closed, result)
+        |    drawDialog - function that draws the whole dialog
+        |    widgetsList - the widgets that the user can change (checked for changes after every event)
+        |    waitForEvents - if True, sleeps until there is an event, otherwise checks for events
+        |        DIALOG_FRAMES_PER_SECOND times per second
 
-    def removeScene(self, sceneKey):
-        """Call this method whenever you want to remove an existing scene
-        You can remove a scene to save memory - the scene object will be deleted.
-        The SceneMgr delays removing the scene until the next time thru the main loop.
-        Therefore, it is safe to call to removeScene from its own scene, if you immediately
-        go to another scene.
+    Returns:
+        |    the result from handleDialogEvent when the dialog is closed
 
-        Parameters:
-            |    sceneKey - the scene key (string) of the scene to remove
+    """
+    dialogRect = theWindow.get_rect().clip(dialogRect)
+    oSavedArea = theWindow.subsurface(dialogRect).copy()
+    signaturesList = None  # forces the first draw
+    lastDrawTicks = 0
+    clock = pygame.time.Clock()
 
-        """
-        self.oSceneMgr._removeScene(sceneKey)
+    # 6 - Loop forever
+    while True:
 
+        # 8 - Do any "per frame" actions
+        # An InputText only blinks its cursor when it is drawn, so draw it at the blink rate
+        blinkMs = _getCursorBlinkMs(widgetsList)
+        msSinceDraw = pygame.time.get_ticks() - lastDrawTicks
+        newSignaturesList = [_getWidgetSignature(oWidget) for oWidget in widgetsList]
+        if (newSignaturesList != signaturesList) or ((blinkMs is not None) and (msSinceDraw >= blinkMs)):
+
+            # 9 - Clear the dialog area (put back what was under the dialog), 10 - Draw the dialog
+            theWindow.blit(oSavedArea, dialogRect)
+            drawDialog()
+            lastDrawTicks = pygame.time.get_ticks()
+            msSinceDraw = 0
+            signaturesList = [_getWidgetSignature(oWidget) for oWidget in widgetsList]  # drawing can blink the cursor
+
+            # 11 - Update only the dialog area of the window
+            pygame.display.update(dialogRect)
 
-#
-#  Dialog functions
-#
-DIALOG_BACKGROUND_COLOR = (0, 200, 200)
-DIALOG_BLACK = (0, 0, 0)
+        # 7 - Check for and handle events
+        if waitForEvents:
+            # Sleep until there is an event (or the timeout), then get any others that are waiting
+            waitMs = DIALOG_WAIT_MS
+            if blinkMs is not None:
+                waitMs = max(1, min(waitMs, blinkMs - msSinceDraw))  # wake up to blink the cursor
+            eventsList = [pygame.event.wait(waitMs)] + pygame.event.get()
+        else:
+            # 12 - Slow things down a bit
+            clock.tick(DIALOG_FRAMES_PER_SECOND)
+            eventsList = pygame.event.get()
+
+        for event in eventsList:
+            if (event.type == QUIT) or \
+                ((event.type == KEYDOWN) and (event.key == K_ESCAPE)):
+                pygame.quit()
+                sys.exit()
+
+            closed, result = handleDialogEvent(event)
+            if closed:
+                # Put back what was under the dialog
+                theWindow.blit(oSavedArea, dialogRect)
+                pygame.display.update(dialogRect)
+                return result
 
 def textYesNoDialog(theWindow, theRect, prompt, yesButtonText='Yes', 
                     noButtonText='No', backgroundColor=DIALOG_BACKGROUND_COLOR,
-                    textColor=DIALOG_BLACK):
+                    textColor=DIALOG_BLACK, waitForEvents=False):
     """A function that puts up a text-based two-button modal dialog (typically Yes/No or OK/Cancel)
 
     It can also be used to put up a single button alert dialog (typically with an OK button)
 
+    When the dialog is closed, the area of the window under the dialog is put back the way it was.
+
     Parameters:
         |    theWindow - the window to draw in
         |    theRect - the rectangle (or tuple) of the dialog box in the application window
@@ -1078,6 +4375,8 @@ def textYesNoDialog(theWindow, theRect, prompt, yesButtonText='Yes',
         |              This way, you can present an "alert" box with only an 'OK' button
         |    backgroundColor - rgb background color for the dialog box (defaults to (0, 200, 200))
         |    textColor - rgb color for the prompt text (defaults to black)
+        |    waitForEvents - if True, the dialog sleeps until there is an event (uses much less power).
+        |       If False, the dialog checks for events DIALOG_FRAMES_PER_SECOND times per second (defaults to False)
 
     Returns:
         |    True - meaning the Yes button was pressed
@@ -1087,86 +4386,60 @@ def textYesNoDialog(theWindow, theRect, prompt, yesButtonText='Yes',
         |   (With an alert dialog, you can ignore the returned value, as it will always be True.)
 
     """
-    dialogLeft = theRect[0]
-    dialogTop = theRect[1]
-    dialogWidth = theRect[2]
-    dialogHeight = theRect[3]
-    frameRect = pygame.Rect(dialogLeft + 1, dialogTop + 1, dialogWidth - 2, dialogHeight - 2)
-    INSET = 30 # inset buttons from the edges of the dialog box
-
-    promptText = pygwidgets.DisplayText(theWindow, (dialogLeft, dialogTop + 30), prompt,
-                                        fontSize=24, width=dialogWidth, justified='center', textColor=textColor)
-
-    # Create buttons, fix locations after finding out the size of the button(s)
-    showNoButton = not (noButtonText is None)
-    if showNoButton:
-        noButton = pygwidgets.TextButton(theWindow, (0, 0), noButtonText)
-    yesButton = pygwidgets.TextButton(theWindow, (0, 0), yesButtonText)
-
-    yesButtonRect = yesButton.getRect()
-    yesButtonHeight = yesButtonRect[3]
-    yesButtonWidth = yesButtonRect[2]  # get width
-    xPos = dialogLeft + dialogWidth - yesButtonWidth - INSET
-    buttonsY = dialogTop + dialogHeight - yesButtonHeight - 20
-    if showNoButton:
-        noButton.setLoc((dialogLeft + INSET, buttonsY))
-    yesButton.setLoc((xPos, buttonsY))
+    cacheKey = ('yesNo', theWindow, tuple(theRect), prompt, yesButtonText, noButtonText,
+                tuple(backgroundColor), tuple(textColor))
+    oBackground, yesButton, noButton = _getCachedDialogLayout(cacheKey, _layoutTextYesNoDialog,
+                                            theWindow, theRect, prompt, yesButtonText, noButtonText,
+                                            backgroundColor, textColor)
+    showNoButton = not (noButton is None)
+    dialogLoc = (theRect[0], theRect[1])
 
     #print('In dialogYesNo')
     #print('theRect is', theRect)
-    #print('frameRect is', frameRect)
-
-    # 6 - Loop forever
-    while True:
-
-        # 7 - Check for and handle events
-        for event in pygame.event.get():
-            if (event.type == QUIT) or \
-                ((event.type == KEYDOWN) and (event.key == K_ESCAPE)):
-                pygame.quit()
-                sys.exit()
 
-            if showNoButton:
-                if noButton.handleEvent(event):
-                    return False
-
-            if yesButton.handleEvent(event):
-                return True
+    def handleDialogEvent(event):
+        if showNoButton:
+            if noButton.handleEvent(event):
+                return True, False
 
-        # 8 - Do any "per frame" actions
+        if yesButton.handleEvent(event):
+            return True, True
 
-        # 9 - Clear the window area before drawing it again
-        pygame.draw.rect(theWindow, backgroundColor, theRect)
-        pygame.draw.rect(theWindow, DIALOG_BLACK, frameRect, 1)
+        return False, None
 
-        # 10 - Draw the window elements
-        promptText.draw()
+    def drawDialog():
+        # Draw the background, frame and prompt (rendered once), then the buttons
+        theWindow.blit(oBackground, dialogLoc)
         if showNoButton:
             noButton.draw()
         yesButton.draw()
 
-        # 11 - Update the window
-        pygame.display.update()
-
-        # 12 - Slow things down a bit
-        #clock.tick(FRAMES_PER_SECOND)  # no need for this
+    widgetsList = [yesButton]
+    if showNoButton:
+        widgetsList.append(noButton)
+    _resetDialogWidgets(widgetsList)
+    return _runDialogLoop(theWindow, theRect, handleDialogEvent, drawDialog, widgetsList, waitForEvents)
 
 
-def customYesNoDialog(theWindow, oDialogImage, oPromptText, oYesButton, oNoButton=None):
+def customYesNoDialog(theWindow, oDialogImage, oPromptText, oYesButton, oNoButton=None, waitForEvents=False):
     """A function that puts up a custom two-button modal dialog (typically Yes/No or OK/Cancel)
 
     It can also be used to put up a single button alert dialog (with a typcial OK button)
 
+    When the dialog is closed, the area of the window under the dialog is put back the way it was.
+
     Parameters:
         |    theWindow - the window to draw in
         |    oDialogImage - an Image object (from pygwidgets) with the background of the dialog box
         |    oPromptText - a TextDisplay object (from pygwidgets) containing the prompt to display
         |    oYesButton - a CustomButton object (from pygwidgets) representing Yes or OK, etc.
 
-    Optional keyword parameter:
+    Optional keyword parameters:
         |    oNoButton - a CustomButton object (from pygwidgets) representing No or Cancel, etc. (default None)
         |       Note:  If oNoButton is None, the No button will not be drawn
         |              This way, you can present an "alert" box with only a single button, like 'OK'
+        |    waitForEvents - if True, the dialog sleeps until there is an event (uses much less power).
+        |       If False, the dialog checks for events DIALOG_FRAMES_PER_SECOND times per second (defaults to False)
 
     Returns:
         |    True - meaning the Yes button was pressed
@@ -1179,46 +4452,37 @@ def customYesNoDialog(theWindow, oDialogImage, oPromptText, oYesButton, oNoButto
 
     showNoButton = not (oNoButton is None)
 
-    # 6 - Loop forever
-    while True:
-
-        # 7 - Check for and handle events
-        for event in pygame.event.get():
-            if (event.type == QUIT) or \
-                ((event.type == KEYDOWN) and (event.key == K_ESCAPE)):
-                pygame.quit()
-                sys.exit()
-
-            if showNoButton:
-                if oNoButton.handleEvent(event):
-                    return False
-
-            if oYesButton.handleEvent(event):
-                return True
+    def handleDialogEvent(event):
+        if showNoButton:
+            if oNoButton.handleEvent(event):
+                return True, False
 
-        # 8 - Do any "per frame" actions
+        if oYesButton.handleEvent(event):
+            return True, True
 
-        # 9 - Clear the window area before drawing it again
+        return False, None
 
-        # 10 - Draw the window elements
+    def drawDialog():
         oDialogImage.draw()
         oPromptText.draw()
         if showNoButton:
             oNoButton.draw()
         oYesButton.draw()
 
-        # 11 - Update the window
-        pygame.display.update()
-
-        # 12 - Slow things down a bit
-        #clock.tick(FRAMES_PER_SECOND)  # no need for this
+    widgetsList = [oYesButton]
+    if showNoButton:
+        widgetsList.append(oNoButton)
+    dialogRect = _getDialogRect([oDialogImage, oPromptText] + widgetsList)
+    return _runDialogLoop(theWindow, dialogRect, handleDialogEvent, drawDialog, widgetsList, waitForEvents)
 
 
 def textAnswerDialog(theWindow, theRect, prompt, okButtonText='OK',
                     cancelButtonText='Cancel', backgroundColor=DIALOG_BACKGROUND_COLOR,
-                    promptTextColor=DIALOG_BLACK, inputTextColor=DIALOG_BLACK):
+                    promptTextColor=DIALOG_BLACK, inputTextColor=DIALOG_BLACK, waitForEvents=False):
     """A function that puts up a text-based two-button answerable modal dialog (typically OK/Cancel)
 
+    When the dialog is closed, the area of the window under the dialog is put back the way it was.
+
     Parameters:
         |    theWindow - the window to draw in
         |    theRect - the rectangle (or tuple) of the dialog box in the application window
@@ -1230,76 +4494,48 @@ def textAnswerDialog(theWindow, theRect, prompt, okButtonText='OK',
         |    backgroundColor - rgb background color for the dialog box (defaults to (0, 200, 200))
         |    promptTextColor - rgb color of the prompt text (defaults to black)
         |    inputTextColor - rgb color of the input text (defaults to black)
+        |    waitForEvents - if True, the dialog sleeps until there is an event (uses much less power).
+        |       If False, the dialog checks for events DIALOG_FRAMES_PER_SECOND times per second (defaults to False)
 
     Returns:
          |   userAnswer - If user presses OK, returns the text the user typed. Otherwise returns None
 
     """
-
-    dialogLeft = theRect[0]
-    dialogTop = theRect[1]
-    dialogWidth = theRect[2]
-    dialogHeight = theRect[3]
-    INSET = 30 # inset buttons from the edges of the dialog box
-
-    promptText = pygwidgets.DisplayText(theWindow, (dialogLeft, dialogTop + 30), prompt,
-                                        fontSize=24, width=dialogWidth, justified='center',
-                                        textColor=promptTextColor)
-
-    inputWidth = dialogWidth - (2 * INSET)
-    inputText = pygwidgets.InputText(theWindow, (dialogLeft + INSET, dialogTop + 80),
-                                     width=inputWidth, initialFocus=True, textColor=inputTextColor)
-
-    cancelButton = pygwidgets.TextButton(theWindow, (0, 0), cancelButtonText)
-    okButton = pygwidgets.TextButton(theWindow, (0, 0), okButtonText)
-
-    okButtonRect = okButton.getRect()
-    okButtonHeight = okButtonRect[3]
-    okButtonWidth = okButtonRect[2]  # get width
-    xPos = dialogLeft + dialogWidth - okButtonWidth - INSET
-    buttonsY = dialogTop + dialogHeight - okButtonHeight - 20
-    cancelButton.setLoc((dialogLeft + INSET, buttonsY))
-    okButton.setLoc((xPos, buttonsY))
-
-    # 6 - Loop forever
-    while True:
-
-        # 7 - Check for and handle events
-        for event in pygame.event.get():
-            if (event.type == QUIT) or \
-                ((event.type == KEYDOWN) and (event.key == K_ESCAPE)):
-                pygame.quit()
-                sys.exit()
-
-            if inputText.handleEvent(event) or okButton.handleEvent(event):
-                theAnswer = inputText.getValue()
-                return theAnswer
-
-            if cancelButton.handleEvent(event):
-                return None
-
-        # 8 - Do any "per frame" actions
-
-        # 9 - Clear the window area before drawing it again
-        pygame.draw.rect(theWindow, backgroundColor, theRect)
-        pygame.draw.rect(theWindow, DIALOG_BLACK, theRect, 1)
-
-        # 10 - Draw the window elements
-        promptText.draw()
+    cacheKey = ('answer', theWindow, tuple(theRect), prompt, okButtonText, cancelButtonText,
+                tuple(backgroundColor), tuple(promptTextColor), tuple(inputTextColor))
+    oBackground, inputText, okButton, cancelButton = _getCachedDialogLayout(cacheKey, _layoutTextAnswerDialog,
+                                            theWindow, theRect, prompt, okButtonText, cancelButtonText,
+                                            backgroundColor, promptTextColor, inputTextColor)
+    dialogLoc = (theRect[0], theRect[1])
+
+    def handleDialogEvent(event):
+        if inputText.handleEvent(event) or okButton.handleEvent(event):
+            theAnswer = inputText.getValue()
+            return True, theAnswer
+
+        if cancelButton.handleEvent(event):
+            return True, None
+
+        return False, None
+
+    def drawDialog():
+        # Draw the background, frame and prompt (rendered once), then the widgets
+        theWindow.blit(oBackground, dialogLoc)
         inputText.draw()
         cancelButton.draw()
         okButton.draw()
 
-        # 11 - Update the window
-        pygame.display.update()
-
-        # 12 - Slow things down a bit
-        #clock.tick(FRAMES_PER_SECOND)  # no need for this
+    widgetsList = [inputText, cancelButton, okButton]
+    _resetDialogWidgets(widgetsList)
+    return _runDialogLoop(theWindow, theRect, handleDialogEvent, drawDialog, widgetsList, waitForEvents)
 
 
-def customAnswerDialog(theWindow, oDialogImage, oPromptText, oAnswerText, oOKButton, oCancelButton):
+def customAnswerDialog(theWindow, oDialogImage, oPromptText, oAnswerText, oOKButton, oCancelButton,
+                       waitForEvents=False):
     """A function that puts up a custom two-button modal dialog (typically Yes/No or OK/Cancel)
 
+    When the dialog is closed, the area of the window under the dialog is put back the way it was.
+
     Parameters:
         |    theWindow - the window to draw in
         |    oDialogImage - an Image object (from pygwidgets) containing the background of the dialog box
@@ -1308,41 +4544,281 @@ def customAnswerDialog(theWindow, oDialogImage, oPromptText, oAnswerText, oOKBut
         |    oOKButton - a CustomButton object (from pygwidgets) representing OK, etc.
         |    oCancelButton - a CustomButton object (from pygwidgets) representing Cancel, etc.
 
+    Optional keyword parameter:
+        |    waitForEvents - if True, the dialog sleeps until there is an event (uses much less power).
+        |       If False, the dialog checks for events DIALOG_FRAMES_PER_SECOND times per second (defaults to False)
+
     Returns:
          |    userAnswer - If user presse OK, returns the text the user typed. Otherwise returns None
 
     """
+    def handleDialogEvent(event):
+        if oAnswerText.handleEvent(event) or oOKButton.handleEvent(event):
+            userResponse = oAnswerText.getValue()
+            return True, userResponse
 
-    # 6 - Loop forever
-    while True:
-
-        # 7 - Check for and handle events
-        for event in pygame.event.get():
-            if (event.type == QUIT) or \
-                ((event.type == KEYDOWN) and (event.key == K_ESCAPE)):
-                pygame.quit()
-                sys.exit()
-
-            if oAnswerText.handleEvent(event) or oOKButton.handleEvent(event):
-                userResponse = oAnswerText.getValue()
-                return userResponse
+        if oCancelButton.handleEvent(event):
+            return True, None
 
-            if oCancelButton.handleEvent(event):
-                return None
+        return False, None
 
-        # 8 - Do any "per frame" actions
-
-        # 9 - Clear the window area before drawing it again
-
-        # 10 - Draw the window elements
+    def drawDialog():
         oDialogImage.draw()
         oAnswerText.draw()
         oPromptText.draw()
         oCancelButton.draw()
         oOKButton.draw()
 
-        # 11 - Update the window
-        pygame.display.update()
+    widgetsList = [oAnswerText, oCancelButton, oOKButton]
+    dialogRect = _getDialogRect([oDialogImage, oPromptText] + widgetsList)
+    return _runDialogLoop(theWindow, dialogRect, handleDialogEvent, drawDialog, widgetsList, waitForEvents)
+
+
+#
+#  Dialog scene classes
+#
+class _DialogScene(Scene):
+    """Internal base class for the dialog scenes
+
+    A dialog scene is shown by calling showDialog() in the current scene.  It runs as an overlay scene,
+    inside the SceneMgr's loop (at the frame rate of the SceneMgr), so the game does not stop while it is up.
+    When the user closes the dialog, the dialog is popped, and the result is given to the callBack.
 
-        # 12 - Slow things down a bit
-        #clock.tick(FRAMES_PER_SECOND)  # no need for this
+    """
+    def __init__(self, window):
+        self.window = window
+        self.callBack = None
+        self.done = False
+        self.result = None
+
+    def _start(self, callBack):
+        """Internal method, called by showDialog before the dialog is pushed"""
+        self.callBack = callBack
+        self.done = False
+        self.result = None
+
+    def _finish(self, result):
+        """Internal method, closes the dialog and reports the result"""
+        self.done = True
+        self.result = result
+        self.popScene(result)
+        if self.callBack is not None:
+            self.callBack(result)
+
+    def isDone(self):
+        """Returns True if the user has closed the dialog, False if it is still up"""
+        return self.done
+
+    def getResult(self):
+        """Returns the result of the dialog (None while the dialog is still up)"""
+        return self.result
+
+    def _isReady(self):
+        """Internal method, tells the SceneMgr whether a script awaiting this dialog can continue"""
+        return self.done
+
+    def __await__(self):
+        """Allows a script to wait for the result:  result = await self.showDialog(oDialog)"""
+        if not self.done:
+            yield self
+        return self.result
+
+
+class TextYesNoDialogScene(_DialogScene):
+    """A text-based two-button dialog (typically Yes/No or OK/Cancel), that does not stop the game
+
+    This is the non-blocking version of textYesNoDialog.  Create it, then show it from your scene:
+
+        |    self.oDialog = pyghelpers.TextYesNoDialogScene(self.window, (100, 100, 400, 200), 'Save the game?')
+        |    self.showDialog(self.oDialog, self.saveAnswered)  # later, saveAnswered(True or False) is called
+
+    Instead of using a callBack, you can check isDone() and getResult() of the dialog.
+
+    Parameters:
+        |    window - the window to draw in
+        |    theRect - the rectangle (or tuple) of the dialog box in the application window
+        |    prompt - prompt (title) string to be displayed in the dialog box
+
+    Optional keyword parameters:
+        |    yesButtonText - text on the Yes button (defaults to 'Yes')
+        |    noButtonText - text on the No button (defaults to 'No')
+        |       Note:  If noButtonText is None, the nothing will be drawn for the No button
+        |              This way, you can present an "alert" box with only an 'OK' button
+        |    backgroundColor - rgb background color for the dialog box (defaults to (0, 200, 200))
+        |    textColor - rgb color for the prompt text (defaults to black)
+
+    Result:
+        |    True if the Yes button was pressed, False if the No button was pressed
+
+    """
+    def __init__(self, window, theRect, prompt, yesButtonText='Yes',
+                 noButtonText='No', backgroundColor=DIALOG_BACKGROUND_COLOR,
+                 textColor=DIALOG_BLACK):
+        super().__init__(window)
+        self.dialogRect = pygame.Rect(theRect)
+        self.oBackground, self.yesButton, self.noButton = \
+                    _layoutTextYesNoDialog(window, theRect, prompt, yesButtonText, noButtonText,
+                                           backgroundColor, textColor)
+
+    def handleInputs(self, eventsList, keyPressedList):
+        for event in eventsList:
+            if self.noButton is not None:
+                if self.noButton.handleEvent(event):
+                    self._finish(False)
+                    return
+
+            if self.yesButton.handleEvent(event):
+                self._finish(True)
+                return
+
+    def draw(self, alpha=None):
+        self.window.blit(self.oBackground, self.dialogRect)
+        if self.noButton is not None:
+            self.noButton.draw()
+        self.yesButton.draw()
+        return [self.dialogRect]
+
+
+class CustomYesNoDialogScene(_DialogScene):
+    """A custom two-button dialog (typically Yes/No or OK/Cancel), that does not stop the game
+
+    This is the non-blocking version of customYesNoDialog.  Create it, then show it from your scene
+    by calling showDialog() (see TextYesNoDialogScene).
+
+    Parameters:
+        |    window - the window to draw in
+        |    oDialogImage - an Image object (from pygwidgets) with the background of the dialog box
+        |    oPromptText - a TextDisplay object (from pygwidgets) containing the prompt to display
+        |    oYesButton - a CustomButton object (from pygwidgets) representing Yes or OK, etc.
+
+    Optional keyword parameter:
+        |    oNoButton - a CustomButton object (from pygwidgets) representing No or Cancel, etc. (default None)
+        |       Note:  If oNoButton is None, the No button will not be drawn
+        |              This way, you can present an "alert" box with only a single button, like 'OK'
+
+    Result:
+        |    True if the Yes button was pressed, False if the No button was pressed
+
+    """
+    def __init__(self, window, oDialogImage, oPromptText, oYesButton, oNoButton=None):
+        super().__init__(window)
+        self.oDialogImage = oDialogImage
+        self.oPromptText = oPromptText
+        self.oYesButton = oYesButton
+        self.oNoButton = oNoButton
+
+    def handleInputs(self, eventsList, keyPressedList):
+        for event in eventsList:
+            if self.oNoButton is not None:
+                if self.oNoButton.handleEvent(event):
+                    self._finish(False)
+                    return
+
+            if self.oYesButton.handleEvent(event):
+                self._finish(True)
+                return
+
+    def draw(self, alpha=None):
+        self.oDialogImage.draw()
+        self.oPromptText.draw()
+        changedRectsList = [self.oDialogImage.getRect(), self.oPromptText.getRect(), self.oYesButton.getRect()]
+        if self.oNoButton is not None:
+            self.oNoButton.draw()
+            changedRectsList.append(self.oNoButton.getRect())
+        self.oYesButton.draw()
+        return changedRectsList
+
+
+class TextAnswerDialogScene(_DialogScene):
+    """A text-based two-button answerable dialog (typically OK/Cancel), that does not stop the game
+
+    This is the non-blocking version of textAnswerDialog.  Create it, then show it from your scene
+    by calling showDialog() (see TextYesNoDialogScene).
+
+    Parameters:
+        |    window - the window to draw in
+        |    theRect - the rectangle (or tuple) of the dialog box in the application window
+        |    prompt - prompt (title) string to be displayed in the dialog box
+
+    Optional keyword parameters:
+        |    okButtonText - text on the OK button (defaults to 'OK')
+        |    cancelButtonText - text on the Cancel button (defaults to 'Cancel')
+        |    backgroundColor - rgb background color for the dialog box (defaults to (0, 200, 200))
+        |    promptTextColor - rgb color of the prompt text (defaults to black)
+        |    inputTextColor - rgb color of the input text (defaults to black)
+
+    Result:
+         |   If user presses OK, the text the user typed. Otherwise None
+
+    """
+    def __init__(self, window, theRect, prompt, okButtonText='OK',
+                 cancelButtonText='Cancel', backgroundColor=DIALOG_BACKGROUND_COLOR,
+                 promptTextColor=DIALOG_BLACK, inputTextColor=DIALOG_BLACK):
+        super().__init__(window)
+        self.dialogRect = pygame.Rect(theRect)
+        self.oBackground, self.inputText, self.okButton, self.cancelButton = \
+                    _layoutTextAnswerDialog(window, theRect, prompt, okButtonText, cancelButtonText,
+                                            backgroundColor, promptTextColor, inputTextColor)
+
+    def handleInputs(self, eventsList, keyPressedList):
+        for event in eventsList:
+            if self.inputText.handleEvent(event) or self.okButton.handleEvent(event):
+                self._finish(self.inputText.getValue())
+                return
+
+            if self.cancelButton.handleEvent(event):
+                self._finish(None)
+                return
+
+    def draw(self, alpha=None):
+        self.window.blit(self.oBackground, self.dialogRect)
+        self.inputText.draw()
+        self.cancelButton.draw()
+        self.okButton.draw()
+        return [self.dialogRect]
+
+
+class CustomAnswerDialogScene(_DialogScene):
+    """A custom two-button answerable dialog (typically OK/Cancel), that does not stop the game
+
+    This is the non-blocking version of customAnswerDialog.  Create it, then show it from your scene
+    by calling showDialog() (see TextYesNoDialogScene).
+
+    Parameters:
+        |    window - the window to draw in
+        |    oDialogImage - an Image object (from pygwidgets) containing the background of the dialog box
+        |    oPromptText - a TextDisplay object (from pygwidgets) containing the prompt to display
+        |    oAnswerText - an InputText object (from pygwidgets) where the user types their answer
+        |    oOKButton - a CustomButton object (from pygwidgets) representing OK, etc.
+        |    oCancelButton - a CustomButton object (from pygwidgets) representing Cancel, etc.
+
+    Result:
+         |   If user presses OK, the text the user typed. Otherwise None
+
+    """
+    def __init__(self, window, oDialogImage, oPromptText, oAnswerText, oOKButton, oCancelButton):
+        super().__init__(window)
+        self.oDialogImage = oDialogImage
+        self.oPromptText = oPromptText
+        self.oAnswerText = oAnswerText
+        self.oOKButton = oOKButton
+        self.oCancelButton = oCancelButton
+
+    def handleInputs(self, eventsList, keyPressedList):
+        for event in eventsList:
+            if self.oAnswerText.handleEvent(event) or self.oOKButton.handleEvent(event):
+                self._finish(self.oAnswerText.getValue())
+                return
+
+            if self.oCancelButton.handleEvent(event):
+                self._finish(None)
+                return
+
+    def draw(self, alpha=None):
+        self.oDialogImage.draw()
+        self.oAnswerText.draw()
+        self.oPromptText.draw()
+        self.oCancelButton.draw()
+        self.oOKButton.draw()
+        return [self.oDialogImage.getRect(), self.oAnswerText.getRect(), self.oPromptText.getRect(),
+                self.oCancelButton.getRect(), self.oOKButton.getRect()]
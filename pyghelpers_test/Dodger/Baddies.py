@@ -2,6 +2,7 @@
 
 import pygame
 import pygwidgets
+import pyghelpers
 import random
 from Constants import *
 
@@ -46,15 +47,17 @@ class Baddie():
 
 # BaddieMgr class
 class BaddieMgr():
-    ADD_NEW_BADDIE_RATE = 8  # how often to add a new Baddie
+    ADD_NEW_BADDIE_RATE = 0.2  # how often (in seconds) to add a new Baddie
 
     def __init__(self, window):
         self.window = window
+        # A repeating timer keeps the rate steady, even if the frame rate drops
+        self.oNewBaddieTimer = pyghelpers.Timer(BaddieMgr.ADD_NEW_BADDIE_RATE, repeat=True)
         self.reset()
 
     def reset(self):  # called when starting a new game
         self.baddiesList = []
-        self.nFramesTilNextBaddie = BaddieMgr.ADD_NEW_BADDIE_RATE
+        self.oNewBaddieTimer.start()
 
     def update(self):
         # Tell each Baddie to update itself
@@ -67,12 +70,11 @@ class BaddieMgr():
                 self.baddiesList.remove(oBaddie)
                 nBaddiesRemoved = nBaddiesRemoved + 1
 
-        # Check if it's time to add a new Baddie
-        self.nFramesTilNextBaddie = self.nFramesTilNextBaddie - 1
-        if self.nFramesTilNextBaddie == 0:
+        # Add a new Baddie for each time the timer has finished
+        nNewBaddies = self.oNewBaddieTimer.update()
+        for count in range(nNewBaddies):
             oBaddie = Baddie(self.window)
             self.baddiesList.append(oBaddie)
-            self.nFramesTilNextBaddie = BaddieMgr.ADD_NEW_BADDIE_RATE
 
         # Return that count of Baddies that were removed
         return nBaddiesRemoved
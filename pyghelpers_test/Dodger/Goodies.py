@@ -1,6 +1,7 @@
 # Goodie and GoddieMgr classes
 import pygame
 import pygwidgets
+import pyghelpers
 import random
 from Constants import *
 
@@ -58,16 +59,17 @@ class Goodie():
 
 
 class GoodieMgr():
-    GOODIE_RATE_LO = 90
-    GOODIE_RATE_HI = 111
+    GOODIE_RATE_LO = 2.25  # seconds between Goodies
+    GOODIE_RATE_HI = 2.775
 
     def __init__(self, window):
         self.window = window
+        self.oNewGoodieTimer = pyghelpers.Timer(GoodieMgr.GOODIE_RATE_HI)
         self.reset()
 
     def reset(self):  # Called when starting a new game
         self.goodiesList = []
-        self.nFramesTilNextGoodie = GoodieMgr.GOODIE_RATE_HI
+        self.oNewGoodieTimer.start(GoodieMgr.GOODIE_RATE_HI)
 
     def update(self, thePlayerRect):
         # Tell each Goodie to update itself.
@@ -84,15 +86,14 @@ class GoodieMgr():
                 self.goodiesList.remove(oGoodie)  # remove this Goodie
                 nGoodiesHit = nGoodiesHit + 1
         
-        # If the correct amount of frames have passed,
-        # add a new Goodie (and reset the counter)
-        self.nFramesTilNextGoodie = self.nFramesTilNextGoodie - 1
-        if self.nFramesTilNextGoodie == 0:
+        # If the timer has finished,
+        # add a new Goodie (and restart the timer with a random time)
+        if self.oNewGoodieTimer.update():
             oGoodie = Goodie(self.window)
             self.goodiesList.append(oGoodie)
-            self.nFramesTilNextGoodie = random.randrange(
+            self.oNewGoodieTimer.start(random.uniform(
                                                             GoodieMgr.GOODIE_RATE_LO,
-                                                            GoodieMgr.GOODIE_RATE_HI)
+                                                            GoodieMgr.GOODIE_RATE_HI))
 
         return nGoodiesHit  # return number of Goodies that contacted player
 
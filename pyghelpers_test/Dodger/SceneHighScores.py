@@ -3,7 +3,7 @@ import pygwidgets
 import pyghelpers
 from HighScoresData import *
 
-def showCustomAnswerDialog(theWindow, theText):
+def makeCustomAnswerDialog(theWindow, theText):
     oDialogBackground = pygwidgets.Image(theWindow, (35, 450),
                                                 'images/dialog.png')
     oPromptDisplayText = pygwidgets.DisplayText(theWindow, (0, 480),
@@ -21,13 +21,13 @@ def showCustomAnswerDialog(theWindow, theText):
                                                 over='images/addOver.png',
                                                 down='images/addDown.png',
                                                 disabled='images/addDisabled.png')
-    userAnswer = pyghelpers.customAnswerDialog(theWindow,
+    oDialog = pyghelpers.CustomAnswerDialogScene(theWindow,
                                                 oDialogBackground,
                                                 oPromptDisplayText, oUserInputText,
                                                 oYesButton, oNoButton)
-    return userAnswer
+    return oDialog
 
-def showCustomResetDialog(theWindow, theText):
+def makeCustomResetDialog(theWindow, theText):
     oDialogBackground = pygwidgets.Image(theWindow,
                                                (35, 450), 'images/dialog.png')
     oPromptDisplayText = pygwidgets.DisplayText(theWindow, (0, 480),
@@ -43,13 +43,16 @@ def showCustomResetDialog(theWindow, theText):
                                                 over='images/okOver.png',
                                                 down='images/okDown.png',
                                                 disabled='images/okDisabled.png')
-    choiceAsBoolean = pyghelpers.customYesNoDialog(theWindow,
+    oDialog = pyghelpers.CustomYesNoDialogScene(theWindow,
                                                 oDialogBackground, oPromptDisplayText,
                                                 oYesButton, oNoButton)
-    return choiceAsBoolean
+    return oDialog
 
 
 class SceneHighScores(pyghelpers.Scene):
+    # The Play scene asks for HIGH_SCORES_DATA in every game, save the answer until the scores change
+    cacheableRequestIDs = (HIGH_SCORES_DATA,)
+
     def __init__(self, window):
         self.window = window
         self.oHighScoresData = HighScoresData()
@@ -104,8 +107,11 @@ class SceneHighScores(pyghelpers.Scene):
         dialogQuestion = ('To record your score of ' +
                                  str(newHighScoreValue) + ',\n' +
                                  'please enter your name:')
-        playerName = showCustomAnswerDialog(self.window,
-                                                                    dialogQuestion)
+        self.newHighScoreValue = newHighScoreValue
+        oDialog = makeCustomAnswerDialog(self.window, dialogQuestion)
+        self.showDialog(oDialog, self.nameAnswered)
+
+    def nameAnswered(self, playerName):
         if playerName is None:
             return  # user pressed Cancel
 
@@ -113,11 +119,18 @@ class SceneHighScores(pyghelpers.Scene):
         if playerName == '':
             playerName = 'Anonymous'
         self.oHighScoresData.addHighScore(playerName,
-                                                            newHighScoreValue)
+                                                            self.newHighScoreValue)
+        self.invalidateResponse(HIGH_SCORES_DATA)
 
         # Show the updated high scores table
         self.showHighScores()
 
+    def resetAnswered(self, confirmed):
+        if confirmed:
+            self.oHighScoresData.resetScores()
+            self.invalidateResponse(HIGH_SCORES_DATA)
+            self.showHighScores()
+
     def showHighScores(self):
         # Get the scores and names, show them in two fields
         scoresList, namesList = self.oHighScoresData.getScoresAndNames()
@@ -133,11 +146,9 @@ class SceneHighScores(pyghelpers.Scene):
                 self.goToScene(SCENE_PLAY)
 
             elif self.resetScoresButton.handleEvent(event):
-                confirmed = showCustomResetDialog(self.window,
+                oDialog = makeCustomResetDialog(self.window,
                                         'Are you sure you want to \nRESET the high scores?')
-                if confirmed:
-                    self.oHighScoresData.resetScores()
-                    self.showHighScores()
+                self.showDialog(oDialog, self.resetAnswered)
 
     def draw(self):
         self.backgroundImage.draw()
@@ -6,7 +6,7 @@ from Player import *
 from Baddies import *
 from Goodies import *
 
-def showCustomYesNoDialog(theWindow, theText):
+def makeCustomYesNoDialog(theWindow, theText):
     oDialogBackground = pygwidgets.Image(theWindow, (40, 250),
                                             'images/dialog.png')
     oPromptDisplayText = pygwidgets.DisplayText(theWindow, (0, 290),
@@ -25,18 +25,22 @@ def showCustomYesNoDialog(theWindow, theText):
                                             down='images/noThanksDown.png',
                                             disabled='images/noThanksDisabled.png')
 
-    choiceAsBoolean = pyghelpers.customYesNoDialog(theWindow,
+    oDialog = pyghelpers.CustomYesNoDialogScene(theWindow,
                                             oDialogBackground, oPromptDisplayText,
                                             oYesButton, oNoButton)
-    return choiceAsBoolean
+    return oDialog
 
 BOTTOM_RECT = (0, GAME_HEIGHT + 1, WINDOW_WIDTH,
                                 WINDOW_HEIGHT - GAME_HEIGHT)
+GAME_RECT = (0, 0, WINDOW_WIDTH, GAME_HEIGHT)
 STATE_WAITING = 'waiting'
 STATE_PLAYING = 'playing'
 STATE_GAME_OVER = 'game over'
 
 class ScenePlay(pyghelpers.Scene):
+    # Only the events used by the buttons and check box, fast mouse movements become a single event
+    eventTypes = (MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, KEYDOWN, KEYUP)
+    coalesceMouseMotion = True
 
     def __init__(self, window):
         self.window = window
@@ -90,6 +94,16 @@ class ScenePlay(pyghelpers.Scene):
                                         fontSize=36, textColor=WHITE,
                                         justified='right')
 
+        # The controls are drawn by drawWidgets, only when they change
+        self.addWidget(self.controlsBackground)
+        self.addWidget(self.titleText)
+        self.addWidget(self.scoreText)
+        self.addWidget(self.highScoreText)
+        self.addWidget(self.soundCheckBox)
+        self.addWidget(self.quitButton)
+        self.addWidget(self.highScoresButton)
+        self.addWidget(self.newGameButton)
+
         pygame.mixer.music.load('sounds/background.mid')
         self.dingSound = pygame.mixer.Sound('sounds/ding.wav')
         self.gameOverSound = pygame.mixer.Sound('sounds/gameover.wav')
@@ -195,16 +209,22 @@ class ScenePlay(pyghelpers.Scene):
                     dialogText = (scoreString +
                                       'gets you on the high scores list.')
 
-                result = showCustomYesNoDialog(self.window, dialogText)
-                if result: # navigate
-                    self.goToScene(SCENE_HIGH_SCORES, self.score)  
+                # The dialog runs inside the SceneMgr, gotoHighScoresAnswered is called when it closes
+                oDialog = makeCustomYesNoDialog(self.window, dialogText)
+                self.showDialog(oDialog, self.gotoHighScoresAnswered)
 
             self.newGameButton.enable()
             self.highScoresButton.enable()
             self.soundCheckBox.enable()
             self.quitButton.enable()
     
+    def gotoHighScoresAnswered(self, result):
+        if result: # navigate
+            self.goToScene(SCENE_HIGH_SCORES, self.score)
+
     def draw(self):
+        # Only draw in the game area, so Baddies going off the bottom don't draw over the controls
+        self.window.set_clip(GAME_RECT)
         self.window.fill(BLACK)
     
         # Tell the managers to draw all the Baddies and Goodies
@@ -213,16 +233,10 @@ class ScenePlay(pyghelpers.Scene):
     
         # Tell the Player to draw itself
         self.oPlayer.draw()
+        self.window.set_clip(None)
     
-        # Draw all the info at the bottom of the window
-        self.controlsBackground.draw()
-        self.titleText.draw()
-        self.scoreText.draw()
-        self.highScoreText.draw()
-        self.soundCheckBox.draw()
-        self.quitButton.draw()
-        self.highScoresButton.draw()
-        self.newGameButton.draw()
+        # Draw the info at the bottom of the window (only the parts that changed)
+        self.drawWidgets()
 
         if self.playingState == STATE_GAME_OVER:
             self.gameOverImage.draw()
@@ -15,6 +15,9 @@ setup(
         'pygame-ce>=2.0',
         'pygwidgets>=1.0',        
         ],
+    extras_require={
+        'numpy': ['numpy'],  # optional, makes TimerArray faster
+        },
     keywords="Timer classes, Scene and SceneMgr classes, Dialogs",
     classifiers=[
         "Programming Language :: Python :: 3",
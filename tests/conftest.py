@@ -0,0 +1,28 @@
+# Shared fixtures for the pyghelpers tests.
+# All tests run headless (no window is shown, no sound), using a SimulatedClock for repeatable times.
+
+import pygame
+import pytest
+
+import pyghelpers
+
+WINDOW_WIDTH = 640
+WINDOW_HEIGHT = 480
+
+
+@pytest.fixture(scope='session')
+def window():
+    pyghelpers.setHeadlessMode()
+    pygame.init()
+    theWindow = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    yield theWindow
+    pygame.quit()
+
+
+@pytest.fixture(autouse=True)
+def simulatedClock():
+    oClock = pyghelpers.SimulatedClock(1 / 60)
+    pyghelpers.setClock(oClock)
+    yield oClock
+    pyghelpers.setTimeScale(1.0)
+    pyghelpers.setClock(pyghelpers.FrameClock())
@@ -0,0 +1,71 @@
+# Tests of FrameClock, SimulatedClock, and the clock used by all timers (setClock and getClock)
+
+import pyghelpers
+
+
+class TimedScene(pyghelpers.Scene):
+    def __init__(self):
+        self.oTimer = pyghelpers.Timer(1)
+        self.oTimer.start()
+        self.elapsedList = []
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def update(self, dt=None):
+        self.elapsedList.append(self.oTimer.getTime())
+
+    def draw(self, alpha=None):
+        pass
+
+
+def test_set_clock_and_get_clock(simulatedClock):
+    assert pyghelpers.getClock() is simulatedClock
+    oClock = pyghelpers.SimulatedClock(0.5, startTime=100.0)
+    pyghelpers.setClock(oClock)
+    assert pyghelpers.getClock() is oClock
+
+
+def test_simulated_clock_only_moves_when_ticked_or_advanced():
+    oClock = pyghelpers.SimulatedClock(0.25, startTime=10.0)
+    assert oClock.getTime() == 10.0
+    assert oClock.getTime() == 10.0
+    oClock.tick()
+    assert oClock.getTime() == 10.25
+    oClock.advance(3)
+    assert oClock.getTime() == 13.25
+
+
+def test_frame_clock_keeps_the_time_of_the_frame(monkeypatch):
+    fakeTimesList = [5.0]
+    monkeypatch.setattr(pyghelpers.pyghelpers.time, 'perf_counter', lambda: fakeTimesList[0])
+    oClock = pyghelpers.FrameClock()
+    assert oClock.getTime() == 5.0  # not ticked yet, reads the current time
+    fakeTimesList[0] = 6.0
+    assert oClock.getTime() == 6.0
+    oClock.tick()
+    fakeTimesList[0] = 7.0
+    assert oClock.getTime() == 6.0  # the time saved at the start of the frame
+    oClock.tick()
+    assert oClock.getTime() == 7.0
+
+
+def test_timers_read_the_clock(simulatedClock):
+    finishedList = []
+    oTimer = pyghelpers.Timer(2, nickname='timer', callBack=finishedList.append)
+    oTimer.start()
+    simulatedClock.advance(1.5)
+    assert oTimer.getTime() == 1.5
+    assert oTimer.update() is False
+    simulatedClock.advance(0.5)
+    assert oTimer.update() is True
+    assert finishedList == ['timer']
+
+
+def test_scene_mgr_ticks_the_clock_once_per_frame(window, simulatedClock):
+    simulatedClock.secondsPerTick = 0.5
+    oScene = TimedScene()
+    oSceneMgr = pyghelpers.SceneMgr({'timed': oScene}, 30)
+    oSceneMgr.run(maxFrames=4, throttle=False)
+    assert oScene.elapsedList == [0.5, 1.0, 1.5, 2.0]
+    assert simulatedClock.getTime() == 2.0
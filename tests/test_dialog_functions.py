@@ -0,0 +1,112 @@
+# Tests of the modal dialog functions (textYesNoDialog, textAnswerDialog, ...)
+
+import pygame
+import pytest
+
+import pyghelpers
+
+DIALOG_RECT = (100, 100, 400, 200)
+
+
+def postClick(loc):
+    """Puts the events of a mouse click at a location in pygame's event queue"""
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=loc, rel=(0, 0), buttons=(0, 0, 0)))
+    for eventType in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        pygame.event.post(pygame.event.Event(eventType, pos=loc, button=1))
+
+
+def getYesNoLocs(window):
+    oProbe = pyghelpers.TextYesNoDialogScene(window, DIALOG_RECT, 'Sure?')
+    return oProbe.yesButton.getRect().center, oProbe.noButton.getRect().center
+
+
+@pytest.mark.parametrize('waitForEvents', [False, True])
+def test_yes_no_dialog_returns_the_button_clicked(window, waitForEvents):
+    yesLoc, noLoc = getYesNoLocs(window)
+    postClick(yesLoc)
+    assert pyghelpers.textYesNoDialog(window, DIALOG_RECT, 'Sure?', waitForEvents=waitForEvents) is True
+    postClick(noLoc)
+    assert pyghelpers.textYesNoDialog(window, DIALOG_RECT, 'Sure?', waitForEvents=waitForEvents) is False
+
+
+def test_window_under_the_dialog_is_restored(window):
+    yesLoc, noLoc = getYesNoLocs(window)
+    window.fill((10, 20, 30))
+    pygame.draw.circle(window, (200, 100, 50), (300, 200), 80)
+    beforeBytes = pygame.image.tobytes(window, 'RGB')
+    postClick(yesLoc)
+    pyghelpers.textYesNoDialog(window, DIALOG_RECT, 'Sure?')
+    assert pygame.image.tobytes(window, 'RGB') == beforeBytes
+
+
+@pytest.mark.parametrize('waitForEvents', [False, True])
+def test_text_cursor_blinks_while_waiting(window, monkeypatch, waitForEvents):
+    oProbe = pyghelpers.TextAnswerDialogScene(window, DIALOG_RECT, 'Name?')
+    okLoc = oProbe.okButton.getRect().center
+    updatesList = []
+    realUpdate = pygame.display.update
+    monkeypatch.setattr(pygame.display, 'update', lambda *args: (updatesList.append(args), realUpdate(*args)))
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=okLoc, rel=(0, 0), buttons=(0, 0, 0)))
+    # Click OK after the cursor has had time to blink a few times
+    pygame.time.set_timer(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=okLoc, button=1), 1300, 1)
+    pygame.time.set_timer(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=okLoc, button=1), 1320, 1)
+    pyghelpers.textAnswerDialog(window, DIALOG_RECT, 'Name?', waitForEvents=waitForEvents)
+    # First draw, at least two blinks (500 ms each), the click, and restoring the window
+    assert len(updatesList) >= 5
+
+
+def test_dialog_checks_for_events_at_a_limited_rate(window, monkeypatch):
+    yesLoc, noLoc = getYesNoLocs(window)
+    nChecksList = [0]
+    realGet = pygame.event.get
+
+    def countingGet(*args, **kwargs):
+        nChecksList[0] = nChecksList[0] + 1
+        return realGet(*args, **kwargs)
+
+    monkeypatch.setattr(pygame.event, 'get', countingGet)
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=yesLoc, rel=(0, 0), buttons=(0, 0, 0)))
+    pygame.time.set_timer(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=yesLoc, button=1), 500, 1)
+    pygame.time.set_timer(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=yesLoc, button=1), 520, 1)
+    pyghelpers.textYesNoDialog(window, DIALOG_RECT, 'Sure?')
+    assert nChecksList[0] <= 2 * pyghelpers.pyghelpers.DIALOG_FRAMES_PER_SECOND  # about half a second of checks
+
+
+def postTyping(text):
+    for character in text:
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=ord(character), unicode=character, mod=0,
+                                             scancode=0))
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=ord(character), unicode=character, mod=0,
+                                             scancode=0))
+
+
+def showAnswerDialog(window, prompt, typedText):
+    oProbe = pyghelpers.TextAnswerDialogScene(window, DIALOG_RECT, prompt)
+    postClick(oProbe.okButton.getRect().center)
+    clickEventsList = pygame.event.get()
+    postTyping(typedText)
+    for event in clickEventsList:
+        pygame.event.post(event)
+    return pyghelpers.textAnswerDialog(window, DIALOG_RECT, prompt)
+
+
+def test_same_dialog_is_reused_from_the_cache(window):
+    pyghelpers.clearDialogCache()
+    assert showAnswerDialog(window, 'Name?', 'abc') == 'abc'
+    # The reused dialog starts with an empty answer
+    assert showAnswerDialog(window, 'Name?', 'xy') == 'xy'
+    statsDict = pyghelpers.getDialogCacheStats()
+    assert (statsDict['hits'], statsDict['misses'], statsDict['size']) == (1, 1, 1)
+
+
+def test_least_recently_used_dialog_is_removed_from_the_cache(window, monkeypatch):
+    monkeypatch.setattr(pyghelpers.pyghelpers, 'DIALOG_CACHE_SIZE', 2)
+    pyghelpers.clearDialogCache()
+    for prompt in ('One?', 'Two?', 'One?', 'Three?', 'One?', 'Two?'):
+        showAnswerDialog(window, prompt, '')
+    # 'Two?' was removed when 'Three?' was added, 'One?' was kept because it was used recently
+    statsDict = pyghelpers.getDialogCacheStats()
+    assert (statsDict['hits'], statsDict['misses'], statsDict['size']) == (2, 4, 2)
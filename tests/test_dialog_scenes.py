@@ -0,0 +1,94 @@
+# Tests of the dialog scenes shown with Scene.showDialog, and awaited in scene scripts
+
+import pygame
+
+import pyghelpers
+
+DIALOG_RECT = (100, 100, 400, 200)
+
+
+def click(loc):
+    """Returns the events of a mouse click at a location"""
+    return [pygame.event.Event(pygame.MOUSEMOTION, pos=loc, rel=(0, 0), buttons=(0, 0, 0)),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=loc, button=1),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, pos=loc, button=1)]
+
+
+def getYesNoLocs(window):
+    oProbe = pyghelpers.TextYesNoDialogScene(window, DIALOG_RECT, 'Sure?')
+    return oProbe.yesButton.getRect().center, oProbe.noButton.getRect().center
+
+
+class GameScene(pyghelpers.Scene):
+    def __init__(self, window):
+        self.window = window
+        self.resultsList = []
+        self.nFrames = 0
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def update(self, dt=None):
+        self.nFrames = self.nFrames + 1
+        if self.nFrames == 1:
+            self.showDialog(pyghelpers.TextYesNoDialogScene(self.window, DIALOG_RECT, 'Sure?'),
+                            self.resultsList.append)
+
+    def draw(self, alpha=None):
+        self.window.fill((0, 0, 0))
+
+
+class ScriptScene(GameScene):
+    def enter(self, data):
+        self.startScript(self.script())
+
+    def update(self, dt=None):
+        pass
+
+    async def script(self):
+        answer = await self.askYesNo(DIALOG_RECT, 'Sure?')
+        self.resultsList.append(answer)
+
+
+def test_dialog_under_fixed_rate_updates(window):
+    yesLoc, noLoc = getYesNoLocs(window)
+    oScene = GameScene(window)
+    oSceneMgr = pyghelpers.SceneMgr({'game': oScene}, 30, fixedUpdatesPerSecond=60)
+    oEventSource = pyghelpers.ScriptedEventSource({5: click(noLoc)})
+    oSceneMgr.run(maxFrames=10, throttle=False, oEventSource=oEventSource)
+    assert oScene.resultsList == [False]
+    assert oSceneMgr.oCurrentScene is oScene
+
+
+def test_ask_yes_no_in_a_script_under_fixed_rate_updates(window):
+    yesLoc, noLoc = getYesNoLocs(window)
+    oScene = ScriptScene(window)
+    oSceneMgr = pyghelpers.SceneMgr({'game': oScene}, 30, fixedUpdatesPerSecond=60)
+    oScene.enter(None)
+    oEventSource = pyghelpers.ScriptedEventSource({5: click(yesLoc)})
+    oSceneMgr.run(maxFrames=10, throttle=False, oEventSource=oEventSource)
+    assert oScene.resultsList == [True]
+    assert oSceneMgr.scriptsList == []
+
+
+class TwoDialogsScene(GameScene):
+    def update(self, dt=None):
+        self.nFrames = self.nFrames + 1
+        if self.nFrames == 1:
+            self.showDialog(pyghelpers.TextYesNoDialogScene(self.window, DIALOG_RECT, 'Sure?'), self.gotAnswer)
+
+    def gotAnswer(self, answer):
+        self.resultsList.append(answer)
+        if len(self.resultsList) == 1:
+            self.showDialog(pyghelpers.TextYesNoDialogScene(self.window, DIALOG_RECT, 'Sure?'), self.gotAnswer)
+
+
+def test_dialogs_share_one_scene_key(window):
+    yesLoc, noLoc = getYesNoLocs(window)
+    oScene = TwoDialogsScene(window)
+    oFrameProfiler = pyghelpers.FrameProfiler()
+    oSceneMgr = pyghelpers.SceneMgr({'game': oScene}, 30, oFrameProfiler=oFrameProfiler)
+    oEventSource = pyghelpers.ScriptedEventSource({3: click(yesLoc), 6: click(noLoc)})
+    oSceneMgr.run(maxFrames=9, throttle=False, oEventSource=oEventSource)
+    assert oScene.resultsList == [True, False]
+    assert sorted(oFrameProfiler.getSceneKeys()) == sorted(['game', pyghelpers.DIALOG_SCENE_KEY])
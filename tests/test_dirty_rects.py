@@ -0,0 +1,64 @@
+# Tests of the dirty rect mode of the SceneMgr (useDirtyRects), where only changed areas of the window are updated
+
+import pygame
+
+import pyghelpers
+
+
+class RectsScene(pyghelpers.Scene):
+    """Returns the rects in rectsByFrameList from draw, one entry per frame"""
+    def __init__(self, rectsByFrameList, addedRectsByFrameList=None):
+        self.rectsByFrameList = rectsByFrameList
+        self.addedRectsByFrameList = addedRectsByFrameList
+        self.frameNumber = 0
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def draw(self, alpha=None):
+        if self.addedRectsByFrameList is not None:
+            for rect in self.addedRectsByFrameList[self.frameNumber]:
+                self.addDirtyRect(rect)
+        rectsList = self.rectsByFrameList[self.frameNumber]
+        self.frameNumber = self.frameNumber + 1
+        return rectsList
+
+
+def runAndGetUpdates(monkeypatch, oScene, nFrames, **sceneMgrArgs):
+    """Runs a scene, returns the argument of pygame.display.update in each frame (None for the whole window)"""
+    updatesList = []
+    monkeypatch.setattr(pygame.display, 'update', lambda rects=None: updatesList.append(rects))
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30, useDirtyRects=True, **sceneMgrArgs)
+    oSceneMgr.run(maxFrames=nFrames, throttle=False)
+    return updatesList
+
+
+def test_first_frame_updates_the_whole_window(window, monkeypatch):
+    updatesList = runAndGetUpdates(monkeypatch, RectsScene([[(0, 0, 10, 10)], [(0, 0, 10, 10)]]), 2)
+    assert updatesList == [None, [pygame.Rect(0, 0, 10, 10)]]
+
+
+def test_only_changed_rects_are_updated(window, monkeypatch):
+    rectsByFrameList = [[], [(10, 10, 20, 20), (100, 100, 5, 5)], [], [(600, 470, 100, 100)]]
+    updatesList = runAndGetUpdates(monkeypatch, RectsScene(rectsByFrameList), 4)
+    # Nothing is updated when nothing changed, and rects are clipped to the window
+    assert updatesList == [None, [pygame.Rect(10, 10, 20, 20), pygame.Rect(100, 100, 5, 5)],
+                           [pygame.Rect(600, 470, 40, 10)]]
+
+
+def test_overlapping_rects_are_merged(window, monkeypatch):
+    rectsByFrameList = [[], [(0, 0, 20, 20), (10, 10, 20, 20)]]
+    addedRectsByFrameList = [[], [(25, 25, 10, 10)]]
+    updatesList = runAndGetUpdates(monkeypatch, RectsScene(rectsByFrameList, addedRectsByFrameList), 2)
+    assert updatesList == [None, [pygame.Rect(0, 0, 35, 35)]]
+
+
+def test_draw_returning_none_updates_the_whole_window(window, monkeypatch):
+    updatesList = runAndGetUpdates(monkeypatch, RectsScene([[], None, [(0, 0, 5, 5)]]), 3)
+    assert updatesList == [None, None, [pygame.Rect(0, 0, 5, 5)]]
+
+
+def test_large_changes_update_the_whole_window(window, monkeypatch):
+    rectsByFrameList = [[], [(0, 0, 640, 200)], [(0, 0, 640, 300)]]
+    updatesList = runAndGetUpdates(monkeypatch, RectsScene(rectsByFrameList), 3, dirtyRectThreshold=0.5)
+    assert updatesList == [None, [pygame.Rect(0, 0, 640, 200)], None]
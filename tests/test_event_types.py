@@ -0,0 +1,57 @@
+# Tests of scenes that declare the event types they consume (eventTypes and coalesceMouseMotion)
+
+import pygame
+import pytest
+
+import pyghelpers
+
+
+@pytest.fixture(autouse=True)
+def allowAllEvents():
+    yield
+    pygame.event.set_allowed(None)
+
+
+class MouseScene(pyghelpers.Scene):
+    eventTypes = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION)
+    coalesceMouseMotion = True
+
+    def __init__(self):
+        self.eventsByFrameList = []
+        self.buttonDownsByFrameList = []
+
+    def handleInputs(self, eventsList, keyPressedList):
+        self.eventsByFrameList.append([(event.type, event.dict.get('rel')) for event in eventsList])
+        self.buttonDownsByFrameList.append(len(self.getEventsOfType(pygame.MOUSEBUTTONDOWN)))
+
+    def draw(self, alpha=None):
+        pass
+
+
+def motion(rel):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0), rel=rel, buttons=(0, 0, 0))
+
+
+def test_scene_only_gets_the_event_types_it_wants(window):
+    eventsDict = {0: [pygame.event.Event(pygame.KEYUP, key=pygame.K_a),
+                      pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(1, 1), button=1),
+                      pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(1, 1), button=1)]}
+    oScene = MouseScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30)
+    oSceneMgr.run(maxFrames=1, throttle=False, oEventSource=pyghelpers.ScriptedEventSource(eventsDict))
+    assert oScene.eventsByFrameList == [[(pygame.MOUSEBUTTONDOWN, None)]]
+    assert oScene.buttonDownsByFrameList == [1]
+    assert pygame.event.get_blocked(pygame.KEYUP)
+    assert not pygame.event.get_blocked(pygame.MOUSEMOTION)
+    assert not pygame.event.get_blocked(pygame.QUIT)
+
+
+def test_back_to_back_mouse_motion_is_coalesced(window):
+    eventsDict = {0: [motion((1, 2)), motion((3, 4)),
+                      pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(1, 1), button=1),
+                      motion((5, 0)), motion((1, 1)), motion((-2, 0))]}
+    oScene = MouseScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30)
+    oSceneMgr.run(maxFrames=1, throttle=False, oEventSource=pyghelpers.ScriptedEventSource(eventsDict))
+    assert oScene.eventsByFrameList == [[(pygame.MOUSEMOTION, (4, 6)), (pygame.MOUSEBUTTONDOWN, None),
+                                         (pygame.MOUSEMOTION, (4, 1))]]
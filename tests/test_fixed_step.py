@@ -0,0 +1,70 @@
+# Tests of the fixed rate update mode of the SceneMgr (fixedUpdatesPerSecond)
+
+import pyghelpers
+
+
+class RecordingScene(pyghelpers.Scene):
+    def __init__(self):
+        self.dtsList = []
+        self.alphasList = []
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def update(self, dt=None):
+        self.dtsList.append(dt)
+
+    def draw(self, alpha=None):
+        self.alphasList.append(alpha)
+
+
+class OldStyleScene(pyghelpers.Scene):
+    def __init__(self):
+        self.nDraws = 0
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def draw(self):
+        self.nDraws = self.nDraws + 1
+
+
+def test_updates_run_at_the_fixed_rate(window, simulatedClock):
+    simulatedClock.secondsPerTick = 0.5
+    oScene = RecordingScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30, fixedUpdatesPerSecond=4)
+    oSceneMgr.run(maxFrames=3, throttle=False)
+    assert oScene.dtsList == [0.25] * 6  # two updates in each frame
+    assert oScene.alphasList == [0.0, 0.0, 0.0]
+
+
+def test_alpha_is_the_fraction_of_a_step_left_over(window, simulatedClock):
+    simulatedClock.secondsPerTick = 0.375
+    oScene = RecordingScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30, fixedUpdatesPerSecond=4)
+    oSceneMgr.run(maxFrames=2, throttle=False)
+    assert len(oScene.dtsList) == 3  # 0.75 seconds
+    assert oScene.alphasList == [0.5, 0.0]
+
+
+def test_catch_up_is_capped(window, simulatedClock):
+    simulatedClock.secondsPerTick = 10.0  # one very slow frame
+    oScene = RecordingScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30, fixedUpdatesPerSecond=4, maxUpdatesPerFrame=5)
+    oSceneMgr.run(maxFrames=1, throttle=False)
+    assert len(oScene.dtsList) == 5
+
+
+def test_draw_is_called_without_alpha_in_variable_rate_mode(window):
+    oScene = RecordingScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30)
+    oSceneMgr.run(maxFrames=2, throttle=False)
+    assert oScene.dtsList == [None, None]
+    assert oScene.alphasList == [None, None]
+
+
+def test_old_style_draw_still_works_in_variable_rate_mode(window):
+    oScene = OldStyleScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30)
+    oSceneMgr.run(maxFrames=2, throttle=False)
+    assert oScene.nDraws == 2
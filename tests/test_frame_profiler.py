@@ -0,0 +1,66 @@
+# Tests of FrameProfiler (per phase, per scene frame timings)
+
+import time
+
+import pytest
+
+import pyghelpers
+
+
+class TimedScene(pyghelpers.Scene):
+    def __init__(self, drawSeconds=0.0, nextSceneKey=None, nFramesBeforeLeaving=None):
+        self.drawSeconds = drawSeconds
+        self.nextSceneKey = nextSceneKey
+        self.nFramesBeforeLeaving = nFramesBeforeLeaving
+        self.nFrames = 0
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def update(self, dt=None):
+        self.nFrames = self.nFrames + 1
+        if self.nFrames == self.nFramesBeforeLeaving:
+            self.goToScene(self.nextSceneKey)
+
+    def draw(self, alpha=None):
+        if self.drawSeconds > 0:
+            time.sleep(self.drawSeconds)
+
+
+def test_frames_are_counted_per_scene(window):
+    oFrameProfiler = pyghelpers.FrameProfiler()
+    oSceneMgr = pyghelpers.SceneMgr({'a': TimedScene(nextSceneKey='b', nFramesBeforeLeaving=3), 'b': TimedScene()},
+                                    30, oFrameProfiler=oFrameProfiler)
+    oSceneMgr.run(maxFrames=10, throttle=False)
+    assert sorted(oFrameProfiler.getSceneKeys()) == ['a', 'b']
+    assert oFrameProfiler.getStats('a')['nFrames'] == 3
+    assert oFrameProfiler.getStats('b')['nFrames'] == 7
+    statsDict = oFrameProfiler.getStats('a')
+    for phase in pyghelpers.FrameProfiler.PHASES:
+        assert 0.0 <= statsDict[phase]['p50'] <= statsDict[phase]['p95'] <= statsDict[phase]['max']
+    assert 'Scene b: 7 frames' in oFrameProfiler.getReport()
+
+
+def test_ring_buffer_keeps_only_recent_frames(window):
+    oFrameProfiler = pyghelpers.FrameProfiler(nFrames=5)
+    oScene = TimedScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30, oFrameProfiler=oFrameProfiler)
+    oSceneMgr.run(maxFrames=3, throttle=False)
+    oScene.drawSeconds = 0.02
+    oSceneMgr.run(maxFrames=5, throttle=False)
+    statsDict = oFrameProfiler.getStats('a')
+    assert statsDict['nFrames'] == 8
+    # Only the last 5 (slow) frames are kept, so even the median draw time is slow
+    assert statsDict['draw']['p50'] >= 15.0
+
+
+def test_frames_over_budget_are_counted(window):
+    oFrameProfiler = pyghelpers.FrameProfiler()
+    oSceneMgr = pyghelpers.SceneMgr({'a': TimedScene(drawSeconds=0.01)}, 1000, oFrameProfiler=oFrameProfiler)
+    oSceneMgr.run(maxFrames=3, throttle=False)
+    assert oFrameProfiler.getStats('a')['nOverBudget'] == 3
+
+
+def test_unknown_scene_raises_key_error():
+    with pytest.raises(KeyError):
+        pyghelpers.FrameProfiler().getStats('nothing')
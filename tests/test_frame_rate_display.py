@@ -0,0 +1,42 @@
+# Tests of FrameRateDisplay and GlyphCache
+
+import pyghelpers
+
+
+class FakePerfCounter():
+    def __init__(self, secondsPerCall):
+        self.secondsPerCall = secondsPerCall
+        self.now = 0.0
+
+    def __call__(self):
+        self.now = self.now + self.secondsPerCall
+        return self.now
+
+
+def runDisplay(window, monkeypatch, secondsPerFrame, nFrames):
+    monkeypatch.setattr(pyghelpers.pyghelpers.time, 'perf_counter', FakePerfCounter(secondsPerFrame))
+    oFrameRateDisplay = pyghelpers.FrameRateDisplay(window, (0, 0))
+    for frameNumber in range(nFrames):
+        oFrameRateDisplay.update()
+    return oFrameRateDisplay
+
+
+def test_very_high_frame_rate_fits(window, monkeypatch):
+    oFrameRateDisplay = runDisplay(window, monkeypatch, 1 / 1000000, 1000000 // 3)
+    assert oFrameRateDisplay.text.startswith('FPS: 99999 ')
+    textWidth, textHeight = oFrameRateDisplay.oGlyphCache.getSize(oFrameRateDisplay.text)
+    assert textWidth <= oFrameRateDisplay.getRect().width
+
+
+def test_very_slow_frames_fit(window, monkeypatch):
+    oFrameRateDisplay = runDisplay(window, monkeypatch, 60.0, 3)
+    assert oFrameRateDisplay.text == 'FPS: 0  9999.9 ms'
+    textWidth, textHeight = oFrameRateDisplay.oGlyphCache.getSize(oFrameRateDisplay.text)
+    assert textWidth <= oFrameRateDisplay.getRect().width
+
+
+def test_glyph_cache_draws_the_same_as_a_font(window):
+    oGlyphCache = pyghelpers.GlyphCache(fontSize=20, characters='0123456789')
+    width, height = oGlyphCache.getSize('12:34')  # ':' is not in the starting characters, it is added when needed
+    drawnRect = oGlyphCache.draw(window, (10, 10), '12:34')
+    assert (drawnRect.width, drawnRect.height) == (width, height)
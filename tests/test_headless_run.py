@@ -0,0 +1,53 @@
+# Tests of running a SceneMgr headless, for a limited number of frames, with a ScriptedEventSource
+
+import pygame
+
+import pyghelpers
+
+
+class InputLogScene(pyghelpers.Scene):
+    def __init__(self, quitInFrame=None):
+        self.quitInFrame = quitInFrame
+        self.framesList = []  # (event types, left key is down) of each frame
+
+    def handleInputs(self, eventsList, keyPressedList):
+        self.framesList.append(([event.type for event in eventsList], keyPressedList[pygame.K_LEFT]))
+        if len(self.framesList) == self.quitInFrame:
+            self.quit()
+
+    def draw(self, alpha=None):
+        pass
+
+
+def test_run_returns_after_max_frames(window):
+    oScene = InputLogScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30)
+    assert oSceneMgr.run(maxFrames=25, throttle=False) == 25
+    assert len(oScene.framesList) == 25
+    assert pygame.get_init()
+
+
+def test_scripted_events_and_keys(window):
+    eventsDict = {1: [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)],
+                  3: [pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT),
+                      pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(5, 5), button=1)]}
+    oScene = InputLogScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30)
+    oSceneMgr.run(maxFrames=5, throttle=False, oEventSource=pyghelpers.ScriptedEventSource(eventsDict))
+    assert oScene.framesList == [([], False), ([pygame.KEYDOWN], True), ([], True),
+                                 ([pygame.KEYUP, pygame.MOUSEBUTTONDOWN], False), ([], False)]
+
+
+def test_quit_event_ends_a_limited_run(window):
+    eventsDict = {2: [pygame.event.Event(pygame.QUIT)]}
+    oScene = InputLogScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30)
+    nFrames = oSceneMgr.run(maxFrames=10, throttle=False, oEventSource=pyghelpers.ScriptedEventSource(eventsDict))
+    assert nFrames == 2
+    assert pygame.get_init()
+
+
+def test_scene_can_quit_a_limited_run(window):
+    oScene = InputLogScene(quitInFrame=4)
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30)
+    assert oSceneMgr.run(maxFrames=10, throttle=False) == 4
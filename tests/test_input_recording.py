@@ -0,0 +1,94 @@
+# Tests of InputRecorder and InputPlayer (record and replay of all input to a SceneMgr)
+
+import pygame
+import pytest
+
+import pyghelpers
+
+
+class EventLogScene(pyghelpers.Scene):
+    def __init__(self):
+        self.framesList = []  # (events, keys down) of each frame
+
+    def handleInputs(self, eventsList, keyPressedList):
+        eventsInfo = [(event.type, event.dict.get('key'), event.dict.get('pos')) for event in eventsList]
+        self.framesList.append((eventsInfo, keyPressedList[pygame.K_LEFT]))
+
+    def draw(self, alpha=None):
+        pass
+
+
+def getScriptedEvents():
+    return {2: [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT, mod=0, unicode='', scancode=80)],
+            5: [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(30, 40), button=1)],
+            7: [pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT, mod=0, unicode='', scancode=80)]}
+
+
+def recordMouseSession(filePath, nFrames):
+    """Records a session where the mouse moves and is clicked in every frame"""
+    oInputRecorder = pyghelpers.InputRecorder(filePath, seed=1234)
+    for frameNumber in range(nFrames):
+        mousePos = (10 * frameNumber, 5 * frameNumber)
+        eventsList = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=mousePos, button=1)]
+        oInputRecorder.recordFrame(frameNumber, eventsList, (False,) * 512, mousePos)
+    return oInputRecorder
+
+
+def test_replay_of_scripted_events_gives_the_same_inputs(window, tmp_path):
+    filePath = tmp_path / 'session.rec'
+    oRecordedScene = EventLogScene()
+    oSceneMgr = pyghelpers.SceneMgr({'log': oRecordedScene}, 30)
+    oInputRecorder = pyghelpers.InputRecorder(filePath, seed=99)
+    oSceneMgr.run(maxFrames=10, throttle=False, oEventSource=pyghelpers.ScriptedEventSource(getScriptedEvents()),
+                  oInputRecorder=oInputRecorder)
+
+    oInputPlayer = pyghelpers.InputPlayer(filePath)
+    assert oInputPlayer.getNFrames() == 10
+    oPlayedScene = EventLogScene()
+    oSceneMgr = pyghelpers.SceneMgr({'log': oPlayedScene}, 30)
+    nFrames = oSceneMgr.run(maxFrames=oInputPlayer.getNFrames(), throttle=False, oEventSource=oInputPlayer)
+    assert nFrames == 10
+    assert oPlayedScene.framesList == oRecordedScene.framesList
+    assert oInputPlayer.isFinished()
+
+
+def test_cut_off_recording_plays_its_complete_frames(window, tmp_path):
+    filePath = tmp_path / 'session.rec'
+    oInputRecorder = recordMouseSession(filePath, 10)
+    oInputRecorder.oFile.close()  # as if the program crashed, the end of the recording is never written
+    data = filePath.read_bytes()
+
+    for length in range(len(data), len(pyghelpers.pyghelpers._RECORDING_MAGIC) + 2, -1):
+        cutPath = tmp_path / 'cut.rec'
+        cutPath.write_bytes(data[:length])
+        oInputPlayer = pyghelpers.InputPlayer(cutPath)
+        nFrames = oInputPlayer.getNFrames()
+        assert nFrames is not None
+        assert 0 <= nFrames <= 10
+        oScene = EventLogScene()
+        oSceneMgr = pyghelpers.SceneMgr({'log': oScene}, 30)
+        assert oSceneMgr.run(maxFrames=nFrames, throttle=False, oEventSource=oInputPlayer) == nFrames
+        # Every frame that was played had its complete record
+        assert all(len(eventsInfo) == 1 for eventsInfo, leftIsDown in oScene.framesList)
+
+
+def test_seed_is_saved_in_the_recording(window, tmp_path):
+    filePath = tmp_path / 'session.rec'
+    for seed in (0, 12345, -7, 2 ** 70):
+        oInputRecorder = pyghelpers.InputRecorder(filePath, seed=seed)
+        oInputRecorder.close()
+        oInputPlayer = pyghelpers.InputPlayer(filePath)
+        assert oInputPlayer.seed == seed
+
+
+@pytest.mark.parametrize('seed', ['abc', b'abc', 1.5])
+def test_seed_that_is_not_an_integer_is_rejected(window, tmp_path, seed):
+    with pytest.raises(ValueError):
+        pyghelpers.InputRecorder(tmp_path / 'session.rec', seed=seed)
+
+
+def test_keys_down_that_cannot_be_recorded_are_rejected(window, tmp_path):
+    oInputRecorder = pyghelpers.InputRecorder(tmp_path / 'session.rec', seed=1)
+    with pytest.raises(ValueError):
+        oInputRecorder.recordFrame(0, [], {pygame.K_LEFT: True}, (0, 0))
+    oInputRecorder.close()
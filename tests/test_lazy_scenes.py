@@ -0,0 +1,67 @@
+# Tests of scenes built lazily from factories, and removing the least recently used ones (maxLoadedScenes)
+
+import pyghelpers
+
+
+class TourScene(pyghelpers.Scene):
+    """Goes to the next scene in a tour after one frame"""
+    def __init__(self, tourList=None):
+        self.tourList = tourList
+        self.nextIndex = 0
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def update(self, dt=None):
+        if (self.tourList is not None) and (self.nextIndex < len(self.tourList)):
+            self.nextIndex = self.nextIndex + 1
+            self.goToScene(self.tourList[self.nextIndex - 1])
+
+    def draw(self, alpha=None):
+        pass
+
+
+class WindowScene(TourScene):
+    def __init__(self, window):
+        super().__init__()
+        self.window = window
+
+
+def countingFactory(buildsList, sceneKey):
+    def buildScene():
+        buildsList.append(sceneKey)
+        return TourScene(['start'] * 10)  # goes back to the start scene every time
+    return buildScene
+
+
+def test_factories_build_scenes_when_first_used(window):
+    buildsList = []
+    scenesDict = {'start': TourScene(['b', 'b']),
+                  'b': countingFactory(buildsList, 'b'),
+                  'c': countingFactory(buildsList, 'c'),
+                  'window': WindowScene}
+    oSceneMgr = pyghelpers.SceneMgr(scenesDict, 30)
+    assert buildsList == []
+    oSceneMgr.run(maxFrames=4, throttle=False)
+    assert buildsList == ['b']  # built once, and kept since there is no limit
+    assert 'c' not in oSceneMgr.scenesDict
+
+
+def test_scene_class_factory_is_given_the_window(window):
+    oSceneMgr = pyghelpers.SceneMgr({'window': WindowScene, 'other': TourScene()}, 30)
+    assert oSceneMgr.oCurrentScene.window is window
+
+
+def test_least_recently_used_scenes_are_removed(window):
+    buildsList = []
+    scenesDict = {'start': TourScene(['a', 'b', 'c', 'a']),
+                  'a': countingFactory(buildsList, 'a'),
+                  'b': countingFactory(buildsList, 'b'),
+                  'c': countingFactory(buildsList, 'c')}
+    oSceneMgr = pyghelpers.SceneMgr(scenesDict, 30, maxLoadedScenes=2)
+    oSceneMgr.run(maxFrames=8, throttle=False)
+    # When 'c' was built, 'a' was the least recently used, so it was removed and built again
+    assert buildsList == ['a', 'b', 'c', 'a']
+    assert list(oSceneMgr.recentlyUsedDict) == ['c', 'a']
+    assert 'b' not in oSceneMgr.scenesDict
+    assert 'start' in oSceneMgr.scenesDict  # scenes given as objects are never removed
@@ -0,0 +1,70 @@
+# Tests of overlay scenes shown with pushScene and removed with popScene
+
+import pyghelpers
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+GAME_RECT = (0, 0, 100, 100)
+PAUSE_RECT = (0, 0, 10, 10)
+
+
+class LogScene(pyghelpers.Scene):
+    """Logs the calls to its methods, and does the actions in actionsDict in its nth update"""
+    def __init__(self, window, name, logList, color, rect, actionsDict=None):
+        self.window = window
+        self.name = name
+        self.logList = logList
+        self.color = color
+        self.rect = rect
+        self.actionsDict = actionsDict or {}
+        self.nUpdates = 0
+
+    def enter(self, data):
+        self.logList.append((self.name, 'enter', data))
+
+    def leave(self):
+        self.logList.append((self.name, 'leave'))
+
+    def overlayPushed(self, overlaySceneKey):
+        self.logList.append((self.name, 'overlayPushed', overlaySceneKey))
+
+    def overlayPopped(self, data):
+        self.logList.append((self.name, 'overlayPopped', data))
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def update(self, dt=None):
+        self.nUpdates = self.nUpdates + 1
+        self.logList.append((self.name, 'update'))
+        action = self.actionsDict.get(self.nUpdates)
+        if action is not None:
+            action(self)
+
+    def draw(self, alpha=None):
+        self.window.fill(self.color, self.rect)
+
+
+def test_covered_scene_is_not_updated_and_gets_the_popped_data(window):
+    logList = []
+    oGame = LogScene(window, 'game', logList, RED, GAME_RECT, {1: lambda oScene: oScene.pushScene('pause', 'paused')})
+    oPause = LogScene(window, 'pause', logList, BLUE, PAUSE_RECT, {2: lambda oScene: oScene.popScene('resumed')})
+    oSceneMgr = pyghelpers.SceneMgr({'game': oGame, 'pause': oPause}, 30)
+    oSceneMgr.run(maxFrames=4, throttle=False)
+    assert logList == [('game', 'update'),
+                       ('game', 'overlayPushed', 'pause'), ('pause', 'enter', 'paused'),
+                       ('pause', 'update'), ('pause', 'update'),
+                       ('pause', 'leave'), ('game', 'overlayPopped', 'resumed'),
+                       ('game', 'update')]
+    assert oSceneMgr.oCurrentScene is oGame
+    assert oSceneMgr.sceneStackList == []
+
+
+def test_covered_scene_snapshot_is_drawn_under_the_overlay(window):
+    logList = []
+    oGame = LogScene(window, 'game', logList, RED, GAME_RECT, {1: lambda oScene: oScene.pushScene('pause')})
+    oPause = LogScene(window, 'pause', logList, BLUE, PAUSE_RECT)
+    oSceneMgr = pyghelpers.SceneMgr({'game': oGame, 'pause': oPause}, 30)
+    oSceneMgr.run(maxFrames=3, throttle=False)
+    assert window.get_at((50, 50))[:3] == RED  # from the snapshot of the game scene
+    assert window.get_at((5, 5))[:3] == BLUE
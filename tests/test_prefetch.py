@@ -0,0 +1,73 @@
+# Tests of prefetchScene (building and preparing scenes on a worker thread)
+
+import threading
+
+import pytest
+
+import pyghelpers
+
+
+class PrefetchScene(pyghelpers.Scene):
+    def __init__(self, threadNamesList=None):
+        self.threadNamesList = threadNamesList
+        if threadNamesList is not None:
+            threadNamesList.append(('init', threading.current_thread().name))
+        self.prefetchThreadName = None
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def prefetch(self):
+        self.prefetchThreadName = threading.current_thread().name
+
+    def draw(self, alpha=None):
+        pass
+
+
+class WindowPrefetchScene(PrefetchScene):
+    def __init__(self, window):
+        super().__init__()
+        self.window = window
+
+
+def test_unbuilt_scene_is_built_and_prepared_on_a_worker_thread(window):
+    threadNamesList = []
+    oSceneMgr = pyghelpers.SceneMgr({'start': PrefetchScene(), 'b': lambda: PrefetchScene(threadNamesList)}, 30)
+    oSceneMgr.oCurrentScene.prefetchScene('b')
+    oSceneMgr.oCurrentScene.goToScene('b')
+    oSceneMgr.run(maxFrames=2, throttle=False)
+    oScene = oSceneMgr.oCurrentScene
+    assert oSceneMgr.currentSceneKey == 'b'
+    assert threadNamesList[0][1].startswith('prefetchScene')
+    assert oScene.prefetchThreadName.startswith('prefetchScene')
+    assert oSceneMgr.pendingScenesDict == {}
+
+
+def test_built_scene_is_prepared_on_the_main_thread(window):
+    oSceneB = PrefetchScene()
+    oSceneMgr = pyghelpers.SceneMgr({'start': PrefetchScene(), 'b': oSceneB}, 30)
+    oSceneMgr.oCurrentScene.prefetchScene('b')
+    assert oSceneB.prefetchThreadName == threading.main_thread().name
+    assert oSceneMgr.pendingScenesDict == {}
+
+
+def test_prefetched_scenes_count_as_loaded(window):
+    scenesDict = {'start': PrefetchScene()}
+    for sceneKey in ('a', 'b', 'c'):
+        scenesDict[sceneKey] = WindowPrefetchScene
+    oSceneMgr = pyghelpers.SceneMgr(scenesDict, 30, maxLoadedScenes=2)
+    for sceneKey in ('a', 'b', 'c'):
+        oSceneMgr.oCurrentScene.prefetchScene(sceneKey)
+    oSceneMgr.run(maxFrames=3, throttle=False)
+    for oFuture in list(oSceneMgr.pendingScenesDict.values()):
+        oFuture.result()
+    oSceneMgr.run(maxFrames=2, throttle=False)
+    assert oSceneMgr.pendingScenesDict == {}
+    assert len(oSceneMgr.recentlyUsedDict) <= 2
+    assert len([sceneKey for sceneKey in ('a', 'b', 'c') if sceneKey in oSceneMgr.scenesDict]) <= 2
+
+
+def test_prefetch_of_unknown_scene_raises_key_error(window):
+    oSceneMgr = pyghelpers.SceneMgr({'start': PrefetchScene()}, 30)
+    with pytest.raises(KeyError):
+        oSceneMgr.oCurrentScene.prefetchScene('nothing')
@@ -0,0 +1,104 @@
+# Tests of repeating Timers, with and without a TimerMgr
+
+import pytest
+
+import pyghelpers
+
+
+def test_late_checks_do_not_make_the_timer_drift(simulatedClock):
+    callBacksList = []
+    oTimer = pyghelpers.Timer(1, nickname='tick', callBack=callBacksList.append, repeat=True)
+    oTimer.start()
+    simulatedClock.advance(1.4)  # checked late
+    assert oTimer.update() == 1
+    simulatedClock.advance(0.6)  # the next deadline is still at 2 seconds
+    assert oTimer.update() == 1
+    simulatedClock.advance(0.9)
+    assert oTimer.update() == 0
+    assert callBacksList == ['tick', 'tick']
+
+
+def test_every_period_is_reported_after_a_long_frame(simulatedClock):
+    callBacksList = []
+    oTimer = pyghelpers.Timer(0.5, nickname='tick', callBack=callBacksList.append, repeat=True)
+    oTimer.start()
+    simulatedClock.advance(2.2)
+    assert oTimer.update() == 4
+    assert callBacksList == ['tick'] * 4
+
+
+def test_coalesce_calls_back_once_for_many_periods(simulatedClock):
+    callBacksList = []
+    oTimer = pyghelpers.Timer(0.5, nickname='tick', callBack=callBacksList.append, repeat=True, coalesce=True)
+    oTimer.start()
+    simulatedClock.advance(2.2)
+    assert oTimer.update() == 4  # still returns the number of periods
+    assert callBacksList == ['tick']
+
+
+def test_callback_that_stops_the_timer_ends_the_periods(simulatedClock):
+    callBacksList = []
+
+    def stopAfterTwo(nickname):
+        callBacksList.append(nickname)
+        if len(callBacksList) == 2:
+            oTimer.stop()
+
+    oTimer = pyghelpers.Timer(1, nickname='tick', callBack=stopAfterTwo, repeat=True)
+    oTimer.start()
+    simulatedClock.advance(5)
+    oTimer.update()
+    assert callBacksList == ['tick', 'tick']
+    simulatedClock.advance(5)
+    assert oTimer.update() == 0
+
+
+def test_pause_moves_the_deadlines(simulatedClock):
+    oTimer = pyghelpers.Timer(1, repeat=True)
+    oTimer.start()
+    simulatedClock.advance(0.5)
+    oTimer.pause()
+    simulatedClock.advance(10)
+    assert oTimer.update() == 0
+    oTimer.resume()
+    simulatedClock.advance(0.5)
+    assert oTimer.update() == 1
+
+
+def test_repeating_timer_with_a_timer_mgr(simulatedClock):
+    oTimerMgr = pyghelpers.TimerMgr()
+    callBacksList = []
+    oTimer = pyghelpers.Timer(0.25, nickname='tick', callBack=callBacksList.append, oTimerMgr=oTimerMgr,
+                              repeat=True)
+    oTimer.start()
+    for frameNumber in range(8):
+        simulatedClock.advance(0.125)
+        oTimerMgr.update()
+    assert callBacksList == ['tick'] * 4
+    assert oTimer.update() == 4
+    assert oTimer.update() == 0
+    assert oTimerMgr.getNTimers() == 1  # still scheduled for the next period
+
+    simulatedClock.advance(1.1)
+    oTimerMgr.update()
+    assert callBacksList == ['tick'] * 8  # four periods ended in that frame
+    oTimer.stop()
+    assert oTimerMgr.getNTimers() == 0
+
+
+def test_repeating_timer_with_a_timer_mgr_and_coalesce(simulatedClock):
+    oTimerMgr = pyghelpers.TimerMgr()
+    callBacksList = []
+    oTimer = pyghelpers.Timer(0.25, nickname='tick', callBack=callBacksList.append, oTimerMgr=oTimerMgr,
+                              repeat=True, coalesce=True)
+    oTimer.start()
+    simulatedClock.advance(1.1)
+    assert oTimerMgr.update() == 1
+    assert callBacksList == ['tick']
+    assert oTimer.update() == 4
+
+
+def test_repeating_timer_needs_a_duration():
+    oTimer = pyghelpers.Timer(0, repeat=True)
+    with pytest.raises(ValueError):
+        oTimer.start()
@@ -0,0 +1,102 @@
+# Tests of saving the responses to requests listed in a scene's cacheableRequestIDs
+
+import pyghelpers
+
+
+class AskingScene(pyghelpers.Scene):
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def draw(self, alpha=None):
+        pass
+
+
+class ScoreScene(AskingScene):
+    cacheableRequestIDs = ('highScores', 'level')
+
+    def __init__(self):
+        self.highScoresList = [100, 50]
+        self.level = 1
+        self.respondedList = []
+
+    def respond(self, requestID):
+        self.respondedList.append(requestID)
+        if requestID == 'highScores':
+            return list(self.highScoresList)
+        if requestID == 'level':
+            return self.level
+        return len(self.respondedList)  # changes every time, so it is not cacheable
+
+    def addHighScore(self, score):
+        self.highScoresList.append(score)
+        self.highScoresList.sort(reverse=True)
+        self.invalidateResponse('highScores')
+
+
+def test_cacheable_responses_are_saved(window):
+    oAskingScene = AskingScene()
+    oScoreScene = ScoreScene()
+    pyghelpers.SceneMgr({'asking': oAskingScene, 'score': oScoreScene}, 30)
+    assert oAskingScene.request('score', 'highScores') == [100, 50]
+    assert oAskingScene.request('score', 'highScores') == [100, 50]
+    assert oScoreScene.respondedList == ['highScores']
+
+
+def test_other_requests_are_not_saved(window):
+    oAskingScene = AskingScene()
+    oScoreScene = ScoreScene()
+    pyghelpers.SceneMgr({'asking': oAskingScene, 'score': oScoreScene}, 30)
+    assert oAskingScene.request('score', 'count') == 1
+    assert oAskingScene.request('score', 'count') == 2
+
+
+def test_invalidate_one_response(window):
+    oAskingScene = AskingScene()
+    oScoreScene = ScoreScene()
+    pyghelpers.SceneMgr({'asking': oAskingScene, 'score': oScoreScene}, 30)
+    oAskingScene.request('score', 'highScores')
+    oAskingScene.request('score', 'level')
+    oScoreScene.addHighScore(75)
+    assert oAskingScene.request('score', 'highScores') == [100, 75, 50]
+    assert oAskingScene.request('score', 'level') == 1
+    assert oScoreScene.respondedList == ['highScores', 'level', 'highScores']
+
+
+def test_invalidate_all_responses(window):
+    oAskingScene = AskingScene()
+    oScoreScene = ScoreScene()
+    pyghelpers.SceneMgr({'asking': oAskingScene, 'score': oScoreScene}, 30)
+    oAskingScene.request('score', 'highScores')
+    oAskingScene.request('score', 'level')
+    oScoreScene.level = 2
+    oScoreScene.invalidateResponse()
+    assert oAskingScene.request('score', 'level') == 2
+    assert oAskingScene.request('score', 'highScores') == [100, 50]
+    assert oScoreScene.respondedList == ['highScores', 'level', 'level', 'highScores']
+
+
+def test_invalidate_before_any_request(window):
+    oScoreScene = ScoreScene()
+    pyghelpers.SceneMgr({'asking': AskingScene(), 'score': oScoreScene}, 30)
+    oScoreScene.invalidateResponse('highScores')
+    oScoreScene.invalidateResponse()
+
+
+def test_responses_of_a_removed_scene_are_thrown_away(window):
+    builtScenesList = []
+
+    def buildScoreScene():
+        oScene = ScoreScene()
+        builtScenesList.append(oScene)
+        return oScene
+
+    oAskingScene = AskingScene()
+    oSceneMgr = pyghelpers.SceneMgr({'asking': oAskingScene, 'score': buildScoreScene}, 30)
+    oAskingScene.request('score', 'highScores')
+    oAskingScene.removeScene('score')
+    oSceneMgr.run(maxFrames=1, throttle=False)
+    assert builtScenesList[0] not in oSceneMgr.cachedResponsesDict  # not kept alive by its saved responses
+    oAskingScene.addScene('score', buildScoreScene)
+    assert oAskingScene.request('score', 'highScores') == [100, 50]
+    assert len(builtScenesList) == 2
+    assert builtScenesList[1].respondedList == ['highScores']
@@ -0,0 +1,109 @@
+# Tests of scene scripts (coroutines started with startScript, awaiting wait, nextFrame, or a dialog)
+
+import pytest
+
+import pyghelpers
+
+
+class ScriptScene(pyghelpers.Scene):
+    """Runs the script given to it when it is entered for the first time"""
+    def __init__(self, makeScript=None):
+        self.makeScript = makeScript
+        self.nFrames = 0
+        self.logList = []
+
+    def enter(self, data):
+        if self.makeScript is not None:
+            self.startScript(self.makeScript(self))
+            self.makeScript = None
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def update(self, dt=None):
+        self.nFrames = self.nFrames + 1
+
+    def draw(self, alpha=None):
+        pass
+
+
+def runScenes(scenesDict, nFrames):
+    oSceneMgr = pyghelpers.SceneMgr(scenesDict, 30)
+    oSceneMgr.oCurrentScene.enter(None)
+    oSceneMgr.run(maxFrames=nFrames, throttle=False)
+    return oSceneMgr
+
+
+def test_script_waits_for_frames_and_seconds(window):
+    async def script(oScene):
+        oScene.logList.append(('start', oScene.nFrames))
+        await oScene.nextFrame()
+        oScene.logList.append(('next frame', oScene.nFrames))
+        await oScene.wait(0.5)  # 30 frames of the SimulatedClock
+        oScene.logList.append(('waited', oScene.nFrames))
+
+    oScene = ScriptScene(script)
+    oSceneMgr = runScenes({'a': oScene}, 40)
+    assert oScene.logList == [('start', 0), ('next frame', 1), ('waited', 31)]
+    assert oSceneMgr.scriptsList == []
+
+
+def test_script_is_closed_when_its_scene_is_left(window):
+    async def script(oScene):
+        try:
+            while True:
+                await oScene.nextFrame()
+        finally:
+            oScene.logList.append('closed')
+
+    oScene = ScriptScene(script)
+    oOther = ScriptScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene, 'b': oOther}, 30)
+    oScene.enter(None)
+    oSceneMgr.run(maxFrames=3, throttle=False)
+    oScene.goToScene('b')
+    oSceneMgr.run(maxFrames=2, throttle=False)
+    assert oScene.logList == ['closed']
+    assert oSceneMgr.scriptsList == []
+
+
+def test_script_can_go_to_another_scene(window):
+    async def scriptA(oScene):
+        try:
+            await oScene.nextFrame()
+            oScene.goToScene('b')
+            oScene.logList.append('after goToScene')
+            await oScene.nextFrame()
+            oScene.logList.append('should not run')
+        finally:
+            oScene.logList.append('closed')
+
+    async def scriptB(oScene):
+        await oScene.nextFrame()
+        oScene.pushScene('c')
+
+    async def scriptC(oScene):
+        await oScene.nextFrame()
+        oScene.popScene('popped')
+        await oScene.nextFrame()
+        oScene.logList.append('should not run')
+
+    oSceneA = ScriptScene(scriptA)
+    oSceneC = ScriptScene(scriptC)
+    oSceneMgr = runScenes({'a': oSceneA, 'b': ScriptScene(scriptB), 'c': oSceneC}, 10)
+    assert oSceneA.logList == ['after goToScene', 'closed']
+    assert oSceneC.logList == []
+    assert oSceneMgr.currentSceneKey == 'b'
+    assert oSceneMgr.scriptsList == []
+
+
+def test_script_cannot_await_other_things(window):
+    class Other():
+        def __await__(self):
+            yield 'something else'
+
+    async def script(oScene):
+        await Other()
+
+    with pytest.raises(ValueError):
+        runScenes({'a': ScriptScene(script)}, 2)
@@ -0,0 +1,102 @@
+# Tests of sendAll, and the index of the scenes that subscribed to each sendID
+
+import pyghelpers
+
+
+class ReceiverScene(pyghelpers.Scene):
+    def __init__(self, window=None):
+        self.window = window
+        self.receivedList = []
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def draw(self, alpha=None):
+        pass
+
+    def receive(self, receiveID, info):
+        self.receivedList.append((receiveID, info))
+
+
+class ScoreReceiverScene(ReceiverScene):
+    receiveIDs = ('score',)
+
+
+def test_scenes_that_never_subscribed_receive_everything_but_their_own(window):
+    oSenderScene = ReceiverScene()
+    oOtherScene = ReceiverScene()
+    pyghelpers.SceneMgr({'sender': oSenderScene, 'other': oOtherScene}, 30)
+    oSenderScene.sendAll('score', 10)
+    oSenderScene.sendAll('lives', 3)
+    assert oOtherScene.receivedList == [('score', 10), ('lives', 3)]
+    assert oSenderScene.receivedList == []
+
+
+def test_subscribed_scenes_only_receive_their_send_ids(window):
+    oSenderScene = ReceiverScene()
+    oScoreScene = ScoreReceiverScene()
+    oLivesScene = ReceiverScene()
+    pyghelpers.SceneMgr({'sender': oSenderScene, 'score': oScoreScene, 'lives': oLivesScene}, 30)
+    oLivesScene.subscribe('lives')
+    oSenderScene.sendAll('score', 10)
+    oSenderScene.sendAll('lives', 3)
+    oSenderScene.sendAll('other', None)
+    assert oScoreScene.receivedList == [('score', 10)]
+    assert oLivesScene.receivedList == [('lives', 3)]
+
+    oScoreScene.subscribe('lives')
+    oScoreScene.unsubscribe('score')
+    oSenderScene.sendAll('score', 20)
+    oSenderScene.sendAll('lives', 2)
+    assert oScoreScene.receivedList == [('score', 10), ('lives', 2)]
+
+
+def test_queued_messages_are_sent_at_the_start_of_the_next_frame(window):
+    oSenderScene = ReceiverScene()
+    oOtherScene = ReceiverScene()
+    oSceneMgr = pyghelpers.SceneMgr({'sender': oSenderScene, 'other': oOtherScene}, 30)
+    oSenderScene.sendAll('score', 10, queued=True)
+    oSenderScene.sendAll('score', 20, queued=True)
+    assert oOtherScene.receivedList == []
+    oSceneMgr.run(maxFrames=1, throttle=False)
+    assert oOtherScene.receivedList == [('score', 10), ('score', 20)]
+    assert oSenderScene.receivedList == []
+
+
+def test_scenes_built_from_factories_are_only_sent_messages_once_built(window):
+    buildsList = []
+
+    def buildScoreScene():
+        oScene = ScoreReceiverScene()
+        buildsList.append(oScene)
+        return oScene
+
+    oSenderScene = ReceiverScene()
+    pyghelpers.SceneMgr({'sender': oSenderScene, 'score': buildScoreScene}, 30)
+    oSenderScene.sendAll('score', 10)
+    assert buildsList == []  # sendAll does not build scenes
+    oSenderScene.send('score', 'score', 15)  # send does
+    oSenderScene.sendAll('score', 20)
+    assert buildsList[0].receivedList == [('score', 15), ('score', 20)]
+
+
+def test_removed_scenes_are_not_sent_messages(window):
+    oSenderScene = ReceiverScene()
+    oOtherScene = ReceiverScene()
+    oSceneMgr = pyghelpers.SceneMgr({'sender': oSenderScene, 'other': oOtherScene}, 30)
+    oSenderScene.removeScene('other')
+    oSceneMgr.run(maxFrames=1, throttle=False)  # scenes are removed at the start of a frame
+    oSenderScene.sendAll('score', 10)
+    assert oOtherScene.receivedList == []
+
+
+def test_starting_scene_given_as_a_factory(window):
+    # The starting scene is built in SceneMgr.__init__, and building a scene adds it to the sendAll index
+    oOtherScene = ScoreReceiverScene(window)
+    oSceneMgr = pyghelpers.SceneMgr({'start': ReceiverScene, 'other': oOtherScene}, 30)
+    oStartScene = oSceneMgr.scenesDict['start']
+    assert oStartScene.window is window
+    oStartScene.sendAll('score', 10)
+    oOtherScene.sendAll('lives', 3)
+    assert oOtherScene.receivedList == [('score', 10)]
+    assert oStartScene.receivedList == [('lives', 3)]
@@ -0,0 +1,70 @@
+# Tests of SimulationProcess (a scene simulation run in a worker process, with its state in shared memory)
+
+import time
+
+import pytest
+
+import pyghelpers
+
+N_VALUES = 100
+
+
+def simulate(stateArray, inputsList, dt):
+    """Counts the updates in value 0, adds the inputs to value 1, and adds dt to all other values"""
+    stateArray[0] = stateArray[0] + 1
+    for inputValue in inputsList:
+        stateArray[1] = stateArray[1] + inputValue
+    for index in range(2, len(stateArray)):
+        stateArray[index] = stateArray[index] + dt
+
+
+def waitForUpdates(oSimulation, nUpdates):
+    endTime = time.time() + 10.0
+    while time.time() < endTime:
+        stateArray = oSimulation.getState()
+        if oSimulation.getNUpdates() >= nUpdates:
+            return stateArray
+        time.sleep(0.01)
+    raise AssertionError('SimulationProcess did not reach ' + str(nUpdates) + ' updates')
+
+
+def test_state_is_never_torn():
+    oSimulation = pyghelpers.SimulationProcess(simulate, N_VALUES, updatesPerSecond=500)
+    oSimulation.start()
+    try:
+        oSimulation.sendInput(5.0)
+        oSimulation.sendInput(2.0)
+        for count in range(200):
+            stateArray = oSimulation.getState()
+            # All values after the first two are written in the same update, so they must all be equal
+            assert stateArray[2] == stateArray[N_VALUES - 1]
+        stateArray = waitForUpdates(oSimulation, 20)
+        assert stateArray[0] == oSimulation.getNUpdates()
+    finally:
+        oSimulation.stop()
+    assert not oSimulation.isRunning()
+    assert oSimulation.getState()[1] == 7.0
+
+
+def test_restart_starts_from_zeros_unless_given_a_state():
+    oSimulation = pyghelpers.SimulationProcess(simulate, N_VALUES, updatesPerSecond=500)
+    oSimulation.start()
+    waitForUpdates(oSimulation, 5)
+    oSimulation.stop()
+    lastStateArray = list(oSimulation.getState())
+    assert lastStateArray[0] >= 5
+
+    oSimulation.start()
+    assert list(oSimulation.getState()) == [0.0] * N_VALUES
+    oSimulation.stop()
+
+    oSimulation.start(lastStateArray)
+    assert oSimulation.getState()[0] >= lastStateArray[0]
+    oSimulation.stop()
+
+
+def test_starting_values_must_match_the_number_of_values():
+    oSimulation = pyghelpers.SimulationProcess(simulate, N_VALUES)
+    with pytest.raises(ValueError):
+        oSimulation.start([0.0] * (N_VALUES - 1))
+    assert not oSimulation.isRunning()
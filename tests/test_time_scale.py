@@ -0,0 +1,108 @@
+# Tests of setTimeScale and getTimeScale, for all timers and for a time group
+
+import pytest
+
+import pyghelpers
+
+
+@pytest.fixture(autouse=True)
+def noTimeGroupScales(monkeypatch):
+    # Each test starts with no time group scales, and its group scales are thrown away afterwards
+    monkeypatch.setattr(pyghelpers.pyghelpers, '_timeGroupAnchorsDict', {})
+
+
+class FixedStepScene(pyghelpers.Scene):
+    def __init__(self):
+        self.nUpdates = 0
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def update(self, dt=None):
+        self.nUpdates = self.nUpdates + 1
+
+    def draw(self, alpha=None):
+        pass
+
+
+def test_global_scale_slows_down_timers(simulatedClock):
+    oTimer = pyghelpers.Timer(1)
+    oTimer.start()
+    simulatedClock.advance(1)
+    pyghelpers.setTimeScale(0.25)
+    assert pyghelpers.getTimeScale() == 0.25
+    assert oTimer.getTime() == 1.0  # changing the scale does not make the time jump
+    simulatedClock.advance(2)
+    assert oTimer.getTime() == 1.5
+
+
+def test_zero_scale_stops_time(simulatedClock):
+    oTimer = pyghelpers.Timer(1)
+    oTimer.start()
+    pyghelpers.setTimeScale(0.0)
+    simulatedClock.advance(10)
+    assert oTimer.update() is False
+    pyghelpers.setTimeScale(1.0)
+    simulatedClock.advance(1)
+    assert oTimer.update() is True
+
+
+def test_negative_scale_raises():
+    with pytest.raises(ValueError):
+        pyghelpers.setTimeScale(-1.0)
+
+
+def test_time_group_scale_multiplies_the_global_scale(simulatedClock):
+    oEnemyTimer = pyghelpers.Timer(10, timeGroup='enemies')
+    oPlayerTimer = pyghelpers.Timer(10)
+    oEnemyTimer.start()
+    oPlayerTimer.start()
+    pyghelpers.setTimeScale(2.0, 'enemies')
+    assert pyghelpers.getTimeScale('enemies') == 2.0
+    assert pyghelpers.getTimeScale('players') == 1.0
+    simulatedClock.advance(1)
+    assert oEnemyTimer.getTime() == 2.0
+    assert oPlayerTimer.getTime() == 1.0
+
+    pyghelpers.setTimeScale(0.5)
+    simulatedClock.advance(2)
+    assert oEnemyTimer.getTime() == 4.0
+    assert oPlayerTimer.getTime() == 2.0
+
+
+def test_timer_mgr_uses_the_time_of_each_group(simulatedClock):
+    oTimerMgr = pyghelpers.TimerMgr()
+    finishedList = []
+    oFastTimer = pyghelpers.Timer(2, nickname='fast', callBack=finishedList.append, oTimerMgr=oTimerMgr,
+                                  timeGroup='fast')
+    oSlowTimer = pyghelpers.Timer(2, nickname='slow', callBack=finishedList.append, oTimerMgr=oTimerMgr,
+                                  timeGroup='slow')
+    pyghelpers.setTimeScale(4.0, 'fast')
+    pyghelpers.setTimeScale(0.5, 'slow')
+    oFastTimer.start()
+    oSlowTimer.start()
+    simulatedClock.advance(0.5)
+    oTimerMgr.update()
+    assert finishedList == ['fast']
+    simulatedClock.advance(3.5)
+    oTimerMgr.update()
+    assert finishedList == ['fast', 'slow']
+
+
+def test_timer_array_uses_its_time_group(simulatedClock):
+    oTimerArray = pyghelpers.TimerArray(2, 1.0, useNumpy=False, timeGroup='bullets')
+    oTimerArray.start()
+    pyghelpers.setTimeScale(0.5, 'bullets')
+    simulatedClock.advance(1)
+    assert oTimerArray.updateAll() == []
+    simulatedClock.advance(1)
+    assert oTimerArray.updateAll() == [0, 1]
+
+
+def test_global_scale_slows_down_fixed_updates(window, simulatedClock):
+    simulatedClock.secondsPerTick = 0.5
+    pyghelpers.setTimeScale(0.5)
+    oScene = FixedStepScene()
+    oSceneMgr = pyghelpers.SceneMgr({'a': oScene}, 30, fixedUpdatesPerSecond=4)
+    oSceneMgr.run(maxFrames=4, throttle=False)
+    assert oScene.nUpdates == 4  # 1 second of scaled time
@@ -0,0 +1,107 @@
+# Tests of TimerArray, with numpy arrays and with arrays from the standard array module
+
+import pytest
+
+import pyghelpers
+
+try:
+    import numpy  # optional, the tests with numpy values are skipped without it
+except ImportError:
+    numpy = None
+
+needsNumpy = pytest.mark.skipif(numpy is None, reason='numpy is not installed')
+
+
+@pytest.fixture(params=[pytest.param(True, marks=needsNumpy), False], ids=['numpy', 'array'])
+def useNumpy(request):
+    return request.param
+
+
+def test_timers_expire_once_and_are_stopped(simulatedClock, useNumpy):
+    oTimerArray = pyghelpers.TimerArray(4, [1.0, 2.0, 3.0, 4.0], useNumpy=useNumpy)
+    assert oTimerArray.usingNumpy == useNumpy
+    oTimerArray.start()
+    simulatedClock.advance(2.5)
+    assert oTimerArray.updateAll() == [0, 1]
+    assert oTimerArray.updateAll() == []
+    assert not oTimerArray.isRunning(0)
+    assert oTimerArray.isRunning(2)
+    assert oTimerArray.getTime(2) == pytest.approx(0.5)
+    assert oTimerArray.getTime(0) == 0.0
+
+
+def test_start_with_an_index_a_list_and_a_mask(simulatedClock, useNumpy):
+    oTimerArray = pyghelpers.TimerArray(5, 1.0, useNumpy=useNumpy)
+    oTimerArray.start(0)
+    oTimerArray.start([1, 2])
+    oTimerArray.start([False, False, False, True, False], newDurationSeconds=3.0)
+    assert [oTimerArray.isRunning(index) for index in range(5)] == [True, True, True, True, False]
+    simulatedClock.advance(1)
+    assert oTimerArray.updateAll() == [0, 1, 2]
+    simulatedClock.advance(2)
+    assert oTimerArray.updateAll() == [3]
+
+
+@needsNumpy
+def test_start_with_numpy_values(simulatedClock, useNumpy):
+    oTimerArray = pyghelpers.TimerArray(4, 1.0, useNumpy=useNumpy)
+    oTimerArray.start(numpy.int64(1))
+    oTimerArray.start(numpy.array([2], dtype=numpy.int64))
+    oTimerArray.start(numpy.array([False, False, False, True]))
+    assert [oTimerArray.isRunning(numpy.int64(index)) for index in range(4)] == [False, True, True, True]
+    simulatedClock.advance(1)
+    assert oTimerArray.updateAll() == [1, 2, 3]
+
+
+def test_empty_selections_do_nothing(simulatedClock, useNumpy):
+    oTimerArray = pyghelpers.TimerArray(3, 1.0, useNumpy=useNumpy)
+    oTimerArray.start([])
+    oTimerArray.start(oTimerArray.updateAll())  # the usual "restart the ones that expired" with none expired
+    oTimerArray.pause([])
+    oTimerArray.resume([])
+    oTimerArray.stop([])
+    assert not any(oTimerArray.isRunning(index) for index in range(3))
+
+    oTimerArray.start()
+    simulatedClock.advance(1)
+    oTimerArray.start(oTimerArray.updateAll())
+    assert all(oTimerArray.isRunning(index) for index in range(3))
+
+
+def test_pause_and_resume_keep_the_remaining_time(simulatedClock, useNumpy):
+    oTimerArray = pyghelpers.TimerArray(2, 2.0, useNumpy=useNumpy)
+    oTimerArray.start()
+    simulatedClock.advance(0.5)
+    oTimerArray.pause(0)
+    assert oTimerArray.isPaused(0)
+    simulatedClock.advance(10)
+    assert oTimerArray.updateAll() == [1]
+    assert oTimerArray.getTime(0) == 1.5
+    oTimerArray.resume()
+    assert oTimerArray.isRunning(0)
+    assert not oTimerArray.isRunning(1)  # resume only restarts paused timers
+    simulatedClock.advance(1.5)
+    assert oTimerArray.updateAll() == [0]
+
+
+def test_stop_saves_the_remaining_time(simulatedClock, useNumpy):
+    oTimerArray = pyghelpers.TimerArray(2, 2.0, useNumpy=useNumpy)
+    oTimerArray.start()
+    simulatedClock.advance(0.75)
+    oTimerArray.stop([0])
+    simulatedClock.advance(5)
+    assert oTimerArray.getTime(0) == 1.25
+    assert oTimerArray.updateAll() == [1]
+
+
+def test_state_queries_return_plain_bools(useNumpy):
+    oTimerArray = pyghelpers.TimerArray(2, 1.0, useNumpy=useNumpy)
+    oTimerArray.start(0)
+    assert type(oTimerArray.isRunning(0)) is bool
+    assert type(oTimerArray.isPaused(0)) is bool
+    assert type(oTimerArray.getTime(1)) is float
+
+
+def test_wrong_number_of_durations_raises(useNumpy):
+    with pytest.raises(ValueError):
+        pyghelpers.TimerArray(3, [1.0, 2.0], useNumpy=useNumpy)
@@ -0,0 +1,71 @@
+# Tests of the HH:MM:SS text of CountUpTimer and CountDownTimer, hasDisplayChanged, and getTimeSurface
+
+import pyghelpers
+
+
+def test_time_in_hhmmss_formats():
+    assert pyghelpers.pyghelpers._formatHHMMSS(5, 0, False) == '5'
+    assert pyghelpers.pyghelpers._formatHHMMSS(65, 0, False) == '1:05'
+    assert pyghelpers.pyghelpers._formatHHMMSS(3725, 0, False) == '1:02:05'
+    assert pyghelpers.pyghelpers._formatHHMMSS(65, 0, True) == '00:01:05'
+    assert pyghelpers.pyghelpers._formatHHMMSS(65250, 3, False) == '1:05.250'
+
+
+def test_count_up_timer_text(simulatedClock):
+    oTimer = pyghelpers.CountUpTimer()
+    oTimer.start()
+    simulatedClock.advance(61.25)
+    assert oTimer.getTimeInHHMMSS() == '1:01'
+    assert oTimer.getTimeInHHMMSS(2) == '1:01.25'
+    assert oTimer.getTimeInHHMMSS(forceFullHHMMSS=True) == '00:01:01'
+
+
+def test_count_down_timer_text(simulatedClock):
+    oTimer = pyghelpers.CountDownTimer(90)
+    oTimer.start()
+    simulatedClock.advance(29.5)
+    assert oTimer.getTimeInHHMMSS(1) == '1:00.5'
+    simulatedClock.advance(100)
+    assert oTimer.getTimeInHHMMSS() == '0'
+
+
+def test_has_display_changed_only_when_the_digits_change(simulatedClock):
+    oTimer = pyghelpers.CountUpTimer()
+    oTimer.start()
+    assert oTimer.hasDisplayChanged()  # never read
+    oTimer.getTimeInHHMMSS()
+    assert not oTimer.hasDisplayChanged()
+    simulatedClock.advance(0.3)
+    assert not oTimer.hasDisplayChanged()  # still shows 0
+    assert oTimer.hasDisplayChanged(1)  # each format is checked on its own
+    simulatedClock.advance(0.3)
+    assert oTimer.hasDisplayChanged()  # rounds to 1
+    assert oTimer.getTimeInHHMMSS() == '1'
+    assert not oTimer.hasDisplayChanged()
+
+
+def test_text_is_not_formatted_again_when_the_digits_are_the_same(simulatedClock):
+    oTimer = pyghelpers.CountDownTimer(10)
+    oTimer.start()
+    firstText = oTimer.getTimeInHHMMSS()
+    simulatedClock.advance(0.1)
+    assert oTimer.getTimeInHHMMSS() is firstText
+
+
+def test_time_surface_is_only_drawn_again_when_the_text_changes(window, simulatedClock):
+    oGlyphCache = pyghelpers.GlyphCache(fontSize=20)
+    oTimer = pyghelpers.CountUpTimer()
+    oTimer.start()
+    oSurface = oTimer.getTimeSurface(oGlyphCache)
+    simulatedClock.advance(0.2)
+    assert oTimer.getTimeSurface(oGlyphCache) is oSurface
+
+    simulatedClock.advance(10)
+    oLongerSurface = oTimer.getTimeSurface(oGlyphCache)
+    assert oLongerSurface is not oSurface
+    assert oLongerSurface.get_width() > oSurface.get_width()
+
+    oOtherGlyphCache = pyghelpers.GlyphCache(fontSize=40)
+    oBiggerSurface = oTimer.getTimeSurface(oOtherGlyphCache)
+    assert oBiggerSurface is not oLongerSurface
+    assert oBiggerSurface.get_height() > oLongerSurface.get_height()
@@ -0,0 +1,129 @@
+# Tests of TimerMgr, the heap that checks many Timer and CountDownTimer objects at once
+
+import pyghelpers
+
+
+def test_timers_finish_in_order_of_their_finish_times(simulatedClock):
+    oTimerMgr = pyghelpers.TimerMgr()
+    finishedList = []
+    for nickname, seconds in [('c', 3), ('a', 1), ('b', 2)]:
+        oTimer = pyghelpers.Timer(seconds, nickname=nickname, callBack=finishedList.append, oTimerMgr=oTimerMgr)
+        oTimer.start()
+    assert oTimerMgr.getNTimers() == 3
+
+    simulatedClock.advance(1.5)
+    assert oTimerMgr.update() == 1
+    assert finishedList == ['a']
+
+    simulatedClock.advance(5)
+    assert oTimerMgr.update() == 2
+    assert finishedList == ['a', 'b', 'c']
+    assert oTimerMgr.getNTimers() == 0
+
+
+def test_timer_update_reports_a_finish_found_by_the_timer_mgr_once(simulatedClock):
+    oTimerMgr = pyghelpers.TimerMgr()
+    oTimer = pyghelpers.Timer(1, oTimerMgr=oTimerMgr)
+    oTimer.start()
+    assert oTimer.update() is False
+    simulatedClock.advance(1)
+    oTimerMgr.update()
+    assert oTimer.update() is True
+    assert oTimer.update() is False
+
+
+def test_count_down_timer_calls_back_through_the_timer_mgr(simulatedClock):
+    oTimerMgr = pyghelpers.TimerMgr()
+    finishedList = []
+    oCountDownTimer = pyghelpers.CountDownTimer(10, nickname='countdown', callBack=finishedList.append,
+                                                oTimerMgr=oTimerMgr)
+    oCountDownTimer.start()
+    simulatedClock.advance(9.9)
+    oTimerMgr.update()
+    assert finishedList == []
+    simulatedClock.advance(0.1)
+    oTimerMgr.update()
+    assert finishedList == ['countdown']
+
+
+def test_stopped_paused_and_restarted_timers_are_skipped(simulatedClock):
+    oTimerMgr = pyghelpers.TimerMgr()
+    finishedList = []
+    oStopped = pyghelpers.Timer(1, nickname='stopped', callBack=finishedList.append, oTimerMgr=oTimerMgr)
+    oPaused = pyghelpers.Timer(1, nickname='paused', callBack=finishedList.append, oTimerMgr=oTimerMgr)
+    oRestarted = pyghelpers.Timer(1, nickname='restarted', callBack=finishedList.append, oTimerMgr=oTimerMgr)
+    for oTimer in [oStopped, oPaused, oRestarted]:
+        oTimer.start()
+    oStopped.stop()
+    oPaused.pause()
+    simulatedClock.advance(0.5)
+    oRestarted.start()  # now finishes at 1.5
+    assert oTimerMgr.getNTimers() == 1
+
+    simulatedClock.advance(0.75)
+    oTimerMgr.update()
+    assert finishedList == []
+
+    oPaused.resume()  # was paused with 1 second left, so finishes at 2.25
+    simulatedClock.advance(0.25)
+    oTimerMgr.update()
+    assert finishedList == ['restarted']
+    simulatedClock.advance(1)
+    oTimerMgr.update()
+    assert finishedList == ['restarted', 'paused']
+
+
+def test_heaps_are_rebuilt_when_most_entries_are_stale(simulatedClock):
+    oTimerMgr = pyghelpers.TimerMgr()
+    timersList = [pyghelpers.Timer(n + 1, oTimerMgr=oTimerMgr) for n in range(10)]
+    for oTimer in timersList:
+        oTimer.start()
+    for oTimer in timersList[:6]:
+        oTimer.stop()
+    heapList = oTimerMgr.heapsDict[None]
+    assert len(heapList) == 4  # the stale entries were dropped
+    assert oTimerMgr.nStaleEntries == 0
+    assert oTimerMgr.getNTimers() == 4
+
+
+def test_callback_that_stops_timers_during_update(simulatedClock):
+    # The callBack stops enough timers to rebuild the heap while update() is popping from it
+    oTimerMgr = pyghelpers.TimerMgr()
+    finishedList = []
+    laterTimersList = []
+
+    def stopTheOthers(nickname):
+        finishedList.append(nickname)
+        if nickname == 'first':
+            for oTimer in laterTimersList[1:]:
+                oTimer.stop()
+
+    oFirst = pyghelpers.Timer(1, nickname='first', callBack=stopTheOthers, oTimerMgr=oTimerMgr)
+    oFirst.start()
+    for n in range(8):
+        oTimer = pyghelpers.Timer(1.5, nickname='later' + str(n), callBack=stopTheOthers, oTimerMgr=oTimerMgr)
+        oTimer.start()
+        laterTimersList.append(oTimer)
+
+    simulatedClock.advance(2)
+    assert oTimerMgr.update() == 2
+    assert finishedList == ['first', 'later0']
+    assert oTimerMgr.getNTimers() == 0
+    assert oTimerMgr.heapsDict[None] == []
+
+
+def test_callback_can_restart_its_own_timer(simulatedClock):
+    oTimerMgr = pyghelpers.TimerMgr()
+    finishedList = []
+
+    def restart(nickname):
+        finishedList.append(nickname)
+        oTimer.start()
+
+    oTimer = pyghelpers.Timer(1, nickname='again', callBack=restart, oTimerMgr=oTimerMgr)
+    oTimer.start()
+    for n in range(3):
+        simulatedClock.advance(1)
+        assert oTimerMgr.update() == 1
+    assert finishedList == ['again'] * 3
+    assert oTimerMgr.getNTimers() == 1
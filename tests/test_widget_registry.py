@@ -0,0 +1,141 @@
+# Tests of the widgets added to a scene with addWidget, and drawn by drawWidgets only when they change
+
+import pygame
+import pygwidgets
+import pytest
+
+import pyghelpers
+
+
+def countDraws(oWidget, drawsList):
+    """Makes the widget add its nickname to drawsList every time it is drawn"""
+    originalDraw = oWidget.draw
+
+    def draw():
+        drawsList.append(oWidget.nickname)
+        originalDraw()
+    oWidget.draw = draw
+
+
+class WidgetScene(pyghelpers.Scene):
+    def __init__(self, window, changesDict=None):
+        self.window = window
+        self.changesDict = changesDict or {}  # frame number: function called in that frame's update
+        self.frameNumber = 0
+        self.drawsList = []
+        self.oBackground = pygwidgets.DisplayText(window, (0, 0), '', width=640, height=480,
+                                                  backgroundColor=(0, 0, 0), nickname='background')
+        self.oScore = pygwidgets.DisplayText(window, (10, 10), 'Score: 0', nickname='score')
+        self.oLives = pygwidgets.DisplayText(window, (300, 10), 'Lives: 3', nickname='lives')
+        self.addWidget(self.oScore, zOrder=1)
+        self.addWidget(self.oBackground)  # lower zOrder, drawn first
+        self.addWidget(self.oLives, zOrder=1)
+        for oWidget in [self.oBackground, self.oScore, self.oLives]:
+            countDraws(oWidget, self.drawsList)
+        self.resultsList = []
+
+    def handleInputs(self, eventsList, keyPressedList):
+        pass
+
+    def update(self, dt=None):
+        changeFunction = self.changesDict.get(self.frameNumber)
+        if changeFunction is not None:
+            changeFunction(self)
+        self.frameNumber = self.frameNumber + 1
+
+    def draw(self, alpha=None):
+        self.drawsList.append('frame')
+        result = self.drawWidgets()
+        self.resultsList.append(result)
+        return result
+
+
+def splitFrames(drawsList):
+    """Returns a list of the widgets drawn in each frame"""
+    framesList = []
+    for nickname in drawsList:
+        if nickname == 'frame':
+            framesList.append([])
+        else:
+            framesList[-1].append(nickname)
+    return framesList
+
+
+def test_all_widgets_are_drawn_in_the_first_frame_then_only_changes(window):
+    oScene = WidgetScene(window, {2: lambda oScene: oScene.oScore.setValue('Score: 10')})
+    oSceneMgr = pyghelpers.SceneMgr({'widgets': oScene}, 30, useDirtyRects=True)
+    oSceneMgr.run(maxFrames=4, throttle=False)
+    framesList = splitFrames(oScene.drawsList)
+    assert framesList[0] == ['background', 'score', 'lives']  # in zOrder, then in the order added
+    assert framesList[1] == []
+    assert framesList[2] == ['background', 'score']  # lives does not overlap the changed area
+    assert framesList[3] == []
+    assert oScene.resultsList[0] is None
+    assert oScene.resultsList[1] == []
+    assert len(oScene.resultsList[2]) == 1
+    assert oScene.resultsList[2][0].contains(oScene.oScore.getRect())
+
+
+def test_moved_widget_redraws_where_it_was_and_where_it_is(window):
+    oScene = WidgetScene(window, {1: lambda oScene: oScene.oLives.setLoc((300, 300))})
+    oSceneMgr = pyghelpers.SceneMgr({'widgets': oScene}, 30)
+    oSceneMgr.run(maxFrames=2, throttle=False)
+    changedRectsList = oScene.resultsList[1]
+    assert len(changedRectsList) == 2
+    assert changedRectsList[0].topleft == (300, 10)
+    assert changedRectsList[1].topleft == (300, 300)
+
+
+def test_removed_widget_area_is_drawn_over(window):
+    oScene = WidgetScene(window, {1: lambda oScene: oScene.removeWidget(oScene.oLives)})
+    oSceneMgr = pyghelpers.SceneMgr({'widgets': oScene}, 30)
+    oSceneMgr.run(maxFrames=3, throttle=False)
+    framesList = splitFrames(oScene.drawsList)
+    assert framesList[1] == ['background']
+    assert framesList[2] == []
+    assert oScene.resultsList[1][0].topleft == (300, 10)
+
+
+def test_removing_a_widget_that_was_not_added_raises(window):
+    oScene = WidgetScene(window)
+    pyghelpers.SceneMgr({'widgets': oScene}, 30)
+    oScene.removeWidget(oScene.oLives)
+    with pytest.raises(ValueError):
+        oScene.removeWidget(oScene.oLives)
+
+
+def test_always_redraw_widgets_are_drawn_in_every_frame(window):
+    oScene = WidgetScene(window)
+    oAnimation = pygwidgets.DisplayText(window, (10, 300), 'moving', nickname='animation')
+    oScene.addWidget(oAnimation, zOrder=2, alwaysRedraw=True)
+    countDraws(oAnimation, oScene.drawsList)
+    oSceneMgr = pyghelpers.SceneMgr({'widgets': oScene}, 30)
+    oSceneMgr.run(maxFrames=3, throttle=False)
+    framesList = splitFrames(oScene.drawsList)
+    assert framesList[1] == ['background', 'animation']
+    assert framesList[2] == ['background', 'animation']
+
+
+def test_input_text_is_always_redrawn_so_its_cursor_blinks(window):
+    oScene = WidgetScene(window)
+    oInputText = pygwidgets.InputText(window, (10, 200), 'name', initialFocus=True, nickname='input')
+    oScene.addWidget(oInputText, zOrder=2)
+    countDraws(oInputText, oScene.drawsList)
+    oSceneMgr = pyghelpers.SceneMgr({'widgets': oScene}, 30)
+    oSceneMgr.run(maxFrames=3, throttle=False)
+    framesList = splitFrames(oScene.drawsList)
+    assert framesList[1] == ['background', 'input']
+    assert framesList[2] == ['background', 'input']
+
+
+def test_background_color_fills_the_changed_areas(window):
+    class FilledScene(WidgetScene):
+        def draw(self, alpha=None):
+            self.drawsList.append('frame')
+            self.resultsList.append(self.drawWidgets(backgroundColor=(255, 0, 0)))
+
+    oScene = FilledScene(window, {1: lambda oScene: oScene.oLives.hide()})
+    oScene.removeWidget(oScene.oBackground)
+    oSceneMgr = pyghelpers.SceneMgr({'widgets': oScene}, 30)
+    oSceneMgr.run(maxFrames=2, throttle=False)
+    assert window.get_at((305, 15)) == pygame.Color(255, 0, 0)